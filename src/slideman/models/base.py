@@ -0,0 +1,39 @@
+# src/slideman/models/base.py
+
+from typing import Any, Dict, Sequence, Tuple
+from pydantic import BaseModel
+
+# Field names per model class, in declaration order. model_fields is a
+# computed class property, too slow to look up once per row.
+_ROW_FIELDS: Dict[type, Tuple[str, ...]] = {}
+
+class RowModel(BaseModel):
+    """Base class for models that are loaded from database rows.
+
+    Rows read back from SQLite were validated when they were written and are
+    constrained by the schema, so from_row() builds instances without running
+    the field validators again.
+    """
+
+    @classmethod
+    def from_row(cls, row: Sequence[Any]) -> "RowModel":
+        """Build an instance from a database row, skipping validation.
+
+        Args:
+            row: One value per model field, in field declaration order.
+
+        Returns:
+            The populated model instance.
+        """
+        fields = _ROW_FIELDS.get(cls)
+        if fields is None:
+            fields = _ROW_FIELDS[cls] = tuple(cls.model_fields)
+        # Same state model_construct() sets up, minus its per-field default
+        # handling, which a full row never needs
+        instance = object.__new__(cls)
+        values = dict(zip(fields, row))
+        object.__setattr__(instance, '__dict__', values)
+        object.__setattr__(instance, '__pydantic_fields_set__', set(values))
+        object.__setattr__(instance, '__pydantic_extra__', None)
+        object.__setattr__(instance, '__pydantic_private__', None)
+        return instance
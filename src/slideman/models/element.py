@@ -1,9 +1,11 @@
 # src/slideman/models/element.py
 
 from typing import Optional, Any
-from pydantic import BaseModel, field_validator
+from pydantic import field_validator
 
-class Element(BaseModel):
+from .base import RowModel
+
+class Element(RowModel):
     """Represents a tagged element (shape, image, etc.) on a slide.
     
     Attributes:
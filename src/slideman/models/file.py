@@ -1,10 +1,12 @@
 # src/slideman/models/file.py
 from typing import Optional, Literal, Union, Any
-from pydantic import BaseModel, field_validator
+from pydantic import field_validator
+
+from .base import RowModel
 
 FileStatus = Literal['Pending', 'In Progress', 'Completed', 'Failed']
 
-class File(BaseModel):
+class File(RowModel):
     """Represents a single source PowerPoint file within a project.
     
     Attributes:
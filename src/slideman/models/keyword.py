@@ -1,12 +1,14 @@
 # src/slideman/models/keyword.py
 
 from typing import Literal, Optional, Any
-from pydantic import BaseModel, field_validator
+from pydantic import field_validator
+
+from .base import RowModel
 
 # Define the allowed keyword kinds using Literal for type safety
 KeywordKind = Literal["topic", "title", "name"]
 
-class Keyword(BaseModel):
+class Keyword(RowModel):
     """Represents a single keyword entry in the canonical list.
     
     Attributes:
@@ -1,10 +1,12 @@
 # src/slideman/models/project.py
 
 from typing import Optional, Union, Any
-from pydantic import BaseModel, field_validator
+from pydantic import field_validator
 
+from .base import RowModel
 
-class Project(BaseModel):
+
+class Project(RowModel):
     """Represents a single project within the application.
     
     Attributes:
@@ -1,8 +1,10 @@
 # src/slideman/models/slide.py
 from typing import Optional, Any
-from pydantic import BaseModel, field_validator, computed_field
+from pydantic import field_validator, computed_field
 
-class Slide(BaseModel):
+from .base import RowModel
+
+class Slide(RowModel):
     """Represents a single slide within a source file.
     
     Attributes:
@@ -193,18 +193,16 @@ class ProjectsPresenter(BasePresenter):
             # Create project folder path
             project_folder_path = file_io.get_project_folder(project_name)
             
-            # Add project to database
-            project_id = db.add_project(project_name, str(project_folder_path))
-            if not project_id:
-                raise DatabaseError("Failed to create project in database")
-                
-            # Add files to database
-            file_ids = []
-            for rel_path, checksum in copied_files_info.items():
-                filename = Path(rel_path).name
-                file_id = db.add_file(project_id, filename, rel_path, checksum)
-                if file_id:
-                    file_ids.append(file_id)
+            # Add project and its files to database in one transaction
+            with db.write_batch():
+                project_id = db.add_project(project_name, str(project_folder_path))
+                if not project_id:
+                    raise DatabaseError("Failed to create project in database")
+                    
+                file_ids = db.add_files_bulk([
+                    (project_id, Path(rel_path).name, rel_path, checksum)
+                    for rel_path, checksum in copied_files_info.items()
+                ])
                     
             self.logger.info(f"Project '{project_name}' created with {len(file_ids)} files")
             
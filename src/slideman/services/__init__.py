@@ -5,6 +5,8 @@ This package contains all business logic services including database operations,
 file I/O, PowerPoint operations, and background tasks.
 """
 
+import importlib
+
 # Export custom exceptions
 from .exceptions import (
     SlidemanException,
@@ -26,23 +28,62 @@ from .exceptions import (
     ThreadSafetyError,
 )
 
-# Export main services
-from .database import Database
-from .database_worker import DatabaseWorker
-from .slide_converter import SlideConverter
-from .export_service import ExportWorker
-from .file_io import check_disk_space, calculate_checksum, copy_files_to_project
-# Avoid circular import
-# from .thumbnail_cache import ThumbnailCache
-from .background_tasks import WorkerSignals, FileCopyWorker
-from .keyword_tasks import FindSimilarKeywordsWorker, FindSimilarKeywordsSignals
-from .service_registry import service_registry, ServiceRegistry
-from .interfaces import (
-    IDatabaseService, IProjectService, IFileService, ISlideService,
-    IElementService, IKeywordService, ISlideKeywordService,
-    IElementKeywordService, IFileIOService, IThumbnailCacheService,
-    IExportService, ISlideConverterService
-)
+# The global registry shares its name with its submodule, so it is bound
+# eagerly; a lazy attribute would be shadowed once the submodule is imported
+from .service_registry import ServiceRegistry, service_registry
+
+# Other services and interfaces are imported on first access (PEP 562)
+_LAZY_IMPORTS = {
+    # Services
+    "Database": (".database", "Database"),
+    "DatabaseWorker": (".database_worker", "DatabaseWorker"),
+    "get_thread_db": (".database_worker", "get_thread_db"),
+    "SlideConverter": (".slide_converter", "SlideConverter"),
+    "ExportWorker": (".export_service", "ExportWorker"),
+    "check_disk_space": (".file_io", "check_disk_space"),
+    "calculate_checksum": (".file_io", "calculate_checksum"),
+    "copy_and_hash": (".file_io", "copy_and_hash"),
+    "hardlink_file": (".file_io", "hardlink_file"),
+    "can_hardlink": (".file_io", "can_hardlink"),
+    "volume_id": (".file_io", "volume_id"),
+    "is_rotational": (".file_io", "is_rotational"),
+    "io_worker_count": (".file_io", "io_worker_count"),
+    "copy_files_to_project": (".file_io", "copy_files_to_project"),
+    # Avoid circular import
+    # "ThumbnailCache": (".thumbnail_cache", "ThumbnailCache"),
+    "WorkerSignals": (".background_tasks", "WorkerSignals"),
+    "FileCopyWorker": (".background_tasks", "FileCopyWorker"),
+    "FindSimilarKeywordsWorker": (".keyword_tasks", "FindSimilarKeywordsWorker"),
+    "FindSimilarKeywordsSignals": (".keyword_tasks", "FindSimilarKeywordsSignals"),
+    # Interfaces
+    "IDatabaseService": (".interfaces", "IDatabaseService"),
+    "IProjectService": (".interfaces", "IProjectService"),
+    "IFileService": (".interfaces", "IFileService"),
+    "ISlideService": (".interfaces", "ISlideService"),
+    "IElementService": (".interfaces", "IElementService"),
+    "IKeywordService": (".interfaces", "IKeywordService"),
+    "ISlideKeywordService": (".interfaces", "ISlideKeywordService"),
+    "IElementKeywordService": (".interfaces", "IElementKeywordService"),
+    "IFileIOService": (".interfaces", "IFileIOService"),
+    "IThumbnailCacheService": (".interfaces", "IThumbnailCacheService"),
+    "IExportService": (".interfaces", "IExportService"),
+    "ISlideConverterService": (".interfaces", "ISlideConverterService"),
+}
+
+
+def __getattr__(name: str):
+    """Import a lazily exported service on first access and cache it."""
+    try:
+        module_name, attr = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name, __name__), attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
 
 __all__ = [
     # Exceptions
@@ -66,10 +107,17 @@ __all__ = [
     # Services
     "Database",
     "DatabaseWorker",
+    "get_thread_db",
     "SlideConverter",
     "ExportWorker",
     "check_disk_space",
     "calculate_checksum",
+    "copy_and_hash",
+    "hardlink_file",
+    "can_hardlink",
+    "volume_id",
+    "is_rotational",
+    "io_worker_count",
     "copy_files_to_project",
     # "ThumbnailCache", # Commented out to avoid circular import
     "WorkerSignals",
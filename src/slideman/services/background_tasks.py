@@ -1,7 +1,7 @@
 # src/slideman/services/background_tasks.py
 
 import logging
-import shutil
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import List, Dict, Optional
 
@@ -12,13 +12,26 @@ from . import file_io
 
 logger = logging.getLogger(__name__)
 
+
+class _LazyWorkerId:
+    """Log-context label that is only built when a log record is formatted."""
+    __slots__ = ("_prefix", "_paths")
+
+    def __init__(self, prefix: str, paths: List[Path]):
+        self._prefix = prefix
+        self._paths = paths
+
+    def __str__(self) -> str:
+        return f"{self._prefix}:{[p.name for p in self._paths]}"
+
+
 class WorkerSignals(QObject):
     """
     Defines signals available from a running worker thread.
     Supported signals are:
     finished: Dict[str, Optional[str]] - Emitted on success, payload is copied_files_info
     error: str - Emitted on failure with error message
-    progress: int - Emitted periodically with percentage (0-100) complete
+    progress: int - Emitted periodically with percentage (0-100) of bytes processed
     """
     finished = Signal(dict) # Dict[rel_path_str, checksum_or_None]
     error = Signal(str)
@@ -46,114 +59,177 @@ class FileCopyWorker(QRunnable):
 
         self.is_cancelled = False # Flag for cancellation (optional)
 
+        # Concurrent copies: 1 for spinning disks (avoids seek thrashing), more for SSDs
+        self._io_workers = file_io.io_worker_count(project_folder)
+
         # Replace the entire run method in src/slideman/services/background_tasks.py
     @Slot()
     def run(self):
         """The main work executed in the background thread."""
-        worker_file_id_str = f"FileCopyWorker FIDs:{[p.name for p in self.source_paths]}" # For logging context
-        logger.info(f"[{worker_file_id_str}] Starting copy for {len(self.source_paths)} files to '{self.project_folder}'")
+        worker_file_id_str = _LazyWorkerId("FileCopyWorker FIDs", self.source_paths) # For logging context
+        logger.info("[%s] Starting copy for %s files to '%s'", worker_file_id_str, len(self.source_paths), self.project_folder)
 
         # Initialize results/status
         copied_files_info: Dict[str, Optional[str]] = {}
         files_processed = 0
+        bytes_processed = 0
         total_files = 0
         encountered_error_in_loop = False
         error_message = "" # Keep track of first significant error
 
         try:
             # --- Disk Space Check & Prep ---
-            logger.debug(f"[{worker_file_id_str}] Performing pre-checks...")
+            logger.debug("[%s] Performing pre-checks...", worker_file_id_str)
             total_size = 0
+            copy_size = 0
             valid_source_paths = []
+            dest_names = set()
+            # Files already on the project's volume are hardlinked, not copied
+            dest_volume = file_io.volume_id(self.project_folder)
             for p in self.source_paths:
-                if p.is_file():
+                if p.name in dest_names:
+                    # Concurrent copies must never target the same destination file
+                    logger.warning("[%s] Skipping source with duplicate file name: %s", worker_file_id_str, p)
+                elif p.is_file():
                     try:
-                        total_size += p.stat().st_size
-                        valid_source_paths.append(p)
+                        st = p.stat()
+                        size = st.st_size
+                        can_link = dest_volume is not None and st.st_dev == dest_volume
+                        total_size += size
+                        if not can_link:
+                            copy_size += size
+                        valid_source_paths.append((p, size, can_link))
+                        dest_names.add(p.name)
                     except OSError as stat_e:
-                        logger.warning(f"[{worker_file_id_str}] Could not stat file, skipping: {p}. Error: {stat_e}")
+                        logger.warning("[%s] Could not stat file, skipping: %s. Error: %s", worker_file_id_str, p, stat_e)
                 else:
-                     logger.warning(f"[{worker_file_id_str}] Skipping non-file source: {p}")
+                     logger.warning("[%s] Skipping non-file source: %s", worker_file_id_str, p)
 
             if not valid_source_paths:
                  raise ValueError("No valid source files found to copy.")
 
             total_files = len(valid_source_paths)
-            logger.debug(f"[{worker_file_id_str}] Found {total_files} valid files, total size {total_size} bytes.")
 
-            # Check disk space (add ~10% margin)
-            required_space = int(total_size * 1.1) if total_size > 0 else 0
+            # Ensure Destination Folder Exists
+            self.project_folder.mkdir(parents=True, exist_ok=True)
+            logger.debug("[%s] Output directory ensured: %s", worker_file_id_str, self.project_folder)
+
+            # Same volume doesn't guarantee hardlinks (exFAT/FAT, permissions);
+            # if a test link fails, every file is copied and counted below
+            link_probe = next((p for p, _, can_link in valid_source_paths if can_link), None)
+            if link_probe is not None and not file_io.can_hardlink(link_probe, self.project_folder):
+                logger.info("[%s] Hardlinks not available in '%s', copying all files.", worker_file_id_str, self.project_folder)
+                valid_source_paths = [(p, size, False) for p, size, _ in valid_source_paths]
+                copy_size = total_size
+            logger.debug("[%s] Found %s valid files, total size %s bytes (%s bytes to copy).", worker_file_id_str, total_files, total_size, copy_size)
+
+            # Check disk space for the files that need a real copy (add ~10% margin)
+            required_space = int(copy_size * 1.1) if copy_size > 0 else 0
             has_space, free_space = file_io.check_disk_space(self.project_folder, required_space)
             if not has_space:
                  raise OSError(f"Insufficient disk space. Required: ~{required_space} bytes, Available: {free_space} bytes.")
-
-            # Ensure Destination Folder Exists
-            self.project_folder.mkdir(parents=True, exist_ok=True)
-            logger.debug(f"[{worker_file_id_str}] Output directory ensured: {self.project_folder}")
             # ----------------------------
 
             # --- Copy Loop ---
-            logger.debug(f"[{worker_file_id_str}] Starting copy loop...")
-            for src_path in valid_source_paths:
-                if self.is_cancelled:
-                    logger.info(f"[{worker_file_id_str}] File copy cancelled by request during loop.")
-                    error_message = "File copy operation was cancelled."
-                    break # Exit loop
-
-                relative_path_str = src_path.name # Simple copy to root
-                dest_path = self.project_folder / relative_path_str
-                logger.debug(f"[{worker_file_id_str}] Worker copying '{src_path.name}'")
-                try:
-                    shutil.copy2(src_path, dest_path)
-                    checksum = file_io.calculate_checksum(dest_path)
-                    copied_files_info[relative_path_str] = checksum
-                except Exception as copy_err:
-                     logger.error(f"[{worker_file_id_str}] Worker failed to copy file '{src_path.name}': {copy_err}", exc_info=True)
-                     encountered_error_in_loop = True # Flag that at least one file failed
-                     if not error_message: # Store first error message
-                         error_message = f"Failed to copy {src_path.name}: {copy_err}"
-
-                files_processed += 1
-                progress_percent = int((files_processed / total_files) * 100) if total_files > 0 else 0
-                self.signals.progress.emit(progress_percent)
+            logger.debug("[%s] Starting copy loop with %s I/O workers...", worker_file_id_str, self._io_workers)
+            with ThreadPoolExecutor(max_workers=self._io_workers) as pool:
+                futures = {
+                    pool.submit(self._copy_file, src_path, src_size, can_link): (src_path, src_size)
+                    for src_path, src_size, can_link in valid_source_paths
+                }
+                for future in as_completed(futures):
+                    src_path, src_size = futures[future]
+                    relative_path_str = src_path.name # Simple copy to root
+                    try:
+                        copied_files_info[relative_path_str] = future.result()
+                    except Exception as copy_err:
+                         logger.error("[%s] Worker failed to copy file '%s': %s", worker_file_id_str, src_path.name, copy_err, exc_info=True)
+                         encountered_error_in_loop = True # Flag that at least one file failed
+                         if not error_message: # Store first error message
+                             error_message = f"Failed to copy {src_path.name}: {copy_err}"
+
+                    # Progress by bytes so large decks weigh more than small ones
+                    files_processed += 1
+                    bytes_processed += src_size
+                    if total_size > 0:
+                        progress_percent = int(bytes_processed * 100 / total_size)
+                    else:
+                        progress_percent = int((files_processed / total_files) * 100) if total_files > 0 else 0
+                    self.signals.progress.emit(progress_percent)
+
+                    if self.is_cancelled:
+                        logger.info("[%s] File copy cancelled by request during loop.", worker_file_id_str)
+                        error_message = "File copy operation was cancelled."
+                        # Drop queued copies; ones already running finish on exit
+                        pool.shutdown(wait=False, cancel_futures=True)
+                        break # Exit loop
             # --- End of Copy Loop ---
-            logger.debug(f"[{worker_file_id_str}] Copy loop finished.")
+            logger.debug("[%s] Copy loop finished.", worker_file_id_str)
 
 
             # --- Emit Final Signal based on outcome ---
             if self.is_cancelled:
                  # Error message already set above
-                 logger.warning(f"[{worker_file_id_str}] Emitting ERROR signal (Cancelled): {error_message}")
+                 logger.warning("[%s] Emitting ERROR signal (Cancelled): %s", worker_file_id_str, error_message)
                  self.signals.error.emit(error_message)
             elif encountered_error_in_loop:
                  # Error message already set above (first error encountered)
                  final_msg = f"Finished with errors. Copied: {len(copied_files_info)}/{total_files}. First error: {error_message}"
-                 logger.error(f"[{worker_file_id_str}] Emitting ERROR signal (Loop errors): {final_msg}")
+                 logger.error("[%s] Emitting ERROR signal (Loop errors): %s", worker_file_id_str, final_msg)
                  # We could emit finished with the partial dict, but emitting error might be clearer
                  self.signals.error.emit(final_msg)
             elif not copied_files_info and total_files > 0:
                  # Catch case where loop ran but nothing got copied (maybe all failed silently?)
                  error_message = "File copy finished, but no files seem to have been copied successfully."
-                 logger.error(f"[{worker_file_id_str}] Emitting ERROR signal (No files copied): {error_message}")
+                 logger.error("[%s] Emitting ERROR signal (No files copied): %s", worker_file_id_str, error_message)
                  self.signals.error.emit(error_message)
             else:
                  # Success case
                  success_message = f"Finished copying files. Successfully copied: {len(copied_files_info)}/{total_files}"
-                 logger.info(f"[{worker_file_id_str}] {success_message}")
-                 logger.debug(f"[{worker_file_id_str}] Emitting FINISHED signal with {len(copied_files_info)} items.")
+                 logger.info("[%s] %s", worker_file_id_str, success_message)
+                 logger.debug("[%s] Emitting FINISHED signal with %s items.", worker_file_id_str, len(copied_files_info))
                  self.signals.finished.emit(copied_files_info)
-                 logger.debug(f"[{worker_file_id_str}] FINISHED signal emitted.")
+                 logger.debug("[%s] FINISHED signal emitted.", worker_file_id_str)
             # ---------------------------------------------
 
         except Exception as e:
             # Catch major errors from setup (disk space, mkdir, initial checks)
-            logger.error(f"[{worker_file_id_str}] FileCopyWorker failed critically during setup: {e}", exc_info=True)
+            logger.error("[%s] FileCopyWorker failed critically during setup: %s", worker_file_id_str, e, exc_info=True)
             error_message = f"Failed to start file copy: {e}"
-            logger.debug(f"[{worker_file_id_str}] Emitting ERROR signal (Critical setup failure): {error_message}")
+            logger.debug("[%s] Emitting ERROR signal (Critical setup failure): %s", worker_file_id_str, error_message)
             self.signals.error.emit(error_message)
 
         # --- Final log message ---
-        logger.info(f"[{worker_file_id_str}] Worker execution finished.")
+        logger.info("[%s] Worker execution finished.", worker_file_id_str)
+
+    def _copy_file(self, src_path: Path, src_size: int, can_link: bool) -> Optional[str]:
+        """
+        Copies (or hardlinks) one source file into the project folder.
+
+        Runs on the copy pool, so it must not touch signals or shared state.
+
+        Args:
+            src_path: Path to the source file.
+            src_size: Size of the source in bytes from the pre-check.
+            can_link: Whether the source is on the project's volume.
+
+        Returns:
+            The SHA-256 checksum of the copied file (None if it couldn't be read).
+
+        Raises:
+            OSError: If the copy fails, or a file that was meant to be linked
+                doesn't fit in the space left.
+        """
+        dest_path = self.project_folder / src_path.name
+        logger.debug("Worker copying '%s'", src_path.name)
+        if can_link:
+            if file_io.hardlink_file(src_path, dest_path):
+                return file_io.calculate_checksum(dest_path)
+            # This file's size wasn't part of the up-front space check
+            has_space, free_space = file_io.check_disk_space(self.project_folder, src_size)
+            if not has_space:
+                raise OSError(f"Insufficient disk space. Required: {src_size} bytes, Available: {free_space} bytes.")
+        return file_io.copy_and_hash(src_path, dest_path, src_size)
 
     def cancel(self):
          """Sets the cancellation flag."""
@@ -1,12 +1,16 @@
 # src/slideman/services/database.py
 
+import os
 import sqlite3
 import logging
 import threading
+import weakref
+from collections import OrderedDict
 from pathlib import Path
 from typing import Optional, List, Any, Tuple, Dict
 from queue import Queue, Empty, Full
-from contextlib import contextmanager
+from concurrent.futures import Future
+from contextlib import contextmanager, nullcontext
 import time
 
 # Import models to potentially use for return types later
@@ -26,12 +30,456 @@ from .exceptions import (
 )
 
 # Define the current schema version. Increment this when schema changes.
-DB_SCHEMA_VERSION = 3
+DB_SCHEMA_VERSION = 10
+
+# Maximum number of ids bound into a single "IN (...)" clause. Stays well under
+# SQLite's default SQLITE_MAX_VARIABLE_NUMBER (999 on older builds).
+IN_CLAUSE_CHUNK_SIZE = 900
+
+# Compiled statements kept per connection. sqlite3 keys its cache by SQL text
+# and defaults to 128, fewer than the distinct queries this service issues.
+STATEMENT_CACHE_SIZE = 256
+
+# Hot read queries, kept as module constants so every call hands sqlite3 the
+# same string and hits its statement cache.
+_SQL_PROJECT_FOLDER_FOR_SLIDE = "SELECT folder_path FROM slide_origins WHERE slide_id = ?"
+_SQL_SLIDES_FOR_KEYWORD = """
+    SELECT s.id, s.file_id, s.slide_index, s.title,
+           s.thumb_rel_path, s.image_rel_path
+    FROM slides s
+    JOIN slide_keywords sk ON s.id = sk.slide_id
+    WHERE sk.keyword_id = ?
+    ORDER BY s.file_id, s.slide_index
+"""
+_SQL_SLIDES_FOR_KEYWORD_IN_PROJECT = """
+    SELECT s.id, s.file_id, s.slide_index, s.title,
+           s.thumb_rel_path, s.image_rel_path
+    FROM slide_keywords sk
+    JOIN slides s ON s.id = sk.slide_id
+    JOIN files f ON f.id = s.file_id
+    WHERE sk.keyword_id = ? AND f.project_id = ?
+    ORDER BY s.file_id, s.slide_index
+"""
+
+# Keyword ids remembered by (keyword, kind). Ingest resolves the same few
+# keywords over and over, and ids only go away when a keyword is merged away.
+KEYWORD_ID_CACHE_SIZE = 1024
+
+# Outside Windows, joining folder_path and rel_path with "/" in SQL gives the
+# same string as str(Path(folder_path) / rel_path) without building a Path per
+# row. Windows keeps the pathlib join for its separator normalisation.
+_SQL_PATH_JOIN = os.name != "nt"
+_ORIGIN_PATH_SQL = (
+    "folder_path || CASE WHEN substr(folder_path, -1, 1) IN ('/', '\\') "
+    "THEN '' ELSE '/' END || rel_path"
+)
+
+# slide_origins denormalizes slides -> files -> projects so origin lookups are
+# a single primary-key read. The triggers keep it in step with its sources;
+# deleting a file or project cascades to slides, which fires slide_origins_ad.
+_SLIDE_ORIGINS_DDL = (
+    """
+    CREATE TABLE IF NOT EXISTS slide_origins (
+        slide_id    INTEGER PRIMARY KEY,
+        folder_path TEXT    NOT NULL,
+        rel_path    TEXT    NOT NULL,
+        slide_index INTEGER NOT NULL
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS slide_origins_ai AFTER INSERT ON slides BEGIN
+        INSERT OR REPLACE INTO slide_origins (slide_id, folder_path, rel_path, slide_index)
+        SELECT new.id, p.folder_path, f.rel_path, new.slide_index
+        FROM files f JOIN projects p ON f.project_id = p.id
+        WHERE f.id = new.file_id;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS slide_origins_au AFTER UPDATE OF file_id, slide_index ON slides BEGIN
+        INSERT OR REPLACE INTO slide_origins (slide_id, folder_path, rel_path, slide_index)
+        SELECT new.id, p.folder_path, f.rel_path, new.slide_index
+        FROM files f JOIN projects p ON f.project_id = p.id
+        WHERE f.id = new.file_id;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS slide_origins_ad AFTER DELETE ON slides BEGIN
+        DELETE FROM slide_origins WHERE slide_id = old.id;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS slide_origins_files_au AFTER UPDATE OF project_id, rel_path ON files BEGIN
+        UPDATE slide_origins
+        SET rel_path = new.rel_path,
+            folder_path = (SELECT folder_path FROM projects WHERE id = new.project_id)
+        WHERE slide_id IN (SELECT id FROM slides WHERE file_id = new.id);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS slide_origins_projects_au AFTER UPDATE OF folder_path ON projects BEGIN
+        UPDATE slide_origins
+        SET folder_path = new.folder_path
+        WHERE slide_id IN (
+            SELECT s.id FROM slides s JOIN files f ON s.file_id = f.id
+            WHERE f.project_id = new.id
+        );
+    END
+    """,
+)
+
+# keyword_projects records which projects use each keyword, so project-scoped
+# keyword queries are one primary-key probe instead of joins through both link
+# tables. Link inserts add rows; link deletes and updates drop a row once no
+# link in that project remains. Deleting a file or slide cascades to the link
+# tables, which fires these triggers; keyword and project deletes cascade here.
+_KEYWORD_PROJECTS_CLEANUP = """
+    DELETE FROM keyword_projects
+    WHERE keyword_id = old.keyword_id
+      AND NOT EXISTS (
+          SELECT 1 FROM slide_keywords sk
+          JOIN slides s ON sk.slide_id = s.id
+          JOIN files f ON s.file_id = f.id
+          WHERE sk.keyword_id = old.keyword_id AND f.project_id = keyword_projects.project_id
+      )
+      AND NOT EXISTS (
+          SELECT 1 FROM element_keywords ek
+          JOIN elements e ON ek.element_id = e.id
+          JOIN slides s ON e.slide_id = s.id
+          JOIN files f ON s.file_id = f.id
+          WHERE ek.keyword_id = old.keyword_id AND f.project_id = keyword_projects.project_id
+      );
+"""
+_KEYWORD_PROJECTS_FROM_SLIDE = """
+    INSERT OR IGNORE INTO keyword_projects (project_id, keyword_id)
+    SELECT f.project_id, new.keyword_id
+    FROM slides s JOIN files f ON s.file_id = f.id
+    WHERE s.id = new.slide_id;
+"""
+_KEYWORD_PROJECTS_FROM_ELEMENT = """
+    INSERT OR IGNORE INTO keyword_projects (project_id, keyword_id)
+    SELECT f.project_id, new.keyword_id
+    FROM elements e
+    JOIN slides s ON e.slide_id = s.id
+    JOIN files f ON s.file_id = f.id
+    WHERE e.id = new.element_id;
+"""
+_KEYWORD_PROJECTS_DDL = (
+    """
+    CREATE TABLE IF NOT EXISTS keyword_projects (
+        project_id INTEGER NOT NULL REFERENCES projects(id) ON DELETE CASCADE,
+        keyword_id INTEGER NOT NULL REFERENCES keywords(id) ON DELETE CASCADE,
+        PRIMARY KEY (project_id, keyword_id)
+    ) WITHOUT ROWID
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_keyword_projects_keyword_id ON keyword_projects(keyword_id)",
+    f"""
+    CREATE TRIGGER IF NOT EXISTS slide_keywords_kp_ai AFTER INSERT ON slide_keywords BEGIN
+        {_KEYWORD_PROJECTS_FROM_SLIDE}
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS slide_keywords_kp_au AFTER UPDATE ON slide_keywords BEGIN
+        {_KEYWORD_PROJECTS_FROM_SLIDE}
+        {_KEYWORD_PROJECTS_CLEANUP}
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS slide_keywords_kp_ad AFTER DELETE ON slide_keywords BEGIN
+        {_KEYWORD_PROJECTS_CLEANUP}
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS element_keywords_kp_ai AFTER INSERT ON element_keywords BEGIN
+        {_KEYWORD_PROJECTS_FROM_ELEMENT}
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS element_keywords_kp_au AFTER UPDATE ON element_keywords BEGIN
+        {_KEYWORD_PROJECTS_FROM_ELEMENT}
+        {_KEYWORD_PROJECTS_CLEANUP}
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS element_keywords_kp_ad AFTER DELETE ON element_keywords BEGIN
+        {_KEYWORD_PROJECTS_CLEANUP}
+    END
+    """,
+)
+
+# Keeps keywords_fts in step with keyword inserts. Shared with
+# bulk_ingest_keywords(), which drops it for the load and rebuilds the index.
+_KEYWORDS_AI_TRIGGER = """
+    CREATE TRIGGER IF NOT EXISTS keywords_ai AFTER INSERT ON keywords BEGIN
+        INSERT INTO keywords_fts(rowid, keyword, kind) VALUES (new.id, new.keyword, new.kind);
+    END;
+"""
+
+# Full schema for a fresh database, run as one script by _create_schema().
+_SCHEMA_DDL = """
+CREATE TABLE projects (
+    id            INTEGER PRIMARY KEY AUTOINCREMENT,
+    name          TEXT    NOT NULL,
+    folder_path   TEXT    NOT NULL UNIQUE,
+    created_at    TEXT    DEFAULT (datetime('now', 'localtime'))
+);
+
+CREATE TABLE files (
+    id            INTEGER PRIMARY KEY AUTOINCREMENT,
+    project_id    INTEGER NOT NULL REFERENCES projects(id) ON DELETE CASCADE,
+    filename      TEXT    NOT NULL,
+    rel_path      TEXT    NOT NULL,
+    slide_count   INTEGER,
+    checksum      TEXT,
+    conversion_status TEXT DEFAULT 'Pending' CHECK(conversion_status IN ('Pending', 'In Progress', 'Completed', 'Failed')),
+    created_at    TEXT    DEFAULT (datetime('now', 'localtime')),
+    source_fingerprint TEXT,
+    UNIQUE(project_id, rel_path)
+);
+
+CREATE TABLE slides (
+    id            INTEGER PRIMARY KEY AUTOINCREMENT,
+    file_id       INTEGER NOT NULL REFERENCES files(id) ON DELETE CASCADE,
+    slide_index   INTEGER NOT NULL,
+    title         TEXT,
+    thumb_rel_path TEXT,
+    image_rel_path TEXT,
+    UNIQUE(file_id, slide_index)
+);
+
+CREATE TABLE elements (
+    id            INTEGER PRIMARY KEY AUTOINCREMENT,
+    slide_id      INTEGER NOT NULL REFERENCES slides(id) ON DELETE CASCADE,
+    element_type  TEXT    NOT NULL,
+    bbox_x        REAL    NOT NULL,
+    bbox_y        REAL    NOT NULL,
+    bbox_w        REAL    NOT NULL,
+    bbox_h        REAL    NOT NULL
+);
+
+CREATE TABLE keywords (
+    id      INTEGER PRIMARY KEY AUTOINCREMENT,
+    keyword TEXT    NOT NULL,
+    kind    TEXT    NOT NULL CHECK(kind IN ('topic', 'title', 'name')),
+    UNIQUE(keyword, kind)
+);
+
+CREATE TABLE slide_keywords (
+    slide_id   INTEGER NOT NULL REFERENCES slides(id) ON DELETE CASCADE,
+    keyword_id INTEGER NOT NULL REFERENCES keywords(id) ON DELETE CASCADE,
+    PRIMARY KEY (slide_id, keyword_id)
+);
+
+CREATE TABLE element_keywords (
+    element_id INTEGER NOT NULL REFERENCES elements(id) ON DELETE CASCADE,
+    keyword_id INTEGER NOT NULL REFERENCES keywords(id) ON DELETE CASCADE,
+    PRIMARY KEY (element_id, keyword_id)
+);
+
+CREATE INDEX idx_files_project_filename ON files(project_id, filename);
+CREATE INDEX idx_slides_file_id ON slides(file_id);
+CREATE INDEX idx_slides_file_cover ON slides(file_id, slide_index, title, thumb_rel_path, image_rel_path);
+CREATE INDEX idx_elements_slide_id ON elements(slide_id);
+CREATE INDEX idx_slide_keywords_keyword_slide ON slide_keywords(keyword_id, slide_id);
+CREATE INDEX idx_element_keywords_keyword_element ON element_keywords(keyword_id, element_id);
+CREATE INDEX idx_keywords_kind_nocase ON keywords(kind, keyword COLLATE NOCASE);
+""" + ";\n".join(_SLIDE_ORIGINS_DDL + _KEYWORD_PROJECTS_DDL) + ";\n"
+
+
+def _is_fts_unavailable_error(error: sqlite3.OperationalError) -> bool:
+    """
+    Tell whether an error means keywords_fts can't be used at all.
+    
+    Args:
+        error: The error raised by a query against keywords_fts.
+        
+    Returns:
+        True for a missing FTS5 module or FTS table, False otherwise.
+    """
+    message = str(error)
+    return (
+        "no such module: fts5" in message
+        or "no such table: keywords_fts" in message
+        or "vtable constructor failed: keywords_fts" in message
+    )
+
+
+def _in_clause(ids: List[int]) -> Tuple[str, tuple]:
+    """
+    Build the placeholders and parameters for an "IN (...)" list.
+    
+    The list is padded to the next power of two (at most IN_CLAUSE_CHUNK_SIZE)
+    by repeating its last id. That doesn't change the result, but it keeps the
+    number of distinct statement texts, and so statement cache entries, small.
+    
+    Args:
+        ids: Non-empty list of at most IN_CLAUSE_CHUNK_SIZE ids.
+        
+    Returns:
+        Tuple of (placeholders, params).
+    """
+    size = min(1 << (len(ids) - 1).bit_length(), IN_CLAUSE_CHUNK_SIZE)
+    params = tuple(ids) + (ids[-1],) * (size - len(ids))
+    return ", ".join("?" * size), params
+
+
+# Most queued writes the writer thread applies in one transaction.
+WRITER_BATCH_SIZE = 64
+
+
+class _WriterThread(threading.Thread):
+    """
+    Applies queued single-statement writes on one dedicated connection.
+    
+    Jobs queued while a transaction is being applied are grouped into the next
+    one (up to WRITER_BATCH_SIZE), so concurrent writers share a commit. In a
+    group, each job runs under its own savepoint, so one failing statement
+    doesn't undo the others; a job applied alone needs no savepoint.
+    
+    Each transaction is applied under the database's write mutex, so it waits
+    for a running write_batch() instead of timing out on SQLite's lock.
+    """
+
+    def __init__(self, conn: sqlite3.Connection, write_mutex: QMutex):
+        super().__init__(name="DatabaseWriter", daemon=True)
+        self._conn = conn
+        self._write_mutex = write_mutex
+        self._jobs: Queue = Queue()
+
+    def submit(self, query: str, params: tuple) -> Future:
+        """Queue a write; the future resolves to the statement's lastrowid."""
+        future: Future = Future()
+        self._jobs.put((query, params, future))
+        return future
+
+    def stop(self) -> None:
+        """Apply the writes already queued, then close the connection."""
+        self._jobs.put(None)
+        self.join()
+
+    def run(self) -> None:
+        jobs: list = []
+        try:
+            stopping = False
+            while not stopping:
+                job = self._jobs.get()
+                if job is None:
+                    break
+                jobs = [job]
+                while len(jobs) < WRITER_BATCH_SIZE:
+                    try:
+                        job = self._jobs.get_nowait()
+                    except Empty:
+                        break
+                    if job is None:
+                        stopping = True
+                        break
+                    jobs.append(job)
+                self._apply(jobs)
+                jobs = []
+        except BaseException as e:
+            # Never leave a caller blocked on a future this thread won't resolve
+            self._fail(jobs, e)
+            while True:
+                try:
+                    job = self._jobs.get_nowait()
+                except Empty:
+                    break
+                if job is not None:
+                    self._fail([job], e)
+            raise
+        finally:
+            self._conn.close()
+
+    @staticmethod
+    def _fail(jobs: list, error: BaseException) -> None:
+        """Resolve the jobs' futures that are still pending with the error."""
+        for _, _, future in jobs:
+            if not future.done():
+                future.set_exception(error)
+
+    def _apply(self, jobs: list) -> None:
+        conn = self._conn
+        outcomes = []
+        isolate = len(jobs) > 1
+        try:
+            with QMutexLocker(self._write_mutex):
+                try:
+                    conn.execute("BEGIN IMMEDIATE")
+                    for query, params, future in jobs:
+                        if isolate:
+                            conn.execute("SAVEPOINT job")
+                        try:
+                            outcomes.append((future, conn.execute(query, params).lastrowid, None))
+                        except Exception as e:
+                            # Bad parameters (e.g. OverflowError) fail only their own job
+                            if not isolate:
+                                raise
+                            conn.execute("ROLLBACK TO job")
+                            outcomes.append((future, None, e))
+                        if isolate:
+                            conn.execute("RELEASE job")
+                    conn.commit()
+                except Exception:
+                    if conn.in_transaction:
+                        try:
+                            conn.rollback()
+                        except sqlite3.Error:
+                            pass
+                    raise
+        except Exception as e:
+            self._fail(jobs, e)
+            return
+        for future, lastrowid, error in outcomes:
+            if error is None:
+                future.set_result(lastrowid)
+            else:
+                future.set_exception(error)
+
+
+class _Connection(sqlite3.Connection):
+    """Connection that keeps one plain-tuple cursor for the read helpers."""
+
+    _tuple_cursor: Optional[sqlite3.Cursor] = None
+
+    def tuple_cursor(self) -> sqlite3.Cursor:
+        """
+        Return this connection's shared cursor with no row factory.
+        
+        Creating a cursor and resetting its row factory costs about as much
+        as a short indexed lookup. The read helpers fetch their results before
+        returning, so one cursor per connection can serve them all.
+        
+        Returns:
+            The shared cursor.
+        """
+        cursor = self._tuple_cursor
+        if cursor is None:
+            cursor = self._tuple_cursor = self.cursor()
+            cursor.row_factory = None
+        return cursor
+
+
+class _ThreadConnection:
+    """A thread's own connection; freed (and closed) when the thread exits."""
+    __slots__ = ("conn", "in_use", "__weakref__")
+
+    def __init__(self, conn: sqlite3.Connection):
+        self.conn = conn
+        self.in_use = False
+
 
 class Database:
     """
     Thread-safe database service with connection pooling.
     Handles all interactions with the application's SQLite database.
+    
+    Reads run on the calling thread's own connection and never take the
+    write mutex; with WAL they proceed alongside a writer and see the last
+    committed state. Writes go through the single writer thread or a
+    write_batch(), both under the write mutex, so only one transaction
+    writes at a time. Reads inside a write_batch() use the batch's connection and see
+    its uncommitted rows. An in-memory database is the exception: it is
+    served by one connection that callers take turns on.
     """
     
     def __init__(self, db_path: Path, pool_size: int = 5, pool_timeout: int = 30):
@@ -44,21 +492,51 @@ class Database:
             pool_timeout: Timeout in seconds when waiting for a connection.
         """
         self.db_path = db_path
+        # ":memory:" would give every pooled connection its own empty
+        # database; share one named in-memory database instead
+        self._is_memory = str(db_path) == ":memory:"
+        if self._is_memory:
+            self._connect_target = f"file:slideman_mem_{id(self)}?mode=memory&cache=shared"
+        else:
+            self._connect_target = str(db_path)
+        # Shared-cache connections lock whole tables and report conflicts as
+        # SQLITE_LOCKED, which busy_timeout doesn't wait out. An in-memory
+        # database is therefore used through one connection, held under this
+        # lock for each get_connection() block and for whole write batches.
+        self._memory_conn: Optional[sqlite3.Connection] = None
+        self._memory_lock = threading.RLock()
         self._pool_size = pool_size
         self._pool_timeout = pool_timeout
         self._connection_pool: Queue[sqlite3.Connection] = Queue(maxsize=pool_size)
         self._pool_lock = threading.RLock()
         self._schema_lock = threading.Lock()
         self._initialized = False
+        # Set once keywords_fts is confirmed, so searches don't probe for it
+        self._fts_available = False
         self.logger = logging.getLogger(__name__)
         
-        # Initialize mutex for thread safety during write operations
+        self._keyword_id_cache: "OrderedDict[Tuple[str, str], int]" = OrderedDict()
+        self._keyword_id_cache_lock = threading.Lock()
+        
+        # Serializes write_batch() callers and the writer thread's transactions
+        # in-process. SQLite allows one writer per database whatever tables it
+        # touches, so finer-grained locks would only move the wait into
+        # busy_timeout polling
         self._write_mutex = QMutex()
         
+        # Single-statement writes are handed to one writer thread, started on
+        # first use, which takes the mutex once per group of writes
+        self._writer: Optional[_WriterThread] = None
+        
         # Track active connections for cleanup
         self._active_connections: List[sqlite3.Connection] = []
         self._active_lock = threading.Lock()
         
+        # Each thread gets its own long-lived connection; the pool above only
+        # serves nested get_connection() calls on a thread
+        self._local = threading.local()
+        self._thread_connections: "weakref.WeakSet[_ThreadConnection]" = weakref.WeakSet()
+        
         self.logger.info(f"Database service initialized for path: {self.db_path} with pool size: {pool_size}")
 
     def connect(self) -> bool:
@@ -78,7 +556,8 @@ class Database:
             
         try:
             # Ensure parent directory exists
-            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            if not self._is_memory:
+                self.db_path.parent.mkdir(parents=True, exist_ok=True)
             
             # Initialize the connection pool
             self._initialize_pool()
@@ -120,34 +599,97 @@ class Database:
             ConnectionError: If unable to create connection.
         """
         try:
-            conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            conn = self._connect_direct()
             conn.row_factory = sqlite3.Row
             
-            # Configure connection for better concurrency
-            conn.execute("PRAGMA foreign_keys = ON;")
-            conn.execute("PRAGMA journal_mode = WAL;")  # Write-Ahead Logging for better concurrency
-            conn.execute("PRAGMA synchronous = NORMAL;")  # Balance between safety and performance
-            conn.execute("PRAGMA busy_timeout = 5000;")  # 5 second timeout for locked database
-            conn.execute("PRAGMA temp_store = MEMORY;")  # Use memory for temporary tables
+            # Configure connection for better concurrency. The one-shot
+            # pragmas go through executescript, which finalizes each statement
+            # immediately instead of parking it in the statement cache.
+            conn.executescript(
+                "PRAGMA foreign_keys = ON;"
+                "PRAGMA synchronous = NORMAL;"  # Balance between safety and performance
+                "PRAGMA busy_timeout = 5000;"  # 5 second timeout for locked database
+                "PRAGMA temp_store = MEMORY;"  # Use memory for temporary tables
+                "PRAGMA cache_size = -65536;"  # 64 MB page cache ceiling
+            )
+            if not self._is_memory:
+                # Write-Ahead Logging lets the GUI read while workers write
+                journal_mode = conn.execute("PRAGMA journal_mode = WAL;").fetchone()[0]
+                if journal_mode.lower() != "wal":
+                    self.logger.warning(f"WAL not available, journal mode is '{journal_mode}'")
+                conn.executescript(
+                    "PRAGMA mmap_size = 268435456;"  # 256 MB
+                    # A large ingest can grow the WAL well past its usual
+                    # size; trim it back after checkpoints instead of keeping it
+                    "PRAGMA journal_size_limit = 6144000;"
+                )
             
             return conn
             
         except sqlite3.Error as e:
             raise ConnectionError(f"Failed to create database connection: {e}") from e
 
+    def _connect_direct(self) -> sqlite3.Connection:
+        """
+        Open a bare connection to this database, without pool settings.
+        
+        Returns:
+            A new SQLite connection.
+        """
+        return sqlite3.connect(
+            self._connect_target, uri=self._is_memory, check_same_thread=False,
+            cached_statements=STATEMENT_CACHE_SIZE, factory=_Connection
+        )
+
     @contextmanager
     def get_connection(self):
         """
-        Context manager for getting a connection from the pool.
+        Context manager for getting a database connection.
+        
+        Normally yields the calling thread's own connection, so concurrent
+        threads never queue for one another's connections. Nested calls on
+        the same thread get a connection from the pool instead.
         
         Yields:
-            sqlite3.Connection: A database connection from the pool.
+            sqlite3.Connection: A database connection.
             
         Raises:
             ConnectionError: If unable to get a connection from the pool.
         """
         if not self._initialized:
             raise ConnectionError("Database not initialized. Call connect() first.")
+        
+        # Inside write_batch() every call on this thread shares the batch's
+        # connection, so reads see the batch's uncommitted writes
+        batch_conn = getattr(self._local, 'batch_conn', None)
+        if batch_conn is not None:
+            yield batch_conn
+            return
+        
+        if self._is_memory:
+            with self._memory_lock:
+                if self._memory_conn is None:
+                    self._memory_conn = self._create_connection()
+                    with self._active_lock:
+                        self._active_connections.append(self._memory_conn)
+                yield self._memory_conn
+            return
+        
+        # Fast path: this thread's own connection, unless it's already in use
+        # further up the stack
+        thread_conn = getattr(self._local, 'conn', None)
+        if thread_conn is None:
+            thread_conn = _ThreadConnection(self._create_connection())
+            self._local.conn = thread_conn
+            with self._active_lock:
+                self._thread_connections.add(thread_conn)
+        if not thread_conn.in_use:
+            thread_conn.in_use = True
+            try:
+                yield thread_conn.conn
+            finally:
+                thread_conn.in_use = False
+            return
             
         conn = None
         start_time = time.time()
@@ -216,17 +758,35 @@ class Database:
         
         # Close all tracked connections
         with self._active_lock:
-            for conn in self._active_connections:
+            thread_conns = [thread_conn.conn for thread_conn in self._thread_connections]
+            for conn in self._active_connections + thread_conns:
                 try:
                     conn.close()
                 except Exception as e:
                     self.logger.error(f"Error closing connection: {e}")
             self._active_connections.clear()
+            self._thread_connections.clear()
+            self._memory_conn = None
+            # Drop every thread's reference to its now closed connection
+            self._local = threading.local()
 
     def close(self) -> None:
         """Close all database connections and clean up resources."""
         self.logger.info("Closing database connections...")
+        if self._initialized:
+            # Let SQLite refresh statistics for tables whose shape changed
+            try:
+                with self.get_connection() as conn:
+                    conn.execute("PRAGMA optimize;")
+            except (sqlite3.Error, DatabaseError) as e:
+                self.logger.warning(f"PRAGMA optimize failed on close: {e}")
+        with self._pool_lock:
+            writer, self._writer = self._writer, None
+        if writer is not None:
+            writer.stop()
         self._cleanup_pool()
+        with self._keyword_id_cache_lock:
+            self._keyword_id_cache.clear()
         self._initialized = False
         self.logger.info("Database connections closed.")
 
@@ -246,16 +806,67 @@ class Database:
         """
         with self.get_connection() as conn:
             try:
-                cursor = conn.cursor()
-                cursor.execute(query, params)
-                return cursor.fetchall()
+                return conn.execute(query, params).fetchall()
+            except sqlite3.Error as e:
+                self.logger.error(f"Database read error: {e}", exc_info=True)
+                raise DatabaseError(f"Failed to execute read query: {e}") from e
+
+    def _execute_read_tuples(self, query: str, params: tuple = ()) -> List[tuple]:
+        """
+        Execute a read query returning plain tuples instead of sqlite3.Row.
+        
+        For hot paths that build models from many rows by column position.
+        
+        Args:
+            query: SQL query to execute.
+            params: Query parameters.
+            
+        Returns:
+            List of result tuples, in the query's column order.
+            
+        Raises:
+            DatabaseError: If query execution fails.
+        """
+        with self.get_connection() as conn:
+            try:
+                return conn.tuple_cursor().execute(query, params).fetchall()
+            except sqlite3.Error as e:
+                self.logger.error(f"Database read error: {e}", exc_info=True)
+                raise DatabaseError(f"Failed to execute read query: {e}") from e
+
+    def _fetchone_scalar(self, query: str, params: tuple = ()) -> Any:
+        """
+        Execute a read query and return the first column of its first row.
+        
+        Meant for queries that return at most one row: the whole result is
+        read so the shared cursor's statement is reset rather than left open
+        holding a read snapshot.
+        
+        Args:
+            query: SQL query to execute.
+            params: Query parameters.
+            
+        Returns:
+            The value, or None if the query returned no rows.
+            
+        Raises:
+            DatabaseError: If query execution fails.
+        """
+        with self.get_connection() as conn:
+            try:
+                rows = conn.tuple_cursor().execute(query, params).fetchall()
+                return rows[0][0] if rows else None
             except sqlite3.Error as e:
                 self.logger.error(f"Database read error: {e}", exc_info=True)
                 raise DatabaseError(f"Failed to execute read query: {e}") from e
 
     def _execute_write(self, query: str, params: tuple = (), return_lastrowid: bool = True) -> Optional[int]:
         """
-        Execute a write query with proper locking and error handling.
+        Execute a write query with proper error handling.
+        
+        Outside write_batch() the statement is queued to the writer thread,
+        which may commit it together with writes from other threads; the call
+        returns once that commit has happened.
         
         Args:
             query: SQL query to execute.
@@ -268,40 +879,81 @@ class Database:
         Raises:
             DatabaseError: If query execution fails.
         """
-        with QMutexLocker(self._write_mutex):
-            with self.get_connection() as conn:
-                try:
-                    cursor = conn.cursor()
-                    cursor.execute(query, params)
-                    conn.commit()
-                    return cursor.lastrowid if return_lastrowid else None
-                except sqlite3.IntegrityError as e:
-                    conn.rollback()
-                    if "UNIQUE constraint failed" in str(e):
-                        raise DuplicateResourceError("Resource", str(params)) from e
-                    raise ValidationError(f"Data integrity error: {e}") from e
-                except sqlite3.Error as e:
-                    conn.rollback()
-                    self.logger.error(f"Database write error: {e}", exc_info=True)
-                    raise DatabaseError(f"Failed to execute write query: {e}") from e
+        batch_conn = getattr(self._local, 'batch_conn', None)
+        if batch_conn is not None:
+            # write_batch() holds the mutex and commits once at the end; a
+            # failed statement is undone by SQLite without ending the batch
+            try:
+                cursor = batch_conn.execute(query, params)
+                return cursor.lastrowid if return_lastrowid else None
+            except sqlite3.IntegrityError as e:
+                if "UNIQUE constraint failed" in str(e):
+                    raise DuplicateResourceError("Resource", str(params)) from e
+                raise ValidationError(f"Data integrity error: {e}") from e
+            except sqlite3.Error as e:
+                self.logger.error(f"Database write error: {e}", exc_info=True)
+                raise DatabaseError(f"Failed to execute write query: {e}") from e
+        
+        if self._is_memory:
+            # One connection serves everything; run the write as its own batch
+            with self.write_batch():
+                return self._execute_write(query, params, return_lastrowid)
+        
+        try:
+            lastrowid = self._get_writer().submit(query, params).result()
+            return lastrowid if return_lastrowid else None
+        except sqlite3.IntegrityError as e:
+            if "UNIQUE constraint failed" in str(e):
+                raise DuplicateResourceError("Resource", str(params)) from e
+            raise ValidationError(f"Data integrity error: {e}") from e
+        except sqlite3.Error as e:
+            self.logger.error(f"Database write error: {e}", exc_info=True)
+            raise DatabaseError(f"Failed to execute write query: {e}") from e
+
+    def _get_writer(self) -> _WriterThread:
+        """
+        Return the running writer thread, starting it if needed.
+        
+        Returns:
+            The writer thread.
+            
+        Raises:
+            ConnectionError: If the database is not initialized.
+        """
+        if not self._initialized:
+            raise ConnectionError("Database not initialized. Call connect() first.")
+        with self._pool_lock:
+            if self._writer is None or not self._writer.is_alive():
+                self._writer = _WriterThread(self._create_connection(), self._write_mutex)
+                self._writer.start()
+            return self._writer
 
     @contextmanager
     def transaction(self):
         """
         Context manager for database transactions.
         
+        The transaction takes the write lock on entry (BEGIN IMMEDIATE), so a
+        busy database is reported before any work is done rather than when
+        the first write tries to upgrade a read transaction.
+        
         Yields:
             Connection object for the transaction.
             
         Raises:
             TransactionError: If transaction fails.
         """
+        batch_conn = getattr(self._local, 'batch_conn', None)
+        if batch_conn is not None:
+            # Already inside write_batch(), which owns the commit
+            yield batch_conn
+            return
+        
         with self.get_connection() as conn:
             try:
                 # Disable autocommit
                 conn.isolation_level = 'DEFERRED'
-                cursor = conn.cursor()
-                cursor.execute("BEGIN")
+                conn.execute("BEGIN IMMEDIATE")
                 yield conn
                 conn.commit()
             except Exception as e:
@@ -312,6 +964,50 @@ class Database:
                 # Re-enable autocommit
                 conn.isolation_level = None
 
+    @contextmanager
+    def write_batch(self):
+        """
+        Group many writes into one transaction with a single commit.
+        
+        Holds the write mutex and an IMMEDIATE transaction for the duration
+        of the block. The CRUD methods called on this thread inside the block
+        skip their own per-statement commit, so importing many rows costs one
+        fsync instead of one per row. Nested batches join the outer one.
+        
+        Yields:
+            Connection object for the batch.
+            
+        Raises:
+            TransactionError: If the batch cannot be started or committed.
+        """
+        if getattr(self._local, 'batch_conn', None) is not None:
+            yield self._local.batch_conn
+            return
+        
+        # The in-memory connection lock is always taken before the write
+        # mutex, so a thread already inside get_connection() can't deadlock
+        # against a batch waiting for that connection
+        with self._memory_lock if self._is_memory else nullcontext(), \
+                QMutexLocker(self._write_mutex):
+            with self.get_connection() as conn:
+                try:
+                    conn.execute("BEGIN IMMEDIATE")
+                except sqlite3.Error as e:
+                    raise TransactionError(f"Failed to start write batch: {e}") from e
+                self._local.batch_conn = conn
+                try:
+                    yield conn
+                    conn.commit()
+                except sqlite3.Error as e:
+                    conn.rollback()
+                    self.logger.error(f"Write batch failed: {e}", exc_info=True)
+                    raise TransactionError(f"Write batch failed: {e}") from e
+                except BaseException:
+                    conn.rollback()
+                    raise
+                finally:
+                    self._local.batch_conn = None
+
     # Schema management methods
 
     def _get_db_version(self) -> int:
@@ -329,7 +1025,7 @@ class Database:
             # This avoids the circular dependency where get_connection() checks _initialized
             if not self._initialized:
                 # Create a temporary direct connection
-                direct_conn = sqlite3.connect(str(self.db_path))
+                direct_conn = self._connect_direct()
                 try:
                     cursor = direct_conn.cursor()
                     cursor.execute("PRAGMA user_version;")
@@ -415,22 +1111,21 @@ class Database:
                     # Use a direct connection during initialization
                     conn = self._create_connection()
                     try:
-                        conn.execute("BEGIN TRANSACTION")
-                        
                         if current_version == 0:
                             self.logger.info("Creating initial database schema...")
-                            self._create_tables(conn)
-                            self._create_indices(conn)
-                            self._set_db_version_direct(conn, DB_SCHEMA_VERSION)
+                            self._create_schema(conn)
                             self.logger.info("Initial schema created successfully.")
                         else:
                             # Handle migrations
+                            conn.execute("BEGIN IMMEDIATE")
                             self.logger.info(f"Migrating database from version {current_version} to {DB_SCHEMA_VERSION}")
                             self._migrate_schema(conn, current_version, DB_SCHEMA_VERSION)
                             self._set_db_version_direct(conn, DB_SCHEMA_VERSION)
                             self.logger.info("Database migration completed successfully.")
+                            conn.commit()
                         
-                        conn.commit()
+                        # Give the planner sqlite_stat1 data for the new indices
+                        conn.execute("ANALYZE;")
                     except Exception as e:
                         conn.rollback()
                         raise
@@ -506,6 +1201,125 @@ class Database:
                 
                 from_version = 3
             
+            # Migration from version 3 to 4
+            if from_version == 3 and to_version >= 4:
+                self.logger.info("Applying migration from version 3 to 4...")
+                
+                # Source file fingerprint of the last complete conversion
+                cursor.execute("""
+                    SELECT COUNT(*) FROM pragma_table_info('files') 
+                    WHERE name='source_fingerprint'
+                """)
+                if cursor.fetchone()[0] == 0:
+                    cursor.execute("""
+                        ALTER TABLE files 
+                        ADD COLUMN source_fingerprint TEXT
+                    """)
+                    self.logger.debug("Added source_fingerprint column to files table")
+                
+                from_version = 4
+            
+            # Migration from version 4 to 5
+            if from_version == 4 and to_version >= 5:
+                self.logger.info("Applying migration from version 4 to 5...")
+                
+                # Covering index so get_slides_for_file never visits the table
+                cursor.execute("""
+                    CREATE INDEX IF NOT EXISTS idx_slides_file_cover
+                    ON slides(file_id, slide_index, title, thumb_rel_path, image_rel_path)
+                """)
+                
+                from_version = 5
+            
+            # Migration from version 5 to 6
+            if from_version == 5 and to_version >= 6:
+                self.logger.info("Applying migration from version 5 to 6...")
+                
+                # Materialized slide origins, backfilled from the existing rows
+                for statement in _SLIDE_ORIGINS_DDL:
+                    cursor.execute(statement)
+                cursor.execute("""
+                    INSERT OR REPLACE INTO slide_origins (slide_id, folder_path, rel_path, slide_index)
+                    SELECT s.id, p.folder_path, f.rel_path, s.slide_index
+                    FROM slides s
+                    JOIN files f ON s.file_id = f.id
+                    JOIN projects p ON f.project_id = p.id
+                """)
+                
+                from_version = 6
+            
+            # Migration from version 6 to 7
+            if from_version == 6 and to_version >= 7:
+                self.logger.info("Applying migration from version 6 to 7...")
+                
+                # Keyword-to-project bridge, backfilled from both link tables
+                for statement in _KEYWORD_PROJECTS_DDL:
+                    cursor.execute(statement)
+                cursor.execute("""
+                    INSERT OR IGNORE INTO keyword_projects (project_id, keyword_id)
+                    SELECT f.project_id, sk.keyword_id
+                    FROM slide_keywords sk
+                    JOIN slides s ON sk.slide_id = s.id
+                    JOIN files f ON s.file_id = f.id
+                    UNION
+                    SELECT f.project_id, ek.keyword_id
+                    FROM element_keywords ek
+                    JOIN elements e ON ek.element_id = e.id
+                    JOIN slides s ON e.slide_id = s.id
+                    JOIN files f ON s.file_id = f.id
+                """)
+                
+                from_version = 7
+            
+            # Migration from version 7 to 8
+            if from_version == 7 and to_version >= 8:
+                self.logger.info("Applying migration from version 7 to 8...")
+                
+                # Project file listings come back in filename order straight
+                # from the index; UNIQUE(project_id, rel_path) already serves
+                # plain project_id lookups, so the old index goes
+                cursor.execute("""
+                    CREATE INDEX IF NOT EXISTS idx_files_project_filename
+                    ON files(project_id, filename)
+                """)
+                cursor.execute("DROP INDEX IF EXISTS idx_files_project_id")
+                
+                from_version = 8
+            
+            # Migration from version 8 to 9
+            if from_version == 8 and to_version >= 9:
+                self.logger.info("Applying migration from version 8 to 9...")
+                
+                # Keyword listings sort case-insensitively within a kind; with
+                # the collation in the index they read in order, no sort step
+                cursor.execute("""
+                    CREATE INDEX IF NOT EXISTS idx_keywords_kind_nocase
+                    ON keywords(kind, keyword COLLATE NOCASE)
+                """)
+                cursor.execute("DROP INDEX IF EXISTS idx_keywords_kind")
+                
+                from_version = 9
+            
+            # Migration from version 9 to 10
+            if from_version == 9 and to_version >= 10:
+                self.logger.info("Applying migration from version 9 to 10...")
+                
+                # Link tables are rowid tables, so a keyword_id-only index
+                # needs a table lookup per match to find the other id; with
+                # both columns in the index, lookups by keyword never leave it
+                cursor.execute("""
+                    CREATE INDEX IF NOT EXISTS idx_slide_keywords_keyword_slide
+                    ON slide_keywords(keyword_id, slide_id)
+                """)
+                cursor.execute("""
+                    CREATE INDEX IF NOT EXISTS idx_element_keywords_keyword_element
+                    ON element_keywords(keyword_id, element_id)
+                """)
+                cursor.execute("DROP INDEX IF EXISTS idx_slide_keywords_keyword_id")
+                cursor.execute("DROP INDEX IF EXISTS idx_element_keywords_keyword_id")
+                
+                from_version = 10
+            
             # Add more migration blocks here for future versions
             
             if from_version != to_version:
@@ -517,200 +1331,138 @@ class Database:
             self.logger.error(f"Migration failed: {e}", exc_info=True)
             raise DatabaseError(f"Database migration failed: {e}") from e
 
-    def _create_tables(self, conn: sqlite3.Connection) -> None:
-        """Create all necessary database tables."""
-        cursor = conn.cursor()
-        
-        # Projects table
-        cursor.execute("""
-            CREATE TABLE projects (
-                id            INTEGER PRIMARY KEY AUTOINCREMENT,
-                name          TEXT    NOT NULL,
-                folder_path   TEXT    NOT NULL UNIQUE,
-                created_at    TEXT    DEFAULT (datetime('now', 'localtime'))
-            );
-        """)
-        
-        # Files table
-        cursor.execute("""
-            CREATE TABLE files (
-                id            INTEGER PRIMARY KEY AUTOINCREMENT,
-                project_id    INTEGER NOT NULL REFERENCES projects(id) ON DELETE CASCADE,
-                filename      TEXT    NOT NULL,
-                rel_path      TEXT    NOT NULL,
-                slide_count   INTEGER,
-                checksum      TEXT,
-                conversion_status TEXT DEFAULT 'Pending' CHECK(conversion_status IN ('Pending', 'In Progress', 'Completed', 'Failed')),
-                created_at    TEXT    DEFAULT (datetime('now', 'localtime')),
-                UNIQUE(project_id, rel_path)
-            );
-        """)
-        
-        # Slides table
-        cursor.execute("""
-            CREATE TABLE slides (
-                id            INTEGER PRIMARY KEY AUTOINCREMENT,
-                file_id       INTEGER NOT NULL REFERENCES files(id) ON DELETE CASCADE,
-                slide_index   INTEGER NOT NULL,
-                title         TEXT,
-                thumb_rel_path TEXT,
-                image_rel_path TEXT,
-                UNIQUE(file_id, slide_index)
-            );
-        """)
-        
-        # Elements table
-        cursor.execute("""
-            CREATE TABLE elements (
-                id            INTEGER PRIMARY KEY AUTOINCREMENT,
-                slide_id      INTEGER NOT NULL REFERENCES slides(id) ON DELETE CASCADE,
-                element_type  TEXT    NOT NULL,
-                bbox_x        REAL    NOT NULL,
-                bbox_y        REAL    NOT NULL,
-                bbox_w        REAL    NOT NULL,
-                bbox_h        REAL    NOT NULL
-            );
-        """)
-        
-        # Keywords table
-        cursor.execute("""
-            CREATE TABLE keywords (
-                id      INTEGER PRIMARY KEY AUTOINCREMENT,
-                keyword TEXT    NOT NULL,
-                kind    TEXT    NOT NULL CHECK(kind IN ('topic', 'title', 'name')),
-                UNIQUE(keyword, kind)
-            );
-        """)
-        
-        # Junction tables
-        cursor.execute("""
-            CREATE TABLE slide_keywords (
-                slide_id   INTEGER NOT NULL REFERENCES slides(id) ON DELETE CASCADE,
-                keyword_id INTEGER NOT NULL REFERENCES keywords(id) ON DELETE CASCADE,
-                PRIMARY KEY (slide_id, keyword_id)
-            );
-        """)
-        
-        cursor.execute("""
-            CREATE TABLE element_keywords (
-                element_id INTEGER NOT NULL REFERENCES elements(id) ON DELETE CASCADE,
-                keyword_id INTEGER NOT NULL REFERENCES keywords(id) ON DELETE CASCADE,
-                PRIMARY KEY (element_id, keyword_id)
-            );
-        """)
-        
-        self.logger.debug("All tables created successfully.")
-
-    def _create_indices(self, conn: sqlite3.Connection) -> None:
-        """Create database indices for performance."""
-        cursor = conn.cursor()
-        
-        # Index on files for faster project queries
-        cursor.execute("CREATE INDEX idx_files_project_id ON files(project_id);")
-        
-        # Index on slides for faster file queries
-        cursor.execute("CREATE INDEX idx_slides_file_id ON slides(file_id);")
-        
-        # Index on elements for faster slide queries
-        cursor.execute("CREATE INDEX idx_elements_slide_id ON elements(slide_id);")
-        
-        # Indices on junction tables
-        cursor.execute("CREATE INDEX idx_slide_keywords_keyword_id ON slide_keywords(keyword_id);")
-        cursor.execute("CREATE INDEX idx_element_keywords_keyword_id ON element_keywords(keyword_id);")
+    def _create_schema(self, conn: sqlite3.Connection) -> None:
+        """
+        Create all tables and indices for a fresh database in one transaction.
         
-        # Index on keywords for faster lookups by kind
-        cursor.execute("CREATE INDEX idx_keywords_kind ON keywords(kind);")
+        The DDL is sent as a single script rather than statement by statement,
+        and the schema version is stamped inside the same transaction.
         
-        self.logger.debug("All indices created successfully.")
+        Args:
+            conn: Database connection to use.
+        """
+        conn.executescript(
+            f"BEGIN IMMEDIATE;{_SCHEMA_DDL}PRAGMA user_version = {DB_SCHEMA_VERSION};COMMIT;"
+        )
+        self.logger.debug("All tables and indices created successfully.")
 
     def _ensure_fts_tables_exist(self) -> None:
         """Ensure FTS5 virtual tables exist for full-text search."""
         try:
             # During initialization, use a direct connection instead of get_connection()
             if not self._initialized:
-                # Create a temporary direct connection
-                direct_conn = sqlite3.connect(str(self.db_path))
+                direct_conn = self._connect_direct()
                 try:
-                    cursor = direct_conn.cursor()
-                    
-                    # Check if FTS tables already exist
-                    cursor.execute(
-                        "SELECT name FROM sqlite_master WHERE type='table' AND name='slides_fts';"
-                    )
-                    if cursor.fetchone():
-                        return  # Tables already exist
-                    
-                    # Create FTS5 virtual table for slides
-                    cursor.execute("""
-                        CREATE VIRTUAL TABLE IF NOT EXISTS slides_fts USING fts5(
-                            slide_id UNINDEXED,
-                            title,
-                            notes,
-                            content='slides',
-                            content_rowid='id'
-                        );
-                    """)
-                    
-                    # Create triggers to keep FTS table in sync
-                    cursor.execute("""
-                        CREATE TRIGGER IF NOT EXISTS slides_fts_insert AFTER INSERT ON slides BEGIN
-                            INSERT INTO slides_fts(slide_id, title, notes) VALUES (new.id, '', '');
-                        END;
-                    """)
-                    
-                    cursor.execute("""
-                        CREATE TRIGGER IF NOT EXISTS slides_fts_delete AFTER DELETE ON slides BEGIN
-                            DELETE FROM slides_fts WHERE slide_id = old.id;
-                        END;
-                    """)
-                    
-                    direct_conn.commit()
-                    self.logger.debug("FTS tables created successfully.")
+                    self._create_fts_tables(direct_conn)
                 finally:
                     direct_conn.close()
             else:
-                # Normal operation when already initialized
                 with self.get_connection() as conn:
-                    cursor = conn.cursor()
-                    
-                    # Check if FTS tables already exist
-                    cursor.execute(
-                        "SELECT name FROM sqlite_master WHERE type='table' AND name='slides_fts';"
-                    )
-                    if cursor.fetchone():
-                        return  # Tables already exist
-                    
-                    # Create FTS5 virtual table for slides
-                    cursor.execute("""
-                        CREATE VIRTUAL TABLE IF NOT EXISTS slides_fts USING fts5(
-                            slide_id UNINDEXED,
-                            title,
-                            notes,
-                            content='slides',
-                            content_rowid='id'
-                        );
-                    """)
-                    
-                    # Create triggers to keep FTS table in sync
-                    cursor.execute("""
-                        CREATE TRIGGER IF NOT EXISTS slides_fts_insert AFTER INSERT ON slides BEGIN
-                            INSERT INTO slides_fts(slide_id, title, notes) VALUES (new.id, '', '');
-                        END;
-                    """)
-                    
-                    cursor.execute("""
-                        CREATE TRIGGER IF NOT EXISTS slides_fts_delete AFTER DELETE ON slides BEGIN
-                            DELETE FROM slides_fts WHERE slide_id = old.id;
-                        END;
-                    """)
-                    
-                    conn.commit()
-                    self.logger.debug("FTS tables created successfully.")
+                    self._create_fts_tables(conn)
+            self._fts_available = True
                 
         except sqlite3.Error as e:
+            self._fts_available = False
             self.logger.error(f"Failed to create FTS tables: {e}", exc_info=True)
             # Non-critical error, don't raise
 
+    def _create_fts_tables(self, conn: sqlite3.Connection) -> None:
+        """
+        Create any missing FTS5 tables and their sync triggers, then index existing rows.
+        
+        Args:
+            conn: Database connection to use.
+        """
+        existing = dict(conn.execute(
+            "SELECT name, sql FROM sqlite_master "
+            "WHERE name IN ('slides_fts', 'keywords_fts', 'keywords_au');"
+        ).fetchall())
+        if (len(existing) == 3 and "content=" not in existing['slides_fts']
+                and "trigram" in existing['keywords_fts']
+                and " WHEN " in existing['keywords_au']):
+            return  # Tables already exist
+
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            # Older databases declared slides_fts as an external-content table
+            # over columns that slides doesn't have, which broke every slide
+            # delete; it only ever held placeholder text, so recreate it
+            if 'slides_fts' in existing and "content=" in existing['slides_fts']:
+                conn.execute("DROP TRIGGER IF EXISTS slides_fts_insert;")
+                conn.execute("DROP TRIGGER IF EXISTS slides_fts_delete;")
+                conn.execute("DROP TABLE slides_fts;")
+                del existing['slides_fts']
+            
+            if 'slides_fts' not in existing:
+                # Standalone FTS5 table for slides; rowid mirrors slides.id
+                conn.execute("""
+                    CREATE VIRTUAL TABLE slides_fts USING fts5(
+                        slide_id UNINDEXED,
+                        title,
+                        notes
+                    );
+                """)
+                conn.execute("""
+                    CREATE TRIGGER IF NOT EXISTS slides_fts_insert AFTER INSERT ON slides BEGIN
+                        INSERT INTO slides_fts(rowid, slide_id, title, notes)
+                        VALUES (new.id, new.id, COALESCE(new.title, ''), '');
+                    END;
+                """)
+                conn.execute("""
+                    CREATE TRIGGER IF NOT EXISTS slides_fts_delete AFTER DELETE ON slides BEGIN
+                        DELETE FROM slides_fts WHERE rowid = old.id;
+                    END;
+                """)
+                conn.execute("""
+                    INSERT INTO slides_fts(rowid, slide_id, title, notes)
+                    SELECT id, id, COALESCE(title, ''), '' FROM slides;
+                """)
+            
+            # Keyword search matches substrings, which a word tokenizer can't
+            # answer; older databases indexed keywords by word, so re-index
+            # them with trigrams. The triggers on keywords refer to the table
+            # by name and carry over.
+            if 'keywords_fts' in existing and "trigram" not in existing['keywords_fts']:
+                conn.execute("DROP TABLE keywords_fts;")
+                del existing['keywords_fts']
+            
+            if 'keywords_fts' not in existing:
+                # External-content FTS5 trigram index over keywords
+                conn.execute("""
+                    CREATE VIRTUAL TABLE keywords_fts USING fts5(
+                        keyword,
+                        kind,
+                        content='keywords',
+                        content_rowid='id',
+                        tokenize='trigram'
+                    );
+                """)
+                conn.execute(_KEYWORDS_AI_TRIGGER)
+                conn.execute("""
+                    CREATE TRIGGER IF NOT EXISTS keywords_ad AFTER DELETE ON keywords BEGIN
+                        INSERT INTO keywords_fts(keywords_fts, rowid, keyword, kind) VALUES('delete', old.id, old.keyword, old.kind);
+                    END;
+                """)
+                # Index existing keywords in one bulk pass
+                conn.execute("INSERT INTO keywords_fts(keywords_fts) VALUES('rebuild');")
+            
+            # Re-index a keyword only when an indexed column actually changes
+            if " WHEN " not in existing.get('keywords_au', " WHEN "):
+                conn.execute("DROP TRIGGER keywords_au;")
+            conn.execute("""
+                CREATE TRIGGER IF NOT EXISTS keywords_au AFTER UPDATE OF keyword, kind ON keywords
+                WHEN old.keyword IS NOT new.keyword OR old.kind IS NOT new.kind BEGIN
+                    INSERT INTO keywords_fts(keywords_fts, rowid, keyword, kind) VALUES('delete', old.id, old.keyword, old.kind);
+                    INSERT INTO keywords_fts(rowid, keyword, kind) VALUES (new.id, new.keyword, new.kind);
+                END;
+            """)
+            
+            conn.commit()
+        except sqlite3.Error:
+            conn.rollback()
+            raise
+        self.logger.debug("FTS tables created successfully.")
+
     # Project management methods
 
     def add_project(self, name: str, folder_path: str) -> int:
@@ -759,19 +1511,14 @@ class Database:
             ResourceNotFoundError: If the project is not found.
             DatabaseError: If the operation fails.
         """
-        query = "SELECT * FROM projects WHERE id = ?"
-        results = self._execute_read(query, (project_id,))
+        query = "SELECT id, name, folder_path, created_at FROM projects WHERE id = ?"
+        results = self._execute_read_tuples(query, (project_id,))
         
         if not results:
             raise ResourceNotFoundError("Project", project_id)
             
         row = results[0]
-        return Project(
-            id=row['id'],
-            name=row['name'],
-            folder_path=row['folder_path'],
-            created_at=row['created_at']
-        )
+        return Project.from_row(row)
 
     def get_all_projects(self) -> List[Project]:
         """
@@ -783,19 +1530,10 @@ class Database:
         Raises:
             DatabaseError: If the operation fails.
         """
-        query = "SELECT * FROM projects ORDER BY created_at DESC"
-        results = self._execute_read(query)
+        query = "SELECT id, name, folder_path, created_at FROM projects ORDER BY created_at DESC"
+        results = self._execute_read_tuples(query)
         
-        projects = []
-        for row in results:
-            projects.append(Project(
-                id=row['id'],
-                name=row['name'],
-                folder_path=row['folder_path'],
-                created_at=row['created_at']
-            ))
-            
-        return projects
+        return [Project.from_row(row) for row in results]
 
     def get_project_by_path(self, folder_path: str) -> Optional[Project]:
         """
@@ -811,18 +1549,13 @@ class Database:
             DatabaseError: If the operation fails.
         """
         query = "SELECT id, name, folder_path, created_at FROM projects WHERE folder_path = ?"
-        results = self._execute_read(query, (folder_path,))
+        results = self._execute_read_tuples(query, (folder_path,))
         
         if not results:
             return None
             
         row = results[0]
-        return Project(
-            id=row['id'],
-            name=row['name'],
-            folder_path=row['folder_path'],
-            created_at=row['created_at']
-        )
+        return Project.from_row(row)
 
     def update_project_details(self, project_id: int, name: str, folder_path: str) -> None:
         """
@@ -894,7 +1627,7 @@ class Database:
         params = (project_id, filename, rel_path, checksum)
         
         file_id = self._execute_write(query, params)
-        self.logger.debug(f"Added file '{filename}' with ID {file_id} to project {project_id}")
+        self.logger.debug("Added file '%s' with ID %s to project %s", filename, file_id, project_id)
         return file_id
 
     def get_slide(self, slide_id: int) -> Optional[Slide]:
@@ -915,20 +1648,13 @@ class Database:
             FROM slides
             WHERE id = ?
         """
-        results = self._execute_read(query, (slide_id,))
+        results = self._execute_read_tuples(query, (slide_id,))
         
         if not results:
             return None
             
         row = results[0]
-        return Slide(
-            id=row['id'],
-            file_id=row['file_id'],
-            slide_index=row['slide_index'],
-            title=row['title'],
-            thumb_rel_path=row['thumb_rel_path'],
-            image_rel_path=row['image_rel_path']
-        )
+        return Slide.from_row(row)
 
     def get_slide_origin(self, slide_id: int) -> Tuple[str, int]:
         """
@@ -944,21 +1670,65 @@ class Database:
             ResourceNotFoundError: If the slide is not found.
             DatabaseError: If the operation fails.
         """
+        if _SQL_PATH_JOIN:
+            query = f"SELECT {_ORIGIN_PATH_SQL}, slide_index FROM slide_origins WHERE slide_id = ?"
+            results = self._execute_read_tuples(query, (slide_id,))
+            if not results:
+                raise ResourceNotFoundError("Slide", slide_id)
+            return results[0]
+            
         query = """
-            SELECT p.folder_path, f.rel_path, s.slide_index 
-            FROM slides s 
-            JOIN files f ON s.file_id = f.id 
-            JOIN projects p ON f.project_id = p.id 
-            WHERE s.id = ?
+            SELECT folder_path, rel_path, slide_index
+            FROM slide_origins
+            WHERE slide_id = ?
         """
-        results = self._execute_read(query, (slide_id,))
+        results = self._execute_read_tuples(query, (slide_id,))
         
         if not results:
             raise ResourceNotFoundError("Slide", slide_id)
             
-        row = results[0]
-        full_path = Path(row['folder_path']) / row['rel_path']
-        return (str(full_path), row['slide_index'])
+        folder_path, rel_path, slide_index = results[0]
+        return (str(Path(folder_path) / rel_path), slide_index)
+
+    def get_slide_origins(self, slide_ids: List[int]) -> Dict[int, Tuple[str, int]]:
+        """
+        Retrieves the original file path and slide index for many slides at once.
+        
+        Args:
+            slide_ids: The slide IDs to look up.
+            
+        Returns:
+            Dictionary mapping slide ID to (full_file_path, slide_index).
+            Slides that do not exist are omitted.
+            
+        Raises:
+            DatabaseError: If the operation fails.
+        """
+        unique_ids = list(dict.fromkeys(slide_ids))
+        origins: Dict[int, Tuple[str, int]] = {}
+        
+        for start in range(0, len(unique_ids), IN_CLAUSE_CHUNK_SIZE):
+            chunk = unique_ids[start:start + IN_CLAUSE_CHUNK_SIZE]
+            placeholders, params = _in_clause(chunk)
+            if _SQL_PATH_JOIN:
+                query = f"""
+                    SELECT slide_id, {_ORIGIN_PATH_SQL}, slide_index
+                    FROM slide_origins
+                    WHERE slide_id IN ({placeholders})
+                """
+                for slide_id, full_path, slide_index in self._execute_read_tuples(query, params):
+                    origins[slide_id] = (full_path, slide_index)
+                continue
+                
+            query = f"""
+                SELECT slide_id, folder_path, rel_path, slide_index
+                FROM slide_origins
+                WHERE slide_id IN ({placeholders})
+            """
+            for slide_id, folder_path, rel_path, slide_index in self._execute_read_tuples(query, params):
+                origins[slide_id] = (str(Path(folder_path) / rel_path), slide_index)
+                
+        return origins
 
     def delete_elements_for_slide(self, slide_id: int) -> None:
         """
@@ -998,7 +1768,7 @@ class Database:
             VALUES (?, ?, ?, ?, ?, ?)
         """
         element_id = self._execute_write(query, (slide_id, element_type, bbox_x, bbox_y, bbox_w, bbox_h))
-        self.logger.debug(f"Added element {element_id} to slide {slide_id}")
+        self.logger.debug("Added element %s to slide %s", element_id, slide_id)
         return element_id
 
     def add_slide(self, file_id: int, slide_index: int, thumb_rel_path: str = None, 
@@ -1006,6 +1776,9 @@ class Database:
         """
         Adds a slide to the database.
         
+        A slide that already exists at the same file and index keeps its ID
+        and title and gets the new thumbnail and image paths.
+        
         Args:
             file_id: The file ID.
             slide_index: Index of the slide in the file.
@@ -1017,16 +1790,144 @@ class Database:
             The slide ID.
             
         Raises:
+            ValidationError: If the slide violates a schema constraint.
             DatabaseError: If the operation fails.
         """
+        # RETURNING gives the id on both paths; lastrowid isn't set by the update
         query = """
             INSERT INTO slides (file_id, slide_index, title, thumb_rel_path, image_rel_path)
             VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT(file_id, slide_index) DO UPDATE SET
+                thumb_rel_path = excluded.thumb_rel_path,
+                image_rel_path = excluded.image_rel_path
+            RETURNING id
         """
-        slide_id = self._execute_write(query, (file_id, slide_index, title, thumb_rel_path, image_rel_path))
-        self.logger.debug(f"Added slide {slide_id} with index {slide_index} to file {file_id}")
+        with self.write_batch() as conn:
+            try:
+                slide_id = conn.execute(
+                    query, (file_id, slide_index, title, thumb_rel_path, image_rel_path)
+                ).fetchone()[0]
+            except sqlite3.IntegrityError as e:
+                raise ValidationError(f"Data integrity error: {e}") from e
+            except sqlite3.Error as e:
+                self.logger.error(f"Database error adding slide {slide_index} to file {file_id}: {e}", exc_info=True)
+                raise DatabaseError(f"Failed to add slide: {e}") from e
+        self.logger.debug("Added slide %s with index %s to file %s", slide_id, slide_index, file_id)
         return slide_id
 
+    def add_files_bulk(self, rows: List[Tuple[int, str, str, str]]) -> List[int]:
+        """
+        Adds many file records in a single transaction.
+        
+        Args:
+            rows: (project_id, filename, rel_path, checksum) tuples.
+            
+        Returns:
+            The new file IDs, in the same order as rows.
+            
+        Raises:
+            DuplicateResourceError: If a file with the same path already exists in the project.
+            DatabaseError: If the operation fails.
+        """
+        rows = list(rows)
+        ids = {}
+        per_chunk = IN_CLAUSE_CHUNK_SIZE // 4
+        with self.write_batch() as conn:
+            try:
+                for start in range(0, len(rows), per_chunk):
+                    chunk = rows[start:start + per_chunk]
+                    values = ", ".join(["(?, ?, ?, ?)"] * len(chunk))
+                    # RETURNING row order is unspecified, so ids are matched back by key
+                    cursor = conn.execute(
+                        f"INSERT INTO files (project_id, filename, rel_path, checksum) VALUES {values} "
+                        "RETURNING id, project_id, rel_path",
+                        [value for row in chunk for value in row]
+                    )
+                    ids.update(((project_id, rel_path), file_id) for file_id, project_id, rel_path in cursor)
+            except sqlite3.IntegrityError as e:
+                if "UNIQUE constraint failed" in str(e):
+                    raise DuplicateResourceError("File", str(e)) from e
+                raise ValidationError(f"Data integrity error: {e}") from e
+            except sqlite3.Error as e:
+                self.logger.error(f"Database error adding {len(rows)} files: {e}", exc_info=True)
+                raise DatabaseError(f"Failed to add files: {e}") from e
+        
+        self.logger.debug(f"Added {len(rows)} files")
+        return [ids[(row[0], row[2])] for row in rows]
+
+    def add_slides_bulk(self, rows: List[Tuple[int, int, Optional[str], Optional[str]]]) -> List[int]:
+        """
+        Adds or updates many slides in a single transaction.
+        
+        A slide that already exists at the same file and index keeps its ID
+        and gets the new thumbnail and image paths.
+        
+        Args:
+            rows: (file_id, slide_index, thumb_rel_path, image_rel_path) tuples.
+            
+        Returns:
+            The slide IDs, in the same order as rows.
+            
+        Raises:
+            ValidationError: If a row violates a schema constraint.
+            DatabaseError: If the operation fails.
+        """
+        rows = list(rows)
+        ids = {}
+        per_chunk = IN_CLAUSE_CHUNK_SIZE // 4
+        with self.write_batch() as conn:
+            try:
+                for start in range(0, len(rows), per_chunk):
+                    chunk = rows[start:start + per_chunk]
+                    values = ", ".join(["(?, ?, ?, ?)"] * len(chunk))
+                    cursor = conn.execute(
+                        f"INSERT INTO slides (file_id, slide_index, thumb_rel_path, image_rel_path) VALUES {values} "
+                        "ON CONFLICT(file_id, slide_index) DO UPDATE SET "
+                        "thumb_rel_path = excluded.thumb_rel_path, image_rel_path = excluded.image_rel_path "
+                        "RETURNING id, file_id, slide_index",
+                        [value for row in chunk for value in row]
+                    )
+                    ids.update(((file_id, slide_index), slide_id) for slide_id, file_id, slide_index in cursor)
+            except sqlite3.IntegrityError as e:
+                raise ValidationError(f"Data integrity error: {e}") from e
+            except sqlite3.Error as e:
+                self.logger.error(f"Database error adding {len(rows)} slides: {e}", exc_info=True)
+                raise DatabaseError(f"Failed to add slides: {e}") from e
+        
+        self.logger.debug(f"Added {len(rows)} slides")
+        return [ids[(row[0], row[1])] for row in rows]
+
+    def add_elements_bulk(self, rows: List[Tuple[int, str, float, float, float, float]]) -> int:
+        """
+        Adds many elements in a single transaction.
+        
+        Args:
+            rows: (slide_id, element_type, bbox_x, bbox_y, bbox_w, bbox_h) tuples.
+            
+        Returns:
+            The number of elements added.
+            
+        Raises:
+            ValidationError: If a row violates a schema constraint.
+            DatabaseError: If the operation fails.
+        """
+        rows = list(rows)
+        with self.write_batch() as conn:
+            try:
+                conn.executemany(
+                    "INSERT INTO elements (slide_id, element_type, bbox_x, bbox_y, bbox_w, bbox_h) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    rows
+                )
+            except sqlite3.IntegrityError as e:
+                raise ValidationError(f"Data integrity error: {e}") from e
+            except sqlite3.Error as e:
+                self.logger.error(f"Database error adding {len(rows)} elements: {e}", exc_info=True)
+                raise DatabaseError(f"Failed to add elements: {e}") from e
+        
+        self.logger.debug(f"Added {len(rows)} elements")
+        return len(rows)
+
     def get_slides_for_file(self, file_id: int) -> List[Slide]:
         """
         Retrieves all slides for a given file.
@@ -1046,19 +1947,33 @@ class Database:
             WHERE file_id = ?
             ORDER BY slide_index
         """
-        results = self._execute_read(query, (file_id,))
+        results = self._execute_read_tuples(query, (file_id,))
         
-        slides = []
-        for row in results:
-            slides.append(Slide(
-                id=row['id'],
-                file_id=row['file_id'],
-                slide_index=row['slide_index'],
-                title=row['title'],
-                thumb_rel_path=row['thumb_rel_path'],
-                image_rel_path=row['image_rel_path']
-            ))
-        return slides
+        return [Slide.from_row(row) for row in results]
+
+    def get_slide_models_for_project(self, project_id: int) -> List[Slide]:
+        """
+        Retrieves the slides of every file in a project in one query.
+        
+        Args:
+            project_id: The project ID.
+            
+        Returns:
+            List of Slide objects, ordered by file name, then slide index.
+            
+        Raises:
+            DatabaseError: If the operation fails.
+        """
+        query = """
+            SELECT s.id, s.file_id, s.slide_index, s.title, s.thumb_rel_path, s.image_rel_path
+            FROM files f
+            JOIN slides s ON s.file_id = f.id
+            WHERE f.project_id = ?
+            ORDER BY f.filename, f.id, s.slide_index
+        """
+        results = self._execute_read_tuples(query, (project_id,))
+        
+        return [Slide.from_row(row) for row in results]
 
     def update_file_conversion_status(self, file_id: int, status: str) -> None:
         """
@@ -1089,26 +2004,15 @@ class Database:
             DatabaseError: If the operation fails.
         """
         query = """
-            SELECT id, project_id, filename, rel_path, checksum,
+            SELECT id, project_id, filename, rel_path, slide_count, checksum,
                    conversion_status, created_at
             FROM files
             WHERE project_id = ?
             ORDER BY filename
         """
-        results = self._execute_read(query, (project_id,))
-        
-        files = []
-        for row in results:
-            files.append(File(
-                id=row['id'],
-                project_id=row['project_id'],
-                filename=row['filename'],
-                rel_path=row['rel_path'],
-                checksum=row['checksum'],
-                conversion_status=row['conversion_status'],
-                created_at=row['created_at']
-            ))
-        return files
+        results = self._execute_read_tuples(query, (project_id,))
+        
+        return [File.from_row(row) for row in results]
 
     def get_project_id_by_path(self, project_path: str) -> Optional[int]:
         """
@@ -1124,11 +2028,7 @@ class Database:
             DatabaseError: If the operation fails.
         """
         query = "SELECT id FROM projects WHERE folder_path = ?"
-        results = self._execute_read(query, (project_path,))
-        
-        if results:
-            return results[0]['id']
-        return None
+        return self._fetchone_scalar(query, (project_path,))
 
     def rename_project(self, project_id: int, new_name: str) -> bool:
         """
@@ -1175,21 +2075,12 @@ class Database:
             WHERE f.project_id = ?
             ORDER BY f.filename, s.slide_index
         """
-        results = self._execute_read(query, (project_id,))
-        
-        slides = []
-        for row in results:
-            slides.append({
-                'id': row['id'],
-                'file_id': row['file_id'],
-                'slide_index': row['slide_index'],
-                'title': row['title'],
-                'thumb_rel_path': row['thumb_rel_path'],
-                'image_rel_path': row['image_rel_path'],
-                'filename': row['filename'],
-                'file_rel_path': row['rel_path']
-            })
-        return slides
+        results = self._execute_read_tuples(query, (project_id,))
+        
+        # Keys in the SELECT's column order; f.rel_path is exposed as file_rel_path
+        keys = ('id', 'file_id', 'slide_index', 'title', 'thumb_rel_path',
+                'image_rel_path', 'filename', 'file_rel_path')
+        return [dict(zip(keys, row)) for row in results]
 
     def get_slide_thumbnail_path(self, slide_id: int) -> Optional[str]:
         """
@@ -1205,11 +2096,7 @@ class Database:
             DatabaseError: If the operation fails.
         """
         query = "SELECT thumb_rel_path FROM slides WHERE id = ?"
-        results = self._execute_read(query, (slide_id,))
-        
-        if results and results[0]['thumb_rel_path']:
-            return results[0]['thumb_rel_path']
-        return None
+        return self._fetchone_scalar(query, (slide_id,)) or None
 
     def get_slide_image_path(self, slide_id: int) -> Optional[str]:
         """
@@ -1225,11 +2112,7 @@ class Database:
             DatabaseError: If the operation fails.
         """
         query = "SELECT image_rel_path FROM slides WHERE id = ?"
-        results = self._execute_read(query, (slide_id,))
-        
-        if results and results[0]['image_rel_path']:
-            return results[0]['image_rel_path']
-        return None
+        return self._fetchone_scalar(query, (slide_id,)) or None
 
     def get_project_folder_path_for_slide(self, slide_id: int) -> str:
         """
@@ -1245,19 +2128,36 @@ class Database:
             ResourceNotFoundError: If the slide is not found.
             DatabaseError: If the operation fails.
         """
-        query = """
-            SELECT p.folder_path
-            FROM slides s
-            JOIN files f ON s.file_id = f.id
-            JOIN projects p ON f.project_id = p.id
-            WHERE s.id = ?
-        """
-        results = self._execute_read(query, (slide_id,))
+        folder_path = self._fetchone_scalar(_SQL_PROJECT_FOLDER_FOR_SLIDE, (slide_id,))
         
-        if not results:
+        if folder_path is None:
             raise ResourceNotFoundError("Slide", slide_id)
             
-        return results[0]['folder_path']
+        return folder_path
+
+    def get_project_folder_paths_for_slides(self, slide_ids: List[int]) -> Dict[int, str]:
+        """
+        Retrieves the project folder paths for many slides at once.
+        
+        Args:
+            slide_ids: The slide IDs to look up.
+            
+        Returns:
+            Dictionary mapping slide ID to project folder path.
+            Slides that do not exist are omitted.
+            
+        Raises:
+            DatabaseError: If the operation fails.
+        """
+        unique_ids = list(dict.fromkeys(slide_ids))
+        folder_paths: Dict[int, str] = {}
+        
+        for start in range(0, len(unique_ids), IN_CLAUSE_CHUNK_SIZE):
+            placeholders, params = _in_clause(unique_ids[start:start + IN_CLAUSE_CHUNK_SIZE])
+            query = f"SELECT slide_id, folder_path FROM slide_origins WHERE slide_id IN ({placeholders})"
+            folder_paths.update(self._execute_read_tuples(query, params))
+            
+        return folder_paths
 
     def get_elements_for_slide(self, slide_id: int) -> List[Element]:
         """
@@ -1278,23 +2178,56 @@ class Database:
             WHERE slide_id = ?
             ORDER BY id
         """
-        results = self._execute_read(query, (slide_id,))
-        
-        elements = []
-        for row in results:
-            elements.append(Element(
-                id=row['id'],
-                slide_id=row['slide_id'],
-                element_type=row['element_type'],
-                bbox_x=row['bbox_x'],
-                bbox_y=row['bbox_y'],
-                bbox_w=row['bbox_w'],
-                bbox_h=row['bbox_h']
-            ))
-        return elements
+        results = self._execute_read_tuples(query, (slide_id,))
+        
+        return [Element.from_row(row) for row in results]
 
     # Keyword management methods
     
+    def bulk_ingest_keywords(self, rows: List[Tuple[str, str]]) -> int:
+        """
+        Inserts many keywords at once, skipping ones that already exist.
+        
+        Intended for large initial imports. Instead of letting the FTS insert
+        trigger fire once per row, the trigger is dropped, the rows are loaded
+        with a single executemany, and keywords_fts is rebuilt in one pass.
+        All of this happens in one transaction, so other connections never
+        see the index without its trigger.
+        
+        Args:
+            rows: (keyword, kind) pairs to insert. Rows that violate a
+                constraint (e.g. an unknown kind) are skipped like duplicates.
+            
+        Returns:
+            Number of keywords actually inserted.
+            
+        Raises:
+            DatabaseError: If the operation fails.
+        """
+        if not rows:
+            return 0
+            
+        insert_query = "INSERT OR IGNORE INTO keywords (keyword, kind) VALUES (?, ?)"
+        with self.write_batch() as conn:
+            try:
+                changes_before = conn.total_changes
+                if self._fts_available:
+                    conn.execute("DROP TRIGGER IF EXISTS keywords_ai;")
+                    conn.executemany(insert_query, rows)
+                    inserted = conn.total_changes - changes_before
+                    conn.execute(_KEYWORDS_AI_TRIGGER)
+                    if inserted:
+                        conn.execute("INSERT INTO keywords_fts(keywords_fts) VALUES('rebuild');")
+                else:
+                    conn.executemany(insert_query, rows)
+                    inserted = conn.total_changes - changes_before
+            except sqlite3.Error as e:
+                self.logger.error(f"Database error during bulk keyword ingest: {e}", exc_info=True)
+                raise DatabaseError(f"Failed to ingest keywords: {e}") from e
+                
+        self.logger.info(f"Bulk ingested {inserted} of {len(rows)} keywords")
+        return inserted
+    
     def add_keyword_if_not_exists(self, keyword: str, kind: str = 'generic') -> int:
         """
         Adds a keyword if it doesn't already exist.
@@ -1315,17 +2248,35 @@ class Database:
             
         keyword = keyword.strip()
         
-        # Check if keyword exists
-        query = "SELECT id FROM keywords WHERE keyword = ? AND kind = ?"
-        results = self._execute_read(query, (keyword, kind))
+        keyword_id = self._get_cached_keyword_id(keyword, kind)
+        if keyword_id is not None:
+            return keyword_id
         
-        if results:
-            return results[0]['id']
+        # Insert and look up in one write transaction, so a concurrent insert of
+        # the same keyword can't slip in between. DO NOTHING (rather than a
+        # no-op DO UPDATE) leaves existing rows and the FTS triggers untouched.
+        with self.write_batch() as conn:
+            try:
+                row = conn.execute(
+                    "INSERT INTO keywords (keyword, kind) VALUES (?, ?) "
+                    "ON CONFLICT(keyword, kind) DO NOTHING RETURNING id",
+                    (keyword, kind)
+                ).fetchone()
+                if row is not None:
+                    keyword_id = row[0]
+                    self.logger.debug("Added new keyword '%s' of kind '%s' with ID %s", keyword, kind, keyword_id)
+                else:
+                    keyword_id = conn.execute(
+                        "SELECT id FROM keywords WHERE keyword = ? AND kind = ?",
+                        (keyword, kind)
+                    ).fetchone()[0]
+            except sqlite3.IntegrityError as e:
+                raise ValidationError(f"Data integrity error: {e}") from e
+            except sqlite3.Error as e:
+                self.logger.error(f"Database error adding keyword '{keyword}': {e}", exc_info=True)
+                raise DatabaseError(f"Failed to add keyword: {e}") from e
         
-        # Add new keyword
-        insert_query = "INSERT INTO keywords (keyword, kind) VALUES (?, ?)"
-        keyword_id = self._execute_write(insert_query, (keyword, kind))
-        self.logger.debug(f"Added new keyword '{keyword}' of kind '{kind}' with ID {keyword_id}")
+        self._cache_keyword_id(keyword, kind, keyword_id)
         return keyword_id
 
     def get_keyword_id(self, keyword: str, kind: str = 'generic') -> Optional[int]:
@@ -1342,12 +2293,40 @@ class Database:
         Raises:
             DatabaseError: If the operation fails.
         """
-        query = "SELECT id FROM keywords WHERE keyword = ? AND kind = ?"
-        results = self._execute_read(query, (keyword, kind))
+        keyword_id = self._get_cached_keyword_id(keyword, kind)
+        if keyword_id is not None:
+            return keyword_id
         
-        if results:
-            return results[0]['id']
-        return None
+        query = "SELECT id FROM keywords WHERE keyword = ? AND kind = ?"
+        keyword_id = self._fetchone_scalar(query, (keyword, kind))
+        if keyword_id is not None:
+            self._cache_keyword_id(keyword, kind, keyword_id)
+        return keyword_id
+
+    def _get_cached_keyword_id(self, keyword: str, kind: str) -> Optional[int]:
+        """Return the remembered id for a keyword, or None on a cache miss."""
+        with self._keyword_id_cache_lock:
+            keyword_id = self._keyword_id_cache.get((keyword, kind))
+            if keyword_id is not None:
+                self._keyword_id_cache.move_to_end((keyword, kind))
+            return keyword_id
+
+    def _cache_keyword_id(self, keyword: str, kind: str, keyword_id: int) -> None:
+        """Remember a keyword's id, unless it may still be rolled back."""
+        # Inside write_batch() the row may be uncommitted
+        if getattr(self._local, 'batch_conn', None) is not None:
+            return
+        with self._keyword_id_cache_lock:
+            self._keyword_id_cache[(keyword, kind)] = keyword_id
+            self._keyword_id_cache.move_to_end((keyword, kind))
+            while len(self._keyword_id_cache) > KEYWORD_ID_CACHE_SIZE:
+                self._keyword_id_cache.popitem(last=False)
+
+    def _forget_keyword_id(self, keyword_id: int) -> None:
+        """Drop a deleted keyword from the id cache."""
+        with self._keyword_id_cache_lock:
+            for key in [key for key, cached_id in self._keyword_id_cache.items() if cached_id == keyword_id]:
+                del self._keyword_id_cache[key]
 
     def get_all_keywords_by_kind(self, kind: str) -> List[Keyword]:
         """
@@ -1368,16 +2347,9 @@ class Database:
             WHERE kind = ?
             ORDER BY keyword COLLATE NOCASE
         """
-        results = self._execute_read(query, (kind,))
+        results = self._execute_read_tuples(query, (kind,))
         
-        keywords = []
-        for row in results:
-            keywords.append(Keyword(
-                id=row['id'],
-                keyword=row['keyword'],
-                kind=row['kind']
-            ))
-        return keywords
+        return [Keyword.from_row(row) for row in results]
 
     def get_all_keyword_objects(self) -> List[Keyword]:
         """
@@ -1394,16 +2366,9 @@ class Database:
             FROM keywords
             ORDER BY kind, keyword COLLATE NOCASE
         """
-        results = self._execute_read(query)
+        results = self._execute_read_tuples(query)
         
-        keywords = []
-        for row in results:
-            keywords.append(Keyword(
-                id=row['id'],
-                keyword=row['keyword'],
-                kind=row['kind']
-            ))
-        return keywords
+        return [Keyword.from_row(row) for row in results]
 
     def get_all_keyword_strings(self, kind: str = None) -> List[str]:
         """
@@ -1420,19 +2385,29 @@ class Database:
         """
         if kind:
             query = "SELECT DISTINCT keyword FROM keywords WHERE kind = ? ORDER BY keyword COLLATE NOCASE"
-            results = self._execute_read(query, (kind,))
+            results = self._execute_read_tuples(query, (kind,))
         else:
             query = "SELECT DISTINCT keyword FROM keywords ORDER BY keyword COLLATE NOCASE"
-            results = self._execute_read(query)
+            results = self._execute_read_tuples(query)
         
-        return [row['keyword'] for row in results]
+        return [row[0] for row in results]
 
-    def search_keywords(self, query: str, project_id: int = None) -> List[Keyword]:
+    def search_keywords(self, query: str, kind: Optional[str] = None,
+                        project_id: Optional[int] = None) -> List[Keyword]:
         """
         Searches for keywords matching the query.
         
+        Matches keywords containing the query anywhere, case-insensitively.
+        The substring LIKE is answered by the trigram keywords_fts index and
+        joined back to keywords on rowid, so SQLite drives the lookup from
+        the index rather than scanning keywords (queries shorter than three
+        characters scan the index instead). If FTS5 is unavailable the same
+        LIKE runs directly on keywords. FTS availability is determined once
+        when the schema is initialized rather than probed per search.
+        
         Args:
             query: The search query.
+            kind: Optional keyword type to filter by.
             project_id: Optional project ID to filter by.
             
         Returns:
@@ -1443,46 +2418,66 @@ class Database:
         """
         if not query:
             return []
-            
-        # Use LIKE for simple pattern matching
-        search_pattern = f"%{query}%"
         
+        filters = ""
+        filter_params: list = []
+        if kind:
+            filters += " AND k.kind = ?"
+            filter_params.append(kind)
         if project_id is not None:
-            sql = """
-                SELECT DISTINCT k.id, k.keyword, k.kind
-                FROM keywords k
-                WHERE k.keyword LIKE ?
-                AND k.id IN (
-                    SELECT keyword_id FROM slide_keywords sk
-                    JOIN slides s ON sk.slide_id = s.id
-                    JOIN files f ON s.file_id = f.id
-                    WHERE f.project_id = ?
-                    UNION
-                    SELECT keyword_id FROM element_keywords ek
-                    JOIN elements e ON ek.element_id = e.id
-                    JOIN slides s ON e.slide_id = s.id
-                    JOIN files f ON s.file_id = f.id
-                    WHERE f.project_id = ?
+            filters += """
+                AND EXISTS (
+                    SELECT 1 FROM keyword_projects kp
+                    WHERE kp.project_id = ? AND kp.keyword_id = k.id
                 )
-                ORDER BY k.keyword COLLATE NOCASE
-            """
-            results = self._execute_read(sql, (search_pattern, project_id, project_id))
-        else:
-            sql = """
-                SELECT id, keyword, kind
-                FROM keywords
-                WHERE keyword LIKE ?
-                ORDER BY keyword COLLATE NOCASE
             """
-            results = self._execute_read(sql, (search_pattern,))
+            filter_params.append(project_id)
+        
+        pattern = f"%{query}%"
+        select_sql = """
+            SELECT k.id, k.keyword, k.kind
+            FROM keywords k
+            WHERE {match}
+            {filters}
+            ORDER BY k.keyword COLLATE NOCASE
+        """
+        fts_match = "k.id IN (SELECT rowid FROM keywords_fts WHERE keywords_fts.keyword LIKE ?)"
+        like_match = "k.keyword LIKE ?"
         
         keywords = []
-        for row in results:
-            keywords.append(Keyword(
-                id=row['id'],
-                keyword=row['keyword'],
-                kind=row['kind']
-            ))
+        with self.get_connection() as conn:
+            # Plain tuples are enough here and skip building sqlite3.Row objects
+            cursor = conn.cursor()
+            cursor.row_factory = None
+            try:
+                executed = False
+                if self._fts_available:
+                    try:
+                        cursor.execute(select_sql.format(match=fts_match, filters=filters),
+                                       (pattern, *filter_params))
+                        executed = True
+                    except sqlite3.OperationalError as e:
+                        # Only a missing FTS5 module or index turns FTS off for
+                        # the session; lock and busy errors are transient and
+                        # surface as DatabaseError below
+                        if not _is_fts_unavailable_error(e):
+                            raise
+                        self._fts_available = False
+                        self.logger.warning(f"FTS keyword search failed, falling back to LIKE: {e}")
+                if not executed:
+                    cursor.execute(select_sql.format(match=like_match, filters=filters),
+                                   (pattern, *filter_params))
+                
+                while True:
+                    batch = cursor.fetchmany(256)
+                    if not batch:
+                        break
+                    keywords.extend(
+                        Keyword.from_row(row) for row in batch
+                    )
+            except sqlite3.Error as e:
+                self.logger.error(f"Database error searching keywords for '{query}': {e}", exc_info=True)
+                raise DatabaseError(f"Failed to search keywords: {e}") from e
         return keywords
 
     def merge_keywords(self, source_id: int, target_id: int) -> bool:
@@ -1497,47 +2492,118 @@ class Database:
             True if successful.
             
         Raises:
-            ValidationError: If source and target are the same.
+            ValidationError: If source and target are the same or of different kinds.
             ResourceNotFoundError: If either keyword is not found.
             DatabaseError: If the operation fails.
         """
         if source_id == target_id:
             raise ValidationError("Cannot merge keyword with itself")
         
-        # Verify both keywords exist
-        source_query = "SELECT keyword FROM keywords WHERE id = ?"
-        target_query = "SELECT keyword FROM keywords WHERE id = ?"
+        with self.write_batch() as conn:
+            self._merge_keyword_into(conn, source_id, target_id)
+        self._forget_keyword_id(source_id)
         
-        source_results = self._execute_read(source_query, (source_id,))
-        if not source_results:
-            raise ResourceNotFoundError("Source keyword", source_id)
-            
-        target_results = self._execute_read(target_query, (target_id,))
-        if not target_results:
-            raise ResourceNotFoundError("Target keyword", target_id)
-        
-        # Update slide keywords
-        update_slide_keywords = """
-            UPDATE OR REPLACE slide_keywords 
-            SET keyword_id = ? 
-            WHERE keyword_id = ?
+        self.logger.info(f"Merged keyword {source_id} into {target_id}")
+        return True
+
+    def merge_keywords_bulk(self, pairs: List[Tuple[int, int]]) -> int:
         """
-        self._execute_write(update_slide_keywords, (target_id, source_id))
+        Merges many keyword pairs in one transaction.
         
-        # Update element keywords
-        update_element_keywords = """
-            UPDATE OR REPLACE element_keywords 
-            SET keyword_id = ? 
-            WHERE keyword_id = ?
+        Pairs are applied in order, exactly as consecutive merge_keywords()
+        calls would be, so chains like (a, b), (b, c) end up on c. If any pair
+        fails, none of them are applied.
+        
+        Args:
+            pairs: (source_id, target_id) tuples.
+            
+        Returns:
+            The number of keywords merged away.
+            
+        Raises:
+            ValidationError: If a pair merges a keyword with itself or with
+                one of another kind.
+            ResourceNotFoundError: If a keyword is not found when its pair is applied.
+            DatabaseError: If the operation fails.
         """
-        self._execute_write(update_element_keywords, (target_id, source_id))
+        for source_id, target_id in pairs:
+            if source_id == target_id:
+                raise ValidationError("Cannot merge keyword with itself")
+        if not pairs:
+            return 0
         
-        # Delete source keyword
-        delete_query = "DELETE FROM keywords WHERE id = ?"
-        self._execute_write(delete_query, (source_id,))
+        with self.write_batch() as conn:
+            for source_id, target_id in pairs:
+                self._merge_keyword_into(conn, source_id, target_id)
+        for source_id, _ in pairs:
+            self._forget_keyword_id(source_id)
         
-        self.logger.info(f"Merged keyword {source_id} into {target_id}")
-        return True
+        self.logger.info(f"Merged {len(pairs)} keyword pairs")
+        return len(pairs)
+
+    def _merge_keyword_into(self, conn: sqlite3.Connection, source_id: int, target_id: int) -> None:
+        """
+        Moves one keyword's links onto another and deletes it, inside a batch.
+        
+        Args:
+            conn: The write_batch() connection.
+            source_id: The keyword ID to merge from.
+            target_id: The keyword ID to merge into.
+            
+        Raises:
+            ResourceNotFoundError: If either keyword is not found.
+            ValidationError: If the keywords are of different kinds.
+            DatabaseError: If the operation fails.
+        """
+        # Copy the source's links onto the target (skipping ones it already
+        # has), then delete the source, whose remaining links go with it
+        # through ON DELETE CASCADE. UPDATE OR REPLACE on the links would
+        # write each row once, but it runs the keyword_projects UPDATE
+        # triggers (insert plus cleanup) per row and measured several times
+        # slower. The savepoint keeps a failed merge from leaving half its
+        # writes in an enclosing batch that carries on.
+        try:
+            conn.execute("SAVEPOINT merge_kw")
+            try:
+                # Both lookups in one statement; it always returns a row, with
+                # NULL for a missing keyword
+                source_kind, target_kind = conn.execute(
+                    "SELECT (SELECT kind FROM keywords WHERE id = ?), "
+                    "(SELECT kind FROM keywords WHERE id = ?)",
+                    (source_id, target_id)
+                ).fetchone()
+                if source_kind is None:
+                    raise ResourceNotFoundError("Source keyword", source_id)
+                if target_kind is None:
+                    raise ResourceNotFoundError("Target keyword", target_id)
+                if source_kind != target_kind:
+                    raise ValidationError(
+                        f"Cannot merge a '{source_kind}' keyword into a '{target_kind}' keyword"
+                    )
+                
+                conn.execute(
+                    """
+                    INSERT OR IGNORE INTO slide_keywords (slide_id, keyword_id)
+                    SELECT slide_id, ? FROM slide_keywords WHERE keyword_id = ?
+                    """,
+                    (target_id, source_id)
+                )
+                conn.execute(
+                    """
+                    INSERT OR IGNORE INTO element_keywords (element_id, keyword_id)
+                    SELECT element_id, ? FROM element_keywords WHERE keyword_id = ?
+                    """,
+                    (target_id, source_id)
+                )
+                conn.execute("DELETE FROM keywords WHERE id = ?", (source_id,))
+            except BaseException:
+                conn.execute("ROLLBACK TO merge_kw")
+                raise
+            finally:
+                conn.execute("RELEASE merge_kw")
+        except sqlite3.Error as e:
+            self.logger.error(f"Database error merging keyword {source_id} into {target_id}: {e}", exc_info=True)
+            raise DatabaseError(f"Failed to merge keywords: {e}") from e
 
     # Slide-keyword linking methods
     
@@ -1555,18 +2621,10 @@ class Database:
         Raises:
             DatabaseError: If the operation fails.
         """
-        # Check if link already exists
-        check_query = "SELECT 1 FROM slide_keywords WHERE slide_id = ? AND keyword_id = ?"
-        results = self._execute_read(check_query, (slide_id, keyword_id))
-        
-        if results:
-            self.logger.debug(f"Link between slide {slide_id} and keyword {keyword_id} already exists")
-            return True
-        
-        # Create new link
-        insert_query = "INSERT INTO slide_keywords (slide_id, keyword_id) VALUES (?, ?)"
+        # The primary key makes an existing link a no-op, so no lookup is needed first
+        insert_query = "INSERT OR IGNORE INTO slide_keywords (slide_id, keyword_id) VALUES (?, ?)"
         self._execute_write(insert_query, (slide_id, keyword_id))
-        self.logger.debug(f"Linked keyword {keyword_id} to slide {slide_id}")
+        self.logger.debug("Linked keyword %s to slide %s", keyword_id, slide_id)
         return True
 
     def unlink_slide_keyword(self, slide_id: int, keyword_id: int) -> bool:
@@ -1585,7 +2643,7 @@ class Database:
         """
         query = "DELETE FROM slide_keywords WHERE slide_id = ? AND keyword_id = ?"
         self._execute_write(query, (slide_id, keyword_id))
-        self.logger.debug(f"Unlinked keyword {keyword_id} from slide {slide_id}")
+        self.logger.debug("Unlinked keyword %s from slide %s", keyword_id, slide_id)
         return True
 
     def get_keywords_for_slide(self, slide_id: int, kind: str = None) -> List[Keyword]:
@@ -1610,7 +2668,7 @@ class Database:
                 WHERE sk.slide_id = ? AND k.kind = ?
                 ORDER BY k.keyword COLLATE NOCASE
             """
-            results = self._execute_read(query, (slide_id, kind))
+            results = self._execute_read_tuples(query, (slide_id, kind))
         else:
             query = """
                 SELECT k.id, k.keyword, k.kind
@@ -1619,16 +2677,9 @@ class Database:
                 WHERE sk.slide_id = ?
                 ORDER BY k.kind, k.keyword COLLATE NOCASE
             """
-            results = self._execute_read(query, (slide_id,))
+            results = self._execute_read_tuples(query, (slide_id,))
         
-        keywords = []
-        for row in results:
-            keywords.append(Keyword(
-                id=row['id'],
-                keyword=row['keyword'],
-                kind=row['kind']
-            ))
-        return keywords
+        return [Keyword.from_row(row) for row in results]
 
     def replace_slide_keywords(self, slide_id: int, kind: str, keyword_texts: List[str]) -> bool:
         """
@@ -1643,22 +2694,61 @@ class Database:
             True if successful.
             
         Raises:
+            ValidationError: If kind is not a valid keyword type.
             DatabaseError: If the operation fails.
         """
-        # Remove existing keywords of this kind
-        delete_query = """
-            DELETE FROM slide_keywords
-            WHERE slide_id = ? AND keyword_id IN (
-                SELECT id FROM keywords WHERE kind = ?
-            )
-        """
-        self._execute_write(delete_query, (slide_id, kind))
+        texts = list(dict.fromkeys(
+            text.strip() for text in keyword_texts if text and text.strip()
+        ))
         
-        # Add new keywords
-        for keyword_text in keyword_texts:
-            if keyword_text and keyword_text.strip():
-                keyword_id = self.add_keyword_if_not_exists(keyword_text.strip(), kind)
-                self.link_slide_keyword(slide_id, keyword_id)
+        # The new set lives in a VALUES list, so the diff against the current
+        # links happens in SQL; only the links that actually change are written.
+        # SQLite 3.32+ allows 32766 bound variables, far more than a tag list.
+        if texts:
+            new_keywords = "VALUES " + ", ".join(["(?)"] * len(texts))
+        else:
+            new_keywords = "SELECT NULL WHERE 0"
+        with self.write_batch() as conn:
+            try:
+                # "WHERE true" keeps the parser from reading ON CONFLICT as a join
+                conn.execute(
+                    f"""
+                    WITH new_keywords(keyword) AS ({new_keywords})
+                    INSERT INTO keywords (keyword, kind)
+                    SELECT keyword, ? FROM new_keywords WHERE true
+                    ON CONFLICT(keyword, kind) DO NOTHING
+                    """,
+                    (*texts, kind)
+                )
+                conn.execute(
+                    f"""
+                    WITH new_keywords(keyword) AS ({new_keywords})
+                    DELETE FROM slide_keywords
+                    WHERE slide_id = ? AND keyword_id IN (
+                        SELECT sk.keyword_id
+                        FROM slide_keywords sk
+                        JOIN keywords k ON sk.keyword_id = k.id
+                        WHERE sk.slide_id = ? AND k.kind = ?
+                          AND k.keyword NOT IN (SELECT keyword FROM new_keywords)
+                    )
+                    """,
+                    (*texts, slide_id, slide_id, kind)
+                )
+                conn.execute(
+                    f"""
+                    WITH new_keywords(keyword) AS ({new_keywords})
+                    INSERT OR IGNORE INTO slide_keywords (slide_id, keyword_id)
+                    SELECT ?, k.id
+                    FROM new_keywords n
+                    JOIN keywords k ON k.keyword = n.keyword AND k.kind = ?
+                    """,
+                    (*texts, slide_id, kind)
+                )
+            except sqlite3.IntegrityError as e:
+                raise ValidationError(f"Data integrity error: {e}") from e
+            except sqlite3.Error as e:
+                self.logger.error(f"Database error replacing keywords for slide {slide_id}: {e}", exc_info=True)
+                raise DatabaseError(f"Failed to replace slide keywords: {e}") from e
         
         self.logger.debug(f"Replaced {kind} keywords for slide {slide_id}")
         return True
@@ -1680,6 +2770,22 @@ class Database:
             self.logger.error(f"Failed to get slide count for project {project_id}: {e}")
             return 0
             
+    def get_completed_slide_count_for_project(self, project_id: int) -> int:
+        """Get the number of slides in a project's files whose conversion has completed."""
+        try:
+            return self._fetchone_scalar(
+                """
+                SELECT COUNT(*)
+                FROM files f
+                JOIN slides s ON s.file_id = f.id
+                WHERE f.project_id = ? AND f.conversion_status = 'Completed'
+                """,
+                (project_id,)
+            )
+        except Exception as e:
+            self.logger.error(f"Failed to get completed slide count for project {project_id}: {e}")
+            return 0
+            
     def get_file_count_for_project(self, project_id: int) -> int:
         """Get the total number of files for a project."""
         try:
@@ -1692,6 +2798,16 @@ class Database:
             self.logger.error(f"Failed to get file count for project {project_id}: {e}")
             return 0
             
+    def get_keyword_count_for_project(self, project_id: int) -> int:
+        """Get the number of distinct keywords used on a project's slides and elements."""
+        try:
+            return self._fetchone_scalar(
+                "SELECT COUNT(*) FROM keyword_projects WHERE project_id = ?", (project_id,)
+            )
+        except Exception as e:
+            self.logger.error(f"Failed to get keyword count for project {project_id}: {e}")
+            return 0
+            
     def get_keywords_for_project(self, project_id: int) -> List[Keyword]:
         """Get all keywords used in a project."""
         try:
@@ -1728,12 +2844,13 @@ class Database:
         """Get a slide by its ID. Alias for get_slide method."""
         return self.get_slide(slide_id)
 
-    def get_slides_for_keyword(self, keyword_id: int) -> List[Slide]:
+    def get_slides_for_keyword(self, keyword_id: int, project_id: Optional[int] = None) -> List[Slide]:
         """
         Retrieves all slides associated with a keyword.
         
         Args:
             keyword_id: The keyword ID.
+            project_id: If given, only slides from this project's files.
             
         Returns:
             List of Slide objects.
@@ -1741,27 +2858,33 @@ class Database:
         Raises:
             DatabaseError: If the operation fails.
         """
-        query = """
-            SELECT s.id, s.file_id, s.slide_index, s.title, 
-                   s.thumb_rel_path, s.image_rel_path
-            FROM slides s
-            JOIN slide_keywords sk ON s.id = sk.slide_id
-            WHERE sk.keyword_id = ?
-            ORDER BY s.file_id, s.slide_index
-        """
-        results = self._execute_read(query, (keyword_id,))
-        
-        slides = []
-        for row in results:
-            slides.append(Slide(
-                id=row['id'],
-                file_id=row['file_id'],
-                slide_index=row['slide_index'],
-                title=row['title'],
-                thumb_rel_path=row['thumb_rel_path'],
-                image_rel_path=row['image_rel_path']
-            ))
-        return slides
+        if project_id is None:
+            results = self._execute_read_tuples(_SQL_SLIDES_FOR_KEYWORD, (keyword_id,))
+        else:
+            results = self._execute_read_tuples(
+                _SQL_SLIDES_FOR_KEYWORD_IN_PROJECT, (keyword_id, project_id)
+            )
+        
+        return [Slide.from_row(row) for row in results]
+
+    def get_slide_ids_for_keyword(self, keyword_id: int) -> List[int]:
+        """
+        Retrieves the IDs of all slides associated with a keyword.
+        
+        For callers that only match slides by ID: the lookup is answered from
+        the slide_keywords index alone and builds no Slide objects.
+        
+        Args:
+            keyword_id: The keyword ID.
+            
+        Returns:
+            List of slide IDs.
+            
+        Raises:
+            DatabaseError: If the operation fails.
+        """
+        query = "SELECT slide_id FROM slide_keywords WHERE keyword_id = ?"
+        return [row[0] for row in self._execute_read_tuples(query, (keyword_id,))]
 
     # Element-keyword linking methods
     
@@ -1779,18 +2902,10 @@ class Database:
         Raises:
             DatabaseError: If the operation fails.
         """
-        # Check if link already exists
-        check_query = "SELECT 1 FROM element_keywords WHERE element_id = ? AND keyword_id = ?"
-        results = self._execute_read(check_query, (element_id, keyword_id))
-        
-        if results:
-            self.logger.debug(f"Link between element {element_id} and keyword {keyword_id} already exists")
-            return True
-        
-        # Create new link
-        insert_query = "INSERT INTO element_keywords (element_id, keyword_id) VALUES (?, ?)"
+        # The primary key makes an existing link a no-op, so no lookup is needed first
+        insert_query = "INSERT OR IGNORE INTO element_keywords (element_id, keyword_id) VALUES (?, ?)"
         self._execute_write(insert_query, (element_id, keyword_id))
-        self.logger.debug(f"Linked keyword {keyword_id} to element {element_id}")
+        self.logger.debug("Linked keyword %s to element %s", keyword_id, element_id)
         return True
 
     def unlink_element_keyword(self, element_id: int, keyword_id: int) -> bool:
@@ -1809,7 +2924,7 @@ class Database:
         """
         query = "DELETE FROM element_keywords WHERE element_id = ? AND keyword_id = ?"
         self._execute_write(query, (element_id, keyword_id))
-        self.logger.debug(f"Unlinked keyword {keyword_id} from element {element_id}")
+        self.logger.debug("Unlinked keyword %s from element %s", keyword_id, element_id)
         return True
 
     def get_keywords_for_element(self, element_id: int) -> List[Keyword]:
@@ -1832,13 +2947,6 @@ class Database:
             WHERE ek.element_id = ?
             ORDER BY k.kind, k.keyword COLLATE NOCASE
         """
-        results = self._execute_read(query, (element_id,))
+        results = self._execute_read_tuples(query, (element_id,))
         
-        keywords = []
-        for row in results:
-            keywords.append(Keyword(
-                id=row['id'],
-                keyword=row['keyword'],
-                kind=row['kind']
-            ))
-        return keywords
\ No newline at end of file
+        return [Keyword.from_row(row) for row in results]
\ No newline at end of file
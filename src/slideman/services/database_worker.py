@@ -11,11 +11,27 @@ import sqlite3
 import threading
 import logging
 from pathlib import Path
-from typing import Optional, List, Tuple
+from typing import Optional, List, Tuple, Dict
 from contextlib import contextmanager
 
+from .database import IN_CLAUSE_CHUNK_SIZE, _ORIGIN_PATH_SQL, _SQL_PATH_JOIN, _in_clause
 from .exceptions import DatabaseError, ConnectionError
 
+# Hot-path statements share one SQL string so sqlite3's per-connection
+# statement cache compiles each of them only once. Re-converting a file
+# rewrites its slides in place, keeping their ids.
+_SLIDE_INSERT_SQL = (
+    "INSERT INTO slides (file_id, slide_index, thumb_rel_path, image_rel_path) "
+    "VALUES (?, ?, ?, ?) "
+    "ON CONFLICT(file_id, slide_index) DO UPDATE SET "
+    "thumb_rel_path = excluded.thumb_rel_path, image_rel_path = excluded.image_rel_path "
+    "RETURNING id"
+)
+_ELEMENT_INSERT_SQL = (
+    "INSERT INTO elements (slide_id, element_type, bbox_x, bbox_y, bbox_w, bbox_h) "
+    "VALUES (?, ?, ?, ?, ?, ?)"
+)
+
 
 class DatabaseWorker:
     """
@@ -48,11 +64,26 @@ class DatabaseWorker:
         """
         if not hasattr(self._local, 'conn') or self._local.conn is None:
             try:
-                self._local.conn = sqlite3.connect(self.db_path)
-                self._local.conn.row_factory = sqlite3.Row
-                self._local.conn.execute("PRAGMA foreign_keys = ON;")
-                self._local.conn.execute("PRAGMA journal_mode = WAL;")
-                self._local.conn.execute("PRAGMA busy_timeout = 5000;")
+                conn = sqlite3.connect(self.db_path, cached_statements=256)
+                conn.row_factory = sqlite3.Row
+                # One-shot pragmas run as a script so they stay out of the
+                # statement cache, which is reserved for the hot queries
+                conn.executescript(
+                    "PRAGMA foreign_keys = ON;"
+                    # Parallel converters wait for the writer instead of failing
+                    "PRAGMA busy_timeout = 30000;"
+                    "PRAGMA synchronous = NORMAL;"
+                    "PRAGMA temp_store = MEMORY;"
+                    "PRAGMA cache_size = -20000;"  # ~20 MB per thread
+                )
+                # WAL and mmap only apply to on-disk databases
+                if str(self.db_path) != ":memory:":
+                    conn.executescript(
+                        "PRAGMA journal_mode = WAL;"
+                        "PRAGMA mmap_size = 268435456;"  # 256 MB
+                        "PRAGMA journal_size_limit = 6144000;"  # Trim the WAL after checkpoints
+                    )
+                self._local.conn = conn
                 self.logger.debug(f"Created new database connection for thread {threading.current_thread().name}")
             except sqlite3.Error as e:
                 raise ConnectionError(f"Failed to create worker database connection: {e}") from e
@@ -85,6 +116,26 @@ class DatabaseWorker:
             finally:
                 self._local.conn = None
     
+    @contextmanager
+    def transaction(self):
+        """
+        Context manager running the enclosed statements in one transaction.
+        
+        Takes the write lock up front (BEGIN IMMEDIATE) and commits once on
+        exit, or rolls back if an exception escapes.
+        
+        Yields:
+            Database connection for the current thread.
+        """
+        with self.connection() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+    
     # Slide conversion specific methods
     
     def update_file_conversion_status(self, file_id: int, status: str) -> None:
@@ -111,6 +162,44 @@ class DatabaseWorker:
                 conn.rollback()
                 raise DatabaseError(f"Failed to update conversion status: {e}") from e
     
+    def delete_slides_after(self, file_id: int, slide_count: int,
+                            status: Optional[str] = None) -> int:
+        """
+        Delete the slides of a file beyond its current slide count.
+        
+        Re-converting a deck that lost slides rewrites the remaining ones in
+        place, so the rows past the new end are left over from the previous
+        conversion.
+        
+        Args:
+            file_id: ID of the file.
+            slide_count: Number of slides the file has now.
+            status: Conversion status to set in the same transaction, if any.
+            
+        Returns:
+            Number of slides deleted.
+            
+        Raises:
+            DatabaseError: If the update fails; nothing is written in that case.
+        """
+        try:
+            with self.transaction() as conn:
+                deleted = conn.execute(
+                    "DELETE FROM slides WHERE file_id = ? AND slide_index > ?",
+                    (file_id, slide_count)
+                ).rowcount
+                if status is not None:
+                    conn.execute(
+                        "UPDATE files SET conversion_status = ? WHERE id = ?",
+                        (status, file_id)
+                    )
+            self.logger.debug(
+                f"Deleted {deleted} slides after index {slide_count} for file {file_id}"
+            )
+            return deleted
+        except sqlite3.Error as e:
+            raise DatabaseError(f"Failed to delete stale slides: {e}") from e
+    
     def update_file_slide_count(self, file_id: int, slide_count: int) -> None:
         """
         Update the slide count for a file.
@@ -135,6 +224,78 @@ class DatabaseWorker:
                 conn.rollback()
                 raise DatabaseError(f"Failed to update slide count: {e}") from e
     
+    def get_file_fingerprint(self, file_id: int) -> Optional[str]:
+        """
+        Get the source fingerprint recorded by the file's last complete conversion.
+        
+        Args:
+            file_id: ID of the file.
+            
+        Returns:
+            The fingerprint, or None if the file isn't marked Completed or
+            has no fingerprint.
+            
+        Raises:
+            DatabaseError: If query fails.
+        """
+        with self.connection() as conn:
+            try:
+                row = conn.execute(
+                    """SELECT source_fingerprint FROM files
+                       WHERE id = ? AND conversion_status = 'Completed'""",
+                    (file_id,)
+                ).fetchone()
+                return row[0] if row else None
+            except sqlite3.Error as e:
+                raise DatabaseError(f"Failed to get file fingerprint: {e}") from e
+    
+    def set_file_fingerprint(self, file_id: int, fingerprint: Optional[str]) -> None:
+        """
+        Record the source fingerprint for a file.
+        
+        Args:
+            file_id: ID of the file to update.
+            fingerprint: Fingerprint of the converted source, or None to clear it.
+            
+        Raises:
+            DatabaseError: If update fails.
+        """
+        with self.connection() as conn:
+            try:
+                conn.execute(
+                    "UPDATE files SET source_fingerprint = ? WHERE id = ?",
+                    (fingerprint, file_id)
+                )
+                conn.commit()
+                self.logger.debug(f"Updated file {file_id} fingerprint to {fingerprint}")
+            except sqlite3.Error as e:
+                conn.rollback()
+                raise DatabaseError(f"Failed to update file fingerprint: {e}") from e
+    
+    def get_slide_paths_for_file(self, file_id: int) -> List[Tuple[Optional[str], Optional[str]]]:
+        """
+        Get the image and thumbnail paths of every slide of a file.
+        
+        Args:
+            file_id: ID of the file.
+            
+        Returns:
+            (image_rel_path, thumb_rel_path) tuples ordered by slide index.
+            
+        Raises:
+            DatabaseError: If query fails.
+        """
+        with self.connection() as conn:
+            try:
+                rows = conn.execute(
+                    """SELECT image_rel_path, thumb_rel_path FROM slides
+                       WHERE file_id = ? ORDER BY slide_index""",
+                    (file_id,)
+                ).fetchall()
+                return [(row[0], row[1]) for row in rows]
+            except sqlite3.Error as e:
+                raise DatabaseError(f"Failed to get slide paths: {e}") from e
+    
     def add_slide_with_paths(self, file_id: int, slide_index: int, 
                            thumb_rel_path: Optional[str] = None,
                            image_rel_path: Optional[str] = None) -> int:
@@ -148,35 +309,105 @@ class DatabaseWorker:
             image_rel_path: Relative path to full-size image.
             
         Returns:
-            ID of the newly created slide record.
+            ID of the slide record, reused if the slide already existed.
             
         Raises:
             DatabaseError: If insertion fails.
         """
         with self.connection() as conn:
             try:
-                cursor = conn.cursor()
-                cursor.execute(
-                    """INSERT INTO slides (file_id, slide_index, thumb_rel_path, image_rel_path) 
-                       VALUES (?, ?, ?, ?)""",
+                slide_id = conn.execute(
+                    _SLIDE_INSERT_SQL,
                     (file_id, slide_index, thumb_rel_path, image_rel_path)
-                )
+                ).fetchone()[0]
                 conn.commit()
-                slide_id = cursor.lastrowid
-                self.logger.debug(f"Added slide {slide_index} for file {file_id} with ID {slide_id}")
+                self.logger.debug("Added slide %s for file %s with ID %s", slide_index, file_id, slide_id)
                 return slide_id
             except sqlite3.Error as e:
                 conn.rollback()
                 raise DatabaseError(f"Failed to add slide: {e}") from e
     
-    def add_element(self, slide_id: int, element_type: str, content: str) -> int:
+    def add_slide_with_elements(self, file_id: int, slide_index: int,
+                                thumb_rel_path: Optional[str],
+                                image_rel_path: Optional[str],
+                                elements: List[Tuple[str, float, float, float, float]]) -> int:
+        """
+        Add a slide record and all of its elements in a single transaction.
+        
+        Args:
+            file_id: ID of the file this slide belongs to.
+            slide_index: 1-based index of the slide within the file.
+            thumb_rel_path: Relative path to thumbnail image.
+            image_rel_path: Relative path to full-size image.
+            elements: (element_type, bbox_x, bbox_y, bbox_w, bbox_h) tuples,
+                with the bounding box in EMU.
+            
+        Returns:
+            ID of the newly created slide record.
+            
+        Raises:
+            DatabaseError: If insertion fails; nothing is written in that case.
+        """
+        try:
+            with self.transaction() as conn:
+                slide_id = conn.execute(
+                    _SLIDE_INSERT_SQL,
+                    (file_id, slide_index, thumb_rel_path, image_rel_path)
+                ).fetchone()[0]
+                # Elements from an earlier conversion of this slide are replaced
+                conn.execute("DELETE FROM elements WHERE slide_id = ?", (slide_id,))
+                if elements:
+                    conn.executemany(
+                        _ELEMENT_INSERT_SQL,
+                        [(slide_id, *element) for element in elements]
+                    )
+            self.logger.debug(
+                f"Added slide {slide_index} for file {file_id} with ID {slide_id} "
+                f"and {len(elements)} elements"
+            )
+            return slide_id
+        except sqlite3.Error as e:
+            raise DatabaseError(f"Failed to add slide with elements: {e}") from e
+    
+    def add_elements_bulk(self, rows: List[Tuple[int, str, float, float, float, float]]) -> int:
         """
-        Add an element to a slide.
+        Add many elements in a single transaction.
+        
+        Args:
+            rows: (slide_id, element_type, bbox_x, bbox_y, bbox_w, bbox_h)
+                tuples, with the bounding box in EMU.
+            
+        Returns:
+            Number of elements inserted.
+            
+        Raises:
+            DatabaseError: If insertion fails; nothing is written in that case.
+        """
+        if not rows:
+            return 0
+        try:
+            with self.transaction() as conn:
+                conn.executemany(_ELEMENT_INSERT_SQL, rows)
+            self.logger.debug(f"Added {len(rows)} elements")
+            return len(rows)
+        except sqlite3.Error as e:
+            raise DatabaseError(f"Failed to add elements: {e}") from e
+    
+    def add_element(self, slide_id: int, element_type: str,
+                    bbox_x: float, bbox_y: float, bbox_w: float, bbox_h: float) -> int:
+        """
+        Add a single element to a slide.
+        
+        For a slide's full element list use add_elements_bulk or
+        add_slide_with_elements, which insert all rows with one executemany.
         
         Args:
             slide_id: ID of the slide this element belongs to.
-            element_type: Type of element (e.g., 'text', 'title').
-            content: Element content.
+            element_type: Type of element (e.g., 'SHAPE', 'PICTURE').
+            bbox_x: X coordinate of the bounding box in EMU.
+            bbox_y: Y coordinate of the bounding box in EMU.
+            bbox_w: Width of the bounding box in EMU.
+            bbox_h: Height of the bounding box in EMU.
             
         Returns:
             ID of the newly created element.
@@ -188,12 +419,12 @@ class DatabaseWorker:
             try:
                 cursor = conn.cursor()
                 cursor.execute(
-                    "INSERT INTO elements (slide_id, element_type, content) VALUES (?, ?, ?)",
-                    (slide_id, element_type, content)
+                    _ELEMENT_INSERT_SQL,
+                    (slide_id, element_type, bbox_x, bbox_y, bbox_w, bbox_h)
                 )
                 conn.commit()
                 element_id = cursor.lastrowid
-                self.logger.debug(f"Added {element_type} element to slide {slide_id} with ID {element_id}")
+                self.logger.debug("Added %s element to slide %s with ID %s", element_type, slide_id, element_id)
                 return element_id
             except sqlite3.Error as e:
                 conn.rollback()
@@ -215,15 +446,61 @@ class DatabaseWorker:
         with self.connection() as conn:
             try:
                 cursor = conn.cursor()
+                cursor.row_factory = None
                 cursor.execute(
                     "SELECT thumb_rel_path FROM slides WHERE id = ?",
                     (slide_id,)
                 )
                 result = cursor.fetchone()
-                return result['thumb_rel_path'] if result else None
+                return result[0] if result else None
             except sqlite3.Error as e:
                 raise DatabaseError(f"Failed to get thumbnail path: {e}") from e
     
+    def get_slide_origins(self, slide_ids: List[int]) -> Dict[int, Tuple[str, int]]:
+        """
+        Get the source file path and slide index for many slides in bulk.
+        
+        Args:
+            slide_ids: IDs of the slides to look up.
+            
+        Returns:
+            Dictionary mapping slide ID to (full_file_path, slide_index).
+            Slides that do not exist are omitted.
+            
+        Raises:
+            DatabaseError: If query fails.
+        """
+        unique_ids = list(dict.fromkeys(slide_ids))
+        origins: Dict[int, Tuple[str, int]] = {}
+        
+        with self.connection() as conn:
+            try:
+                cursor = conn.cursor()
+                for start in range(0, len(unique_ids), IN_CLAUSE_CHUNK_SIZE):
+                    chunk = unique_ids[start:start + IN_CLAUSE_CHUNK_SIZE]
+                    placeholders, params = _in_clause(chunk)
+                    if _SQL_PATH_JOIN:
+                        cursor.execute(
+                            f"""SELECT slide_id, {_ORIGIN_PATH_SQL}, slide_index
+                                FROM slide_origins
+                                WHERE slide_id IN ({placeholders})""",
+                            params
+                        )
+                        for row in cursor.fetchall():
+                            origins[row[0]] = (row[1], row[2])
+                        continue
+                    cursor.execute(
+                        f"""SELECT slide_id, folder_path, rel_path, slide_index
+                            FROM slide_origins
+                            WHERE slide_id IN ({placeholders})""",
+                        params
+                    )
+                    for slide_id, folder_path, rel_path, slide_index in cursor.fetchall():
+                        origins[slide_id] = (str(Path(folder_path) / rel_path), slide_index)
+                return origins
+            except sqlite3.Error as e:
+                raise DatabaseError(f"Failed to get slide origins: {e}") from e
+    
     def batch_update_slide_texts(self, slide_texts: List[Tuple[int, Optional[str], Optional[str]]]) -> None:
         """
         Update title and notes for multiple slides in a single transaction.
@@ -237,14 +514,14 @@ class DatabaseWorker:
         with self.connection() as conn:
             try:
                 cursor = conn.cursor()
-                cursor.execute("BEGIN TRANSACTION")
+                cursor.execute("BEGIN IMMEDIATE")
                 
                 for slide_id, title, notes in slide_texts:
                     # Update in FTS table (simplified for worker)
                     cursor.execute(
                         """UPDATE slides_fts 
                            SET title = COALESCE(?, title), notes = COALESCE(?, notes) 
-                           WHERE slide_id = ?""",
+                           WHERE rowid = ?""",
                         (title, notes, slide_id)
                     )
                 
@@ -252,4 +529,33 @@ class DatabaseWorker:
                 self.logger.debug(f"Updated text for {len(slide_texts)} slides")
             except sqlite3.Error as e:
                 conn.rollback()
-                raise DatabaseError(f"Failed to update slide texts: {e}") from e
\ No newline at end of file
+                raise DatabaseError(f"Failed to update slide texts: {e}") from e
+
+
+# Per-thread cache of workers, keyed by database path
+_thread_workers = threading.local()
+
+
+def get_thread_db(db_path: Path) -> DatabaseWorker:
+    """
+    Get the calling thread's DatabaseWorker for a database, creating it on first use.
+    
+    Pool threads run many tasks over their lifetime; sharing one worker (and
+    therefore one connection) per thread avoids reconnecting for every task.
+    Callers must not close the returned worker.
+    
+    Args:
+        db_path: Path to the SQLite database file.
+        
+    Returns:
+        The DatabaseWorker cached for the current thread and path.
+    """
+    workers = getattr(_thread_workers, 'workers', None)
+    if workers is None:
+        workers = _thread_workers.workers = {}
+    
+    key = str(db_path)
+    worker = workers.get(key)
+    if worker is None:
+        worker = workers[key] = DatabaseWorker(db_path)
+    return worker
@@ -32,41 +32,42 @@ class DemoContentService:
             demo_folder = Path.home() / "Documents" / "SlidemanProjects" / "Demo"
             demo_folder.mkdir(parents=True, exist_ok=True)
             
-            project_id = self.db.add_project(project_name, str(demo_folder))
-            if not project_id:
-                self.logger.error("Failed to create demo project in database")
-                return None
-                
-            # Create sample "file" entry (even though no actual PPTX exists)
-            file_id = self.db.add_file(
-                project_id, 
-                "sample_presentation.pptx", 
-                "sample_presentation.pptx", 
-                "demo_checksum"
-            )
-            
-            if not file_id:
-                self.logger.error("Failed to create demo file in database")
-                return None
-                
-            # Create sample slides with diverse content
-            sample_slides = self._get_sample_slide_data()
-            
-            for slide_data in sample_slides:
-                slide_id = self.db.add_slide(
-                    file_id,
-                    slide_data["slide_number"],
-                    slide_data["title"],
-                    slide_data["notes"],
-                    "demo_thumbnail_path.png"  # Placeholder path
+            # One transaction for the whole demo, so a failure leaves nothing behind
+            with self.db.write_batch():
+                project_id = self.db.add_project(project_name, str(demo_folder))
+                if not project_id:
+                    self.logger.error("Failed to create demo project in database")
+                    return None
+                    
+                # Create sample "file" entry (even though no actual PPTX exists)
+                file_id = self.db.add_file(
+                    project_id, 
+                    "sample_presentation.pptx", 
+                    "sample_presentation.pptx", 
+                    "demo_checksum"
                 )
                 
-                if slide_id:
-                    # Add sample keywords to slides
-                    for keyword_text in slide_data.get("keywords", []):
-                        keyword_id = self.db.get_or_create_keyword(keyword_text)
-                        if keyword_id:
-                            self.db.add_slide_keyword(slide_id, keyword_id)
+                if not file_id:
+                    self.logger.error("Failed to create demo file in database")
+                    return None
+                    
+                # Create sample slides with diverse content
+                sample_slides = self._get_sample_slide_data()
+                
+                for slide_data in sample_slides:
+                    slide_id = self.db.add_slide(
+                        file_id,
+                        slide_data["slide_number"],
+                        thumb_rel_path="demo_thumbnail_path.png",  # Placeholder path
+                        title=slide_data["title"]
+                    )
+                    
+                    if slide_id:
+                        # Add sample keywords to slides
+                        for keyword_text in slide_data.get("keywords", []):
+                            keyword_id = self.db.add_keyword_if_not_exists(keyword_text, 'topic')
+                            if keyword_id:
+                                self.db.link_slide_keyword(slide_id, keyword_id)
                             
             self.logger.info(f"Demo project created successfully with ID {project_id}")
             return project_id
@@ -165,8 +166,9 @@ class DemoContentService:
         """Pre-populate the database with sample keywords for better UX."""
         try:
             sample_keywords = self.get_sample_keywords()
-            for keyword_text in sample_keywords:
-                self.db.get_or_create_keyword(keyword_text)
+            with self.db.write_batch():
+                for keyword_text in sample_keywords:
+                    self.db.add_keyword_if_not_exists(keyword_text, 'topic')
             self.logger.info(f"Pre-populated {len(sample_keywords)} sample keywords")
         except Exception as e:
             self.logger.error(f"Failed to populate sample keywords: {e}", exc_info=True)
\ No newline at end of file
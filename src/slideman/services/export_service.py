@@ -3,7 +3,7 @@
 import logging
 import os
 from pathlib import Path
-from typing import List, Optional, Tuple, Literal
+from typing import Dict, List, Optional, Set, Tuple, Literal
 
 from PySide6.QtCore import QObject, QRunnable, Signal, Slot
 
@@ -15,7 +15,7 @@ try:
 except ImportError:
     HAS_COM = False
 
-from .database_worker import DatabaseWorker
+from .database_worker import DatabaseWorker, get_thread_db
 from .exceptions import (
     DatabaseError, PowerPointError, COMInitializationError,
     PresentationAccessError, SlideExportError, ResourceNotFoundError
@@ -23,6 +23,10 @@ from .exceptions import (
 
 logger = logging.getLogger(__name__)
 
+# PowerPoint COM constants
+PP_ALERTS_NONE = 1                       # ppAlertsNone
+MSO_AUTOMATION_SECURITY_FORCE_DISABLE = 3  # msoAutomationSecurityForceDisable
+
 
 class ExportWorkerSignals(QObject):
     """
@@ -71,6 +75,17 @@ class ExportWorker(QRunnable):
             raise ValueError("Output path is required when output_mode is 'save'.")
             
         self.is_cancelled = False
+        
+        # Most recently opened source presentation. Consecutive slides from
+        # the same deck reuse it instead of re-opening the file each time.
+        self._source_path: Optional[Path] = None
+        self._source_pres = None
+        
+        # Source files found on disk, filled in once per export
+        self._existing_sources: Set[str] = set()
+        
+        # PowerPoint settings overridden while the export runs
+        self._saved_app_settings: Dict[str, int] = {}
     
     @Slot()
     def run(self):
@@ -79,7 +94,6 @@ class ExportWorker(QRunnable):
         logger.info(f"[{worker_id_str}] Starting export in mode: {self.output_mode}")
         
         # Initialize thread-local resources
-        db_worker = None
         com_initialized = False
         ppt_app = None
         new_pres = None
@@ -89,12 +103,12 @@ class ExportWorker(QRunnable):
             try:
                 pythoncom.CoInitialize()
                 com_initialized = True
-                logger.debug(f"[{worker_id_str}] COM initialized")
+                logger.debug("[%s] COM initialized", worker_id_str)
             except Exception as e:
                 raise COMInitializationError(f"Failed to initialize COM: {e}") from e
             
-            # Create database worker
-            db_worker = DatabaseWorker(self.db_path)
+            # Reuse this pool thread's database worker and connection
+            db_worker = get_thread_db(self.db_path)
             
             # Process the presentation
             self._process_export(db_worker, worker_id_str)
@@ -113,7 +127,7 @@ class ExportWorker(QRunnable):
             
         finally:
             # Cleanup resources
-            self._cleanup(db_worker, new_pres, ppt_app, com_initialized)
+            self._cleanup(new_pres, ppt_app, com_initialized)
             
         logger.info(f"[{worker_id_str}] Export worker finished")
     
@@ -134,11 +148,27 @@ class ExportWorker(QRunnable):
         slides_with_errors = []
         
         try:
+            # Resolve all slide origins in one query instead of one per slide
+            try:
+                slide_origins = db_worker.get_slide_origins(self.ordered_slide_ids)
+            except DatabaseError as e:
+                raise SlideExportError(f"Database error: {e}") from e
+            
+            # Check each distinct source file once, before starting PowerPoint
+            unique_sources = {source_path for source_path, _ in slide_origins.values()}
+            self._existing_sources = {p for p in unique_sources if os.path.exists(p)}
+            if not self._existing_sources:
+                raise SlideExportError("None of the source files for the selected slides were found")
+            
+            # Phase 1: plan the InsertFromFile calls before any COM work
+            insertions = self._plan_insertions(slide_origins)
+            
             # Create PowerPoint Application instance
             try:
                 ppt_app = win32com.client.Dispatch("PowerPoint.Application")
-                if self.output_mode == 'open':
-                    ppt_app.Visible = True
+                # Stay hidden with alerts and macros off while inserting;
+                # the window is only shown once all slides are in
+                self._enter_fast_mode(ppt_app)
             except com_error as e:
                 raise PowerPointError("Failed to create PowerPoint application") from e
             
@@ -152,28 +182,54 @@ class ExportWorker(QRunnable):
             total_slides = len(self.ordered_slide_ids)
             slides_processed = 0
             
-            # Process each slide
-            for idx, slide_id in enumerate(self.ordered_slide_ids):
+            # Phase 2: one InsertFromFile call per contiguous run. Only a failed
+            # run pays for per-slide error handling.
+            for source_path, slide_start, slide_end, run_slides in insertions:
                 if self.is_cancelled:
                     logger.info(f"[{worker_id_str}] Export cancelled")
                     raise PowerPointError("Export cancelled by user")
                 
-                try:
-                    self._process_single_slide(
-                        db_worker, ppt_app, new_pres, slide_id, worker_id_str
-                    )
-                    slides_processed += 1
-                    
-                except Exception as e:
-                    error_msg = f"Slide {idx + 1} (ID: {slide_id}): {str(e)}"
-                    error_details.append(error_msg)
-                    slides_with_errors.append(slide_id)
-                    logger.error(f"[{worker_id_str}] {error_msg}")
-                    # Continue processing other slides
+                inserted = False
+                if source_path is not None:
+                    slides_before = new_pres.Slides.Count
+                    try:
+                        new_pres.Slides.InsertFromFile(
+                            source_path, slides_before, slide_start, slide_end
+                        )
+                        inserted = True
+                    except com_error as e:
+                        logger.warning(
+                            f"[{worker_id_str}] InsertFromFile failed for {Path(source_path).name} "
+                            f"({slide_start}-{slide_end}), retrying slide by slide: {e}"
+                        )
+                        self._remove_partial_insert(new_pres, slides_before, worker_id_str)
+                
+                if inserted:
+                    slides_processed += len(run_slides)
+                else:
+                    # Fall back to per-slide Copy/Paste so a single bad slide
+                    # doesn't fail the whole run
+                    for idx, slide_id in run_slides:
+                        try:
+                            self._process_single_slide(
+                                ppt_app, new_pres, slide_id,
+                                slide_origins.get(slide_id), worker_id_str
+                            )
+                            slides_processed += 1
+                            
+                        except Exception as e:
+                            error_msg = f"Slide {idx + 1} (ID: {slide_id}): {str(e)}"
+                            error_details.append(error_msg)
+                            slides_with_errors.append(slide_id)
+                            logger.error(f"[{worker_id_str}] {error_msg}")
+                            # Continue processing other slides
                 
                 # Update progress
                 self.signals.exportProgress.emit(slides_processed, total_slides)
             
+            self._close_source_presentation()
+            self._restore_app_settings(ppt_app)
+            
             # Check if we have any successful slides
             if slides_processed == 0:
                 raise SlideExportError("Failed to export any slides")
@@ -183,6 +239,7 @@ class ExportWorker(QRunnable):
                 self._save_presentation(new_pres, ppt_app, worker_id_str)
             else:
                 # Leave presentation open
+                ppt_app.Visible = True
                 logger.info(f"[{worker_id_str}] Presentation left open in PowerPoint")
                 self.signals.exportFinished.emit("Presentation opened in PowerPoint")
             
@@ -199,68 +256,93 @@ class ExportWorker(QRunnable):
                     )
                 
         finally:
-            # Cleanup handled in main finally block
-            pass
+            # Source deck and app settings may still need restoring if the
+            # loop was interrupted; remaining cleanup is handled in run()
+            self._close_source_presentation()
+            if ppt_app:
+                self._restore_app_settings(ppt_app)
+    
+    def _plan_insertions(
+            self, slide_origins: Dict[int, Tuple[str, int]]
+        ) -> List[Tuple[Optional[str], int, int, List[Tuple[int, int]]]]:
+        """
+        Group the ordered slides into runs that can be inserted in one call.
+        
+        A run is a sequence of consecutive slides in the export order that come
+        from the same source file with consecutive slide indices. Runs are
+        always appended to the end of the new presentation, in order.
+        
+        Args:
+            slide_origins: Mapping of slide ID to (source_file_path, slide_index).
+            
+        Returns:
+            List of (source_file_path, first_slide_index, last_slide_index,
+            [(position, slide_id), ...]). Slides without an origin or whose
+            source file is missing get a run of their own with a None path.
+        """
+        runs = []
+        for idx, slide_id in enumerate(self.ordered_slide_ids):
+            origin = slide_origins.get(slide_id)
+            if origin is None or origin[0] not in self._existing_sources:
+                runs.append((None, 0, 0, [(idx, slide_id)]))
+                continue
+            
+            source_path, slide_index = origin
+            if runs:
+                last_path, last_start, last_end, last_slides = runs[-1]
+                if last_path == source_path and slide_index == last_end + 1:
+                    last_slides.append((idx, slide_id))
+                    runs[-1] = (last_path, last_start, slide_index, last_slides)
+                    continue
+            runs.append((source_path, slide_index, slide_index, [(idx, slide_id)]))
+        return runs
+    
+    def _remove_partial_insert(self, new_pres, slides_before: int, worker_id_str: str):
+        """
+        Remove slides left behind by a partially failed InsertFromFile.
+        
+        Args:
+            new_pres: New presentation COM object.
+            slides_before: Slide count before the failed insert.
+            worker_id_str: Worker identification string.
+        """
+        try:
+            while new_pres.Slides.Count > slides_before:
+                new_pres.Slides(new_pres.Slides.Count).Delete()
+        except com_error as e:
+            logger.warning(f"[{worker_id_str}] Error removing partial insert: {e}")
     
-    def _process_single_slide(self, db_worker: DatabaseWorker, ppt_app, 
-                            new_pres, slide_id: int, worker_id_str: str):
+    def _process_single_slide(self, ppt_app, new_pres, slide_id: int,
+                            origin: Optional[Tuple[str, int]], worker_id_str: str):
         """
         Process a single slide for export.
         
         Args:
-            db_worker: Database worker instance.
             ppt_app: PowerPoint application COM object.
             new_pres: New presentation COM object.
             slide_id: ID of slide to process.
+            origin: Pre-fetched (source_file_path, slide_index) for the slide,
+                or None if the slide was not found in the database.
             worker_id_str: Worker identification string.
             
         Raises:
             ResourceNotFoundError: If slide origin not found.
             SlideExportError: If slide processing fails.
         """
-        # Get source file path and slide index from database
-        try:
-            # Using the worker's connection to get slide origin
-            with db_worker.connection() as conn:
-                cursor = conn.cursor()
-                query = """
-                    SELECT p.folder_path, f.rel_path, s.slide_index 
-                    FROM slides s 
-                    JOIN files f ON s.file_id = f.id 
-                    JOIN projects p ON f.project_id = p.id 
-                    WHERE s.id = ?
-                """
-                cursor.execute(query, (slide_id,))
-                result = cursor.fetchone()
-                
-                if not result:
-                    raise ResourceNotFoundError("Slide", slide_id)
-                
-                folder_path = result['folder_path']
-                rel_path = result['rel_path']
-                slide_index = result['slide_index']
-                source_file_path = Path(folder_path) / rel_path
-                
-        except DatabaseError as e:
-            raise SlideExportError(f"Database error: {e}") from e
+        if origin is None:
+            raise ResourceNotFoundError("Slide", slide_id)
         
-        # Validate source file exists
-        if not source_file_path.exists():
-            raise SlideExportError(
-                f"Source file not found: {source_file_path.name}"
-            )
+        source_file_path = Path(origin[0])
+        slide_index = origin[1]
         
-        # Open source presentation and copy slide
-        source_pres = None
+        # Open source presentation (reused for consecutive slides) and copy slide
         try:
             logger.debug(
-                f"[{worker_id_str}] Inserting slide {slide_id} from "
-                f"{source_file_path.name} index {slide_index}"
+                "[%s] Inserting slide %s from %s index %s",
+                worker_id_str, slide_id, source_file_path.name, slide_index
             )
             
-            source_pres = ppt_app.Presentations.Open(
-                str(source_file_path), ReadOnly=True, WithWindow=False
-            )
+            source_pres = self._get_source_presentation(ppt_app, source_file_path)
             
             if slide_index > source_pres.Slides.Count:
                 raise SlideExportError(
@@ -272,17 +354,84 @@ class ExportWorker(QRunnable):
             new_pres.Slides.Paste()
             
         except com_error as e:
+            # The cached presentation may be in a bad state; don't reuse it
+            self._close_source_presentation()
             raise PresentationAccessError(
                 f"Failed to access {source_file_path.name}: {str(e)}"
             ) from e
+    
+    def _get_source_presentation(self, ppt_app, source_file_path: Path):
+        """
+        Return the open source presentation, opening it only if it differs
+        from the one used for the previous slide.
+        
+        Args:
+            ppt_app: PowerPoint application COM object.
+            source_file_path: Path to the source PPTX file.
             
-        finally:
-            # Always close source presentation
-            if source_pres:
-                try:
-                    source_pres.Close()
-                except Exception as e:
-                    logger.warning(f"Error closing source presentation: {e}")
+        Returns:
+            The source presentation COM object.
+            
+        Raises:
+            SlideExportError: If the source file does not exist.
+            com_error: If PowerPoint fails to open the file.
+        """
+        if self._source_pres is not None and self._source_path == source_file_path:
+            return self._source_pres
+        
+        self._close_source_presentation()
+        
+        # Existence was checked once up front for every distinct source
+        if str(source_file_path) not in self._existing_sources:
+            raise SlideExportError(
+                f"Source file not found: {source_file_path.name}"
+            )
+        
+        self._source_pres = ppt_app.Presentations.Open(
+            str(source_file_path), ReadOnly=True, WithWindow=False,
+            OpenAndRepair=False
+        )
+        self._source_path = source_file_path
+        return self._source_pres
+    
+    def _close_source_presentation(self):
+        """Close the cached source presentation, if any."""
+        source_pres = self._source_pres
+        self._source_pres = None
+        self._source_path = None
+        if source_pres:
+            try:
+                source_pres.Close()
+            except Exception as e:
+                logger.warning(f"Error closing source presentation: {e}")
+    
+    def _enter_fast_mode(self, ppt_app):
+        """
+        Turn off alerts and macro execution for the duration of the export.
+        
+        The previous values are remembered so they can be put back before the
+        application is handed to the user.
+        
+        Args:
+            ppt_app: PowerPoint application COM object.
+        """
+        self._saved_app_settings = {}
+        for name, value in (("DisplayAlerts", PP_ALERTS_NONE),
+                            ("AutomationSecurity", MSO_AUTOMATION_SECURITY_FORCE_DISABLE)):
+            try:
+                self._saved_app_settings[name] = getattr(ppt_app, name)
+                setattr(ppt_app, name, value)
+            except com_error as e:
+                logger.debug("Could not set PowerPoint %s: %s", name, e)
+    
+    def _restore_app_settings(self, ppt_app):
+        """Restore the application settings changed by _enter_fast_mode."""
+        for name, value in self._saved_app_settings.items():
+            try:
+                setattr(ppt_app, name, value)
+            except com_error as e:
+                logger.debug("Could not restore PowerPoint %s: %s", name, e)
+        self._saved_app_settings = {}
     
     def _save_presentation(self, new_pres, ppt_app, worker_id_str: str):
         """
@@ -320,17 +469,12 @@ class ExportWorker(QRunnable):
         except Exception as e:
             raise SlideExportError(f"Save operation failed: {e}") from e
     
-    def _cleanup(self, db_worker: Optional[DatabaseWorker], 
-                new_pres, ppt_app, com_initialized: bool):
-        """Clean up all resources."""
-        # Close database connection
-        if db_worker:
-            try:
-                db_worker.close()
-                logger.debug("Export worker: Closed database connection")
-            except Exception as e:
-                logger.error(f"Error closing database: {e}")
+    def _cleanup(self, new_pres, ppt_app, com_initialized: bool):
+        """
+        Clean up all resources.
         
+        The database worker is shared by tasks on this thread and stays open.
+        """
         # Clean up COM objects
         if new_pres and self.output_mode == 'save':
             try:
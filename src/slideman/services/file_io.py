@@ -2,8 +2,12 @@
 
 import shutil
 import os
+import ctypes
 import hashlib
 import logging
+import mmap
+import threading
+from collections import OrderedDict
 from pathlib import Path
 from typing import List, Dict, Optional, Tuple
 import platform
@@ -12,10 +16,47 @@ import platform
 # --- Constants ---
 # Buffer size for file hashing to avoid loading large files into memory
 HASH_BUFFER_SIZE = 65536 # 64 KB
+# Buffer size for the fused copy + hash pass
+COPY_BUFFER_SIZE = 1024 * 1024 # 1 MB
+# Files at least this large are hashed through a memory map in one update call
+MMAP_HASH_THRESHOLD = 32 * 1024 * 1024 # 32 MB
+# Upper bound on concurrent file copies for solid-state destinations
+MAX_SSD_IO_WORKERS = 16
+# Number of (path, mtime, size) -> checksum entries kept in memory
+CHECKSUM_CACHE_SIZE = 4096
 
 # --- Setup Logger ---
 logger = logging.getLogger(__name__)
 
+# --- Checksum Cache ---
+# Files whose path, modification time and size are unchanged are not re-hashed.
+# Guarded by a lock because copies may run on several threads.
+_checksum_cache: "OrderedDict[Tuple[str, int, int], str]" = OrderedDict()
+_checksum_cache_lock = threading.Lock()
+
+# kernel32 as loaded by _get_kernel32(); Windows only
+_kernel32 = None
+
+
+def _checksum_key(file_path: Path, st: os.stat_result) -> Tuple[str, int, int]:
+    return (os.path.abspath(file_path), st.st_mtime_ns, st.st_size)
+
+
+def _get_cached_checksum(key: Tuple[str, int, int]) -> Optional[str]:
+    with _checksum_cache_lock:
+        checksum = _checksum_cache.get(key)
+        if checksum is not None:
+            _checksum_cache.move_to_end(key)
+        return checksum
+
+
+def _cache_checksum(key: Tuple[str, int, int], checksum: str) -> None:
+    with _checksum_cache_lock:
+        _checksum_cache[key] = checksum
+        _checksum_cache.move_to_end(key)
+        while len(_checksum_cache) > CHECKSUM_CACHE_SIZE:
+            _checksum_cache.popitem(last=False)
+
 # --- Core Functions ---
 
 def check_disk_space(target_path: Path, required_bytes: int) -> Tuple[bool, int]:
@@ -65,6 +106,9 @@ def calculate_checksum(file_path: Path) -> Optional[str]:
     """
     Calculates the SHA-256 checksum of a file.
 
+    Results are cached by (path, mtime, size), so an unchanged file is only
+    read once.
+
     Args:
         file_path: Path to the file.
 
@@ -73,14 +117,28 @@ def calculate_checksum(file_path: Path) -> Optional[str]:
     """
     sha256_hash = hashlib.sha256()
     try:
+        st = os.stat(file_path)
+        cache_key = _checksum_key(file_path, st)
+        cached = _get_cached_checksum(cache_key)
+        if cached is not None:
+            logger.debug(f"Using cached checksum for '{file_path}': {cached[:8]}...")
+            return cached
+
         with open(file_path, "rb") as f:
-            # Read and update hash string value in blocks
-            while True:
-                buffer = f.read(HASH_BUFFER_SIZE)
-                if not buffer:
-                    break
-                sha256_hash.update(buffer)
+            if st.st_size >= MMAP_HASH_THRESHOLD:
+                # Hash the whole mapping in one call; hashlib releases the GIL
+                # and skips the per-block Python overhead
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    sha256_hash.update(mm)
+            else:
+                # Read and update hash string value in blocks
+                while True:
+                    buffer = f.read(HASH_BUFFER_SIZE)
+                    if not buffer:
+                        break
+                    sha256_hash.update(buffer)
         checksum = sha256_hash.hexdigest()
+        _cache_checksum(cache_key, checksum)
         logger.debug(f"Calculated checksum for '{file_path}': {checksum[:8]}...") # Log truncated hash
         return checksum
     except FileNotFoundError:
@@ -93,6 +151,292 @@ def calculate_checksum(file_path: Path) -> Optional[str]:
         logger.error(f"Checksum calculation failed: Unexpected error for file '{file_path}': {e}", exc_info=True)
         return None
 
+def _get_kernel32():
+    """
+    Returns this module's own kernel32 handle, with the prototypes it calls declared.
+
+    A private WinDLL (rather than ctypes.windll.kernel32, shared by every
+    module) keeps the declarations from affecting other callers, and
+    use_last_error=True makes ctypes.get_last_error() report real errors.
+    Repeated calls return the same handle.
+    """
+    global _kernel32
+    if _kernel32 is None:
+        from ctypes import wintypes
+        kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+        kernel32.SetFilePointerEx.argtypes = [wintypes.HANDLE, wintypes.LARGE_INTEGER,
+                                              wintypes.PLARGE_INTEGER, wintypes.DWORD]
+        kernel32.SetFilePointerEx.restype = wintypes.BOOL
+        kernel32.SetEndOfFile.argtypes = [wintypes.HANDLE]
+        kernel32.SetEndOfFile.restype = wintypes.BOOL
+        kernel32.CreateFileW.argtypes = [wintypes.LPCWSTR, wintypes.DWORD, wintypes.DWORD,
+                                         wintypes.LPVOID, wintypes.DWORD, wintypes.DWORD,
+                                         wintypes.HANDLE]
+        kernel32.CreateFileW.restype = wintypes.HANDLE
+        kernel32.DeviceIoControl.argtypes = [wintypes.HANDLE, wintypes.DWORD,
+                                             wintypes.LPVOID, wintypes.DWORD,
+                                             wintypes.LPVOID, wintypes.DWORD,
+                                             wintypes.LPDWORD, wintypes.LPVOID]
+        kernel32.DeviceIoControl.restype = wintypes.BOOL
+        kernel32.CloseHandle.argtypes = [wintypes.HANDLE]
+        kernel32.CloseHandle.restype = wintypes.BOOL
+        _kernel32 = kernel32
+    return _kernel32
+
+
+def _preallocate(dest_file, size: int) -> None:
+    """
+    Reserves `size` bytes for an open destination file before it is written.
+
+    Lets the filesystem pick contiguous extents up front instead of growing the
+    file in small increments. Preallocation is purely an optimisation, so any
+    failure (unsupported platform or filesystem) is logged and ignored.
+
+    Args:
+        dest_file: A file object opened for binary writing.
+        size: The expected final size of the file in bytes.
+    """
+    if size <= 0:
+        return
+    try:
+        if platform.system() == "Windows":
+            import msvcrt
+            kernel32 = _get_kernel32()
+            handle = msvcrt.get_osfhandle(dest_file.fileno())
+            # FILE_BEGIN = 0; move to the final size, set EOF there, then rewind
+            if not kernel32.SetFilePointerEx(handle, size, None, 0):
+                raise ctypes.WinError(ctypes.get_last_error(), "SetFilePointerEx failed")
+            if not kernel32.SetEndOfFile(handle):
+                raise ctypes.WinError(ctypes.get_last_error(), "SetEndOfFile failed")
+            kernel32.SetFilePointerEx(handle, 0, None, 0)
+        else:
+            os.posix_fallocate(dest_file.fileno(), 0, size)
+    except (AttributeError, OSError, ctypes.ArgumentError) as e:
+        logger.debug(f"Preallocation of {size} bytes skipped: {e}")
+
+
+def copy_and_hash(src_path: Path, dest_path: Path, src_size: Optional[int] = None) -> str:
+    """
+    Copies a file and calculates its SHA-256 checksum in a single pass.
+
+    The destination is preallocated to the source size, filled from the same
+    buffers that feed the hash, and finally given the source's metadata
+    (permissions, timestamps) like `shutil.copy2`.
+
+    Args:
+        src_path: Path to the source file.
+        dest_path: Path to the destination file (overwritten if it exists).
+        src_size: Size of the source in bytes, if already known from a stat.
+
+    Returns:
+        The hex digest of the SHA-256 checksum of the copied data.
+
+    Raises:
+        OSError: If the source cannot be read or the destination written.
+    """
+    # Destination may already be the source itself (e.g. a hardlink from a
+    # previous import); opening it for writing would truncate the data
+    if dest_path.exists() and os.path.samefile(src_path, dest_path):
+        checksum = calculate_checksum(dest_path)
+        if checksum is None:
+            raise OSError(f"Could not read '{dest_path}'")
+        return checksum
+
+    if src_size is None:
+        src_size = src_path.stat().st_size
+
+    sha256_hash = hashlib.sha256()
+    with open(src_path, "rb") as src, open(dest_path, "wb") as dst:
+        _preallocate(dst, src_size)
+        buffer = bytearray(COPY_BUFFER_SIZE)
+        view = memoryview(buffer)
+        bytes_written = 0
+        while True:
+            n = src.readinto(buffer)
+            if not n:
+                break
+            chunk = view[:n]
+            sha256_hash.update(chunk)
+            dst.write(chunk)
+            bytes_written += n
+        # The source may have shrunk since it was stat'ed; drop any reserved tail
+        if bytes_written != src_size:
+            dst.truncate(bytes_written)
+
+    shutil.copystat(src_path, dest_path)
+    checksum = sha256_hash.hexdigest()
+    # copystat preserves mtime, so the digest is valid for both files until
+    # either one changes
+    _cache_checksum(_checksum_key(src_path, os.stat(src_path)), checksum)
+    _cache_checksum(_checksum_key(dest_path, os.stat(dest_path)), checksum)
+    return checksum
+
+
+def volume_id(path: Path) -> Optional[int]:
+    """
+    Returns the device/volume identifier for a path.
+
+    If the path does not exist yet, its nearest existing ancestor is used, so a
+    project folder can be checked before it is created.
+
+    Args:
+        path: A file or directory path.
+
+    Returns:
+        The `st_dev` of the path (volume serial number on Windows), or None if
+        no ancestor could be stat'ed.
+    """
+    for candidate in (path, *path.parents):
+        try:
+            return os.stat(candidate).st_dev
+        except OSError:
+            continue
+    return None
+
+
+def _is_rotational_windows(path: Path) -> Optional[bool]:
+    """Asks the storage driver whether the volume holding `path` incurs a seek penalty."""
+    from ctypes import wintypes
+
+    IOCTL_STORAGE_QUERY_PROPERTY = 0x002D1400
+    STORAGE_DEVICE_SEEK_PENALTY_PROPERTY = 7
+    PROPERTY_STANDARD_QUERY = 0
+    FILE_SHARE_READ_WRITE = 0x00000003
+    OPEN_EXISTING = 3
+
+    class STORAGE_PROPERTY_QUERY(ctypes.Structure):
+        _fields_ = [("PropertyId", wintypes.DWORD),
+                    ("QueryType", wintypes.DWORD),
+                    ("AdditionalParameters", ctypes.c_ubyte * 1)]
+
+    class DEVICE_SEEK_PENALTY_DESCRIPTOR(ctypes.Structure):
+        _fields_ = [("Version", wintypes.DWORD),
+                    ("Size", wintypes.DWORD),
+                    ("IncursSeekPenalty", wintypes.BOOLEAN)]
+
+    kernel32 = _get_kernel32()
+    drive = path.resolve().drive  # e.g. 'C:'
+    if not drive:
+        return None
+    handle = kernel32.CreateFileW(f"\\\\.\\{drive}", 0, FILE_SHARE_READ_WRITE,
+                                  None, OPEN_EXISTING, 0, None)
+    if handle in (None, wintypes.HANDLE(-1).value):
+        return None
+    try:
+        query = STORAGE_PROPERTY_QUERY(STORAGE_DEVICE_SEEK_PENALTY_PROPERTY, PROPERTY_STANDARD_QUERY)
+        result = DEVICE_SEEK_PENALTY_DESCRIPTOR()
+        returned = wintypes.DWORD()
+        ok = kernel32.DeviceIoControl(handle, IOCTL_STORAGE_QUERY_PROPERTY,
+                                      ctypes.byref(query), ctypes.sizeof(query),
+                                      ctypes.byref(result), ctypes.sizeof(result),
+                                      ctypes.byref(returned), None)
+        return bool(result.IncursSeekPenalty) if ok else None
+    finally:
+        kernel32.CloseHandle(handle)
+
+
+def _is_rotational_linux(path: Path) -> Optional[bool]:
+    """Reads the block device's queue/rotational flag from sysfs."""
+    st_dev = os.stat(path).st_dev
+    device = Path(os.path.realpath(f"/sys/dev/block/{os.major(st_dev)}:{os.minor(st_dev)}"))
+    # Partitions don't have a queue directory; their parent disk does
+    for candidate in (device, device.parent):
+        flag = candidate / "queue" / "rotational"
+        if flag.exists():
+            return flag.read_text().strip() == "1"
+    return None
+
+
+def is_rotational(path: Path) -> Optional[bool]:
+    """
+    Detects whether a path lives on a rotational disk (HDD) or solid-state storage.
+
+    Args:
+        path: A file or directory path; the nearest existing ancestor is used
+            if it doesn't exist yet.
+
+    Returns:
+        True for rotational media, False for solid-state, or None if the
+        storage type could not be determined (network shares, virtual disks).
+    """
+    existing = next((p for p in (path, *path.parents) if p.exists()), None)
+    if existing is None:
+        return None
+    try:
+        if platform.system() == "Windows":
+            return _is_rotational_windows(existing)
+        if platform.system() == "Linux":
+            return _is_rotational_linux(existing)
+    except (AttributeError, OSError, ValueError, ctypes.ArgumentError) as e:
+        logger.debug(f"Could not determine storage type for '{path}': {e}")
+    return None
+
+
+def io_worker_count(path: Path) -> int:
+    """
+    Chooses how many files may be copied concurrently onto a destination.
+
+    Parallel writes make a spinning disk thrash between files, so rotational
+    (and undetectable) destinations get a single worker; solid-state ones
+    scale with the CPU count up to MAX_SSD_IO_WORKERS.
+
+    Args:
+        path: The destination folder.
+
+    Returns:
+        The number of concurrent copy workers to use.
+    """
+    if is_rotational(path) is False:
+        return min(MAX_SSD_IO_WORKERS, (os.cpu_count() or 4) * 2)
+    return 1
+
+
+def hardlink_file(src_path: Path, dest_path: Path) -> bool:
+    """
+    Hardlinks a file into place instead of copying its data.
+
+    Only works when source and destination are on the same volume. An existing
+    destination is never replaced, so the caller can fall back to a real copy.
+
+    Args:
+        src_path: Path to the source file.
+        dest_path: Path to the destination file.
+
+    Returns:
+        True if the link was created, False otherwise.
+    """
+    try:
+        os.link(src_path, dest_path)
+        return True
+    except (OSError, NotImplementedError) as e:
+        logger.debug(f"Hardlink '{src_path}' -> '{dest_path}' not possible, copying instead: {e}")
+        return False
+
+
+def can_hardlink(src_path: Path, folder: Path) -> bool:
+    """
+    Checks whether a file can be hardlinked into a folder.
+
+    Creates and removes a test link, since being on the same volume is not
+    enough: exFAT/FAT volumes have no hardlinks and permissions may forbid them.
+
+    Args:
+        src_path: Path to an existing file to link.
+        folder: Existing destination folder.
+
+    Returns:
+        True if the test link could be created, False otherwise.
+    """
+    probe_path = folder / f".slideman_link_probe_{os.getpid()}_{threading.get_ident()}"
+    if not hardlink_file(src_path, probe_path):
+        return False
+    try:
+        probe_path.unlink()
+    except OSError as e:
+        logger.warning(f"Could not remove hardlink probe '{probe_path}': {e}")
+    return True
+
+
 def copy_files_to_project(source_paths: List[Path], project_folder: Path) -> Dict[str, Optional[str]]:
     """
     Copies source files into the project folder and calculates checksums.
@@ -112,7 +456,8 @@ def copy_files_to_project(source_paths: List[Path], project_folder: Path) -> Dic
     project_folder.mkdir(parents=True, exist_ok=True)
     logger.info(f"Starting copy of {len(source_paths)} files to '{project_folder}'")
 
-    total_size = sum(p.stat().st_size for p in source_paths if p.is_file())
+    sized_sources = [(p, p.stat().st_size) for p in source_paths if p.is_file()]
+    total_size = sum(size for _, size in sized_sources)
     # Check disk space (consider adding a safety margin, e.g., * 1.1)
     has_space, free_space = check_disk_space(project_folder, int(total_size * 1.1))
     if not has_space:
@@ -121,11 +466,11 @@ def copy_files_to_project(source_paths: List[Path], project_folder: Path) -> Dic
          raise OSError(f"Insufficient disk space to copy project files.") # Raise error to stop process
 
 
-    for src_path in source_paths:
-        if not src_path.is_file():
-            logger.warning(f"Skipping non-file source path: '{src_path}'")
-            continue
+    skipped = set(source_paths) - {p for p, _ in sized_sources}
+    for src_path in skipped:
+        logger.warning(f"Skipping non-file source path: '{src_path}'")
 
+    for src_path, src_size in sized_sources:
         relative_path_str = src_path.name # Simple copy to root of project folder
         # If you want to preserve subdirectories, calculate relative path differently
         # relative_path = src_path.relative_to(common_ancestor_path)
@@ -135,10 +480,8 @@ def copy_files_to_project(source_paths: List[Path], project_folder: Path) -> Dic
         logger.debug(f"Copying '{src_path}' to '{dest_path}'")
 
         try:
-            # Copy file including metadata (permissions, timestamps)
-            shutil.copy2(src_path, dest_path)
-            # Calculate checksum *after* successful copy
-            checksum = calculate_checksum(dest_path)
+            # Copy file including metadata, hashing the data as it is written
+            checksum = copy_and_hash(src_path, dest_path, src_size)
             copied_files_info[relative_path_str] = checksum
 
         except OSError as e:
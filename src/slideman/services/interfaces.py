@@ -61,6 +61,11 @@ class IFileService(ABC):
         """Add a file to a project."""
         pass
     
+    @abstractmethod
+    def add_files_bulk(self, rows: List[Tuple[int, str, str, str]]) -> List[int]:
+        """Add many (project_id, filename, rel_path, checksum) file records at once."""
+        pass
+    
     @abstractmethod
     def get_file(self, file_id: int) -> Optional[File]:
         """Get a file by ID."""
@@ -91,6 +96,11 @@ class ISlideService(ABC):
         """Add a slide to a file."""
         pass
     
+    @abstractmethod
+    def add_slides_bulk(self, rows: List[Tuple[int, int, Optional[str], Optional[str]]]) -> List[int]:
+        """Add or update many (file_id, slide_index, thumb_rel_path, image_rel_path) slides at once."""
+        pass
+    
     @abstractmethod
     def get_slide(self, slide_id: int) -> Optional[Slide]:
         """Get a slide by ID."""
@@ -101,11 +111,26 @@ class ISlideService(ABC):
         """Get all slides for a file."""
         pass
     
+    @abstractmethod
+    def get_slide_models_for_project(self, project_id: int) -> List[Slide]:
+        """Get all slides for a project, in file order."""
+        pass
+    
     @abstractmethod
     def get_slides_for_project(self, project_id: int) -> List[Dict[str, Any]]:
         """Get all slides for a project with file information."""
         pass
     
+    @abstractmethod
+    def get_slide_origins(self, slide_ids: List[int]) -> Dict[int, Tuple[str, int]]:
+        """Get the source file path and slide index for many slides at once."""
+        pass
+    
+    @abstractmethod
+    def get_project_folder_paths_for_slides(self, slide_ids: List[int]) -> Dict[int, str]:
+        """Get the project folder path for many slides at once."""
+        pass
+    
     @abstractmethod
     def get_slide_image_path(self, slide_id: int) -> Optional[str]:
         """Get the full resolution image path for a slide."""
@@ -131,6 +156,11 @@ class IElementService(ABC):
         """Add an element to a slide."""
         pass
     
+    @abstractmethod
+    def add_elements_bulk(self, rows: List[Tuple[int, str, float, float, float, float]]) -> int:
+        """Add many (slide_id, element_type, bbox_x, bbox_y, bbox_w, bbox_h) elements at once."""
+        pass
+    
     @abstractmethod
     def get_element(self, element_id: int) -> Optional[Element]:
         """Get an element by ID."""
@@ -183,7 +213,7 @@ class IKeywordService(ABC):
     @abstractmethod
     def search_keywords(self, query: str, kind: Optional[KeywordKind] = None,
                        project_id: Optional[int] = None) -> List[Keyword]:
-        """Search for keywords matching a query."""
+        """Search for keywords containing a query (case-insensitive substring)."""
         pass
     
     @abstractmethod
@@ -191,6 +221,11 @@ class IKeywordService(ABC):
         """Merge one keyword into another."""
         pass
     
+    @abstractmethod
+    def merge_keywords_bulk(self, pairs: List[Tuple[int, int]]) -> int:
+        """Merge many (source, target) keyword pairs in one transaction."""
+        pass
+    
     @abstractmethod
     def delete_keyword(self, keyword_id: int) -> bool:
         """Delete a keyword."""
@@ -220,6 +255,11 @@ class ISlideKeywordService(ABC):
         """Get slides associated with a keyword."""
         pass
     
+    @abstractmethod
+    def get_slide_ids_for_keyword(self, keyword_id: int) -> List[int]:
+        """Get the IDs of slides associated with a keyword."""
+        pass
+    
     @abstractmethod
     def replace_slide_keywords(self, slide_id: int, keyword_ids: List[int], kind: KeywordKind) -> bool:
         """Replace all keywords of a specific kind for a slide."""
@@ -377,6 +417,11 @@ class IDatabaseService(IProjectService, IFileService, ISlideService,
         """Rollback the current transaction."""
         pass
     
+    @abstractmethod
+    def write_batch(self):
+        """Context manager that commits all writes made inside it at once."""
+        pass
+    
     @abstractmethod
     def close(self) -> None:
         """Close the database connection."""
@@ -1,14 +1,20 @@
 # src/slideman/services/slide_converter.py
 
+import atexit
 import logging
+import os
+import queue
+import shutil
+import tempfile
+import threading
 import time
 import traceback
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional, Tuple
 
 # --- Qt Imports ---
-from PySide6.QtCore import QObject, QRunnable, Signal, Slot, QSize, Qt
-from PySide6.QtGui import QPixmap
+from PySide6.QtCore import QObject, QRunnable, Signal, Slot, QSize, Qt, QElapsedTimer
+from PySide6.QtGui import QImage
 
 # --- External Libraries ---
 try:
@@ -25,6 +31,8 @@ try:
     from pptx import Presentation
     from pptx.util import Inches, Emu
     from pptx.enum.shapes import MSO_SHAPE_TYPE
+    from pptx.shapes.shapetree import SlideShapeFactory
+    from lxml import etree
     HAS_PPTX = True
 except ImportError:
     HAS_PPTX = False
@@ -34,8 +42,15 @@ except ImportError:
         'TEXT_BOX': 4, 'GROUP': 5, 'AUTO_SHAPE': 6, 'FREEFORM': 7
     })()
 
+try:
+    from PIL import Image
+    HAS_PIL = True
+except ImportError:
+    HAS_PIL = False
+    logging.warning("Pillow not found. Falling back to Qt for thumbnail scaling.")
+
 # --- Local Imports ---
-from .database_worker import DatabaseWorker
+from .database_worker import DatabaseWorker, get_thread_db
 from .exceptions import (
     DatabaseError, PowerPointError, COMInitializationError,
     PresentationAccessError, SlideExportError, ValidationError
@@ -43,9 +58,149 @@ from .exceptions import (
 
 # --- Constants ---
 THUMBNAIL_HEIGHT = 200  # Target height in pixels for thumbnails
+THUMBNAIL_QUALITY = 85  # JPEG quality for thumbnails
+PIPELINE_DEPTH = 4      # Exported slides that may wait for the database writer
+PROGRESS_INTERVAL_MS = 200  # Minimum time between progress signals
+# Embedded picture formats that can stand in for a rendered slide image
+PASSTHROUGH_IMAGE_EXTS = {"png", "jpg", "jpeg"}
+# Largest relative aspect ratio difference still treated as unstretched
+PASSTHROUGH_ASPECT_TOLERANCE = 0.01
+# a:blip extension that only records a DPI setting, leaving the image as is
+_USE_LOCAL_DPI_EXT_URI = "{28A0092B-C50C-407E-A947-70E740481C1C}"
+
+# python-pptx shape types mapped to the element types stored in the database
+_SHAPE_TYPE_MAP = {
+    MSO_SHAPE_TYPE.PLACEHOLDER: "SHAPE",
+    MSO_SHAPE_TYPE.AUTO_SHAPE: "SHAPE",
+    MSO_SHAPE_TYPE.FREEFORM: "SHAPE",
+    MSO_SHAPE_TYPE.GROUP: "SHAPE",
+    MSO_SHAPE_TYPE.PICTURE: "PICTURE",
+    MSO_SHAPE_TYPE.CHART: "CHART",
+    MSO_SHAPE_TYPE.TABLE: "TABLE",
+    MSO_SHAPE_TYPE.TEXT_BOX: "TEXT",
+}
+
+# Shape tree XML, read directly by _extract_elements
+_NS_P = "http://schemas.openxmlformats.org/presentationml/2006/main"
+_NS_A = "http://schemas.openxmlformats.org/drawingml/2006/main"
+_TAG_SP = f"{{{_NS_P}}}sp"
+_TAG_PIC = f"{{{_NS_P}}}pic"
+_TAG_GRAPHIC_FRAME = f"{{{_NS_P}}}graphicFrame"
+_TAG_GROUP = f"{{{_NS_P}}}grpSp"
+_TAG_CONNECTOR = f"{{{_NS_P}}}cxnSp"
+_TAG_OFF = f"{{{_NS_A}}}off"
+_TAG_EXT = f"{{{_NS_A}}}ext"
+_GRAPHIC_DATA_TYPES = {
+    "http://schemas.openxmlformats.org/drawingml/2006/chart": "CHART",
+    "http://schemas.openxmlformats.org/drawingml/2006/table": "TABLE",
+}
+
+if HAS_PPTX:
+    _XPATH_NS = {"p": _NS_P, "a": _NS_A}
+    _xpath_xfrm = etree.XPath("./p:spPr/a:xfrm | ./p:grpSpPr/a:xfrm | ./p:xfrm", namespaces=_XPATH_NS)
+    _xpath_placeholder = etree.XPath("./*[1]/p:nvPr/p:ph", namespaces=_XPATH_NS)
+    _xpath_txbox = etree.XPath("string(./p:nvSpPr/p:cNvSpPr/@txBox)", namespaces=_XPATH_NS)
+    _xpath_cust_geom = etree.XPath("./p:spPr/a:custGeom", namespaces=_XPATH_NS)
+    _xpath_prst_geom = etree.XPath("./p:spPr/a:prstGeom", namespaces=_XPATH_NS)
+    _xpath_video = etree.XPath("./p:nvPicPr/p:nvPr/a:videoFile", namespaces=_XPATH_NS)
+    _xpath_graphic_uri = etree.XPath("string(./a:graphic/a:graphicData/@uri)", namespaces=_XPATH_NS)
+
+
+def _classify_shape_element(shape_elm) -> Optional[str]:
+    """
+    Element type for a non-placeholder shape element, as map_shape_type would give.
+    
+    Mirrors python-pptx's shape_type rules without building shape proxies.
+    
+    Args:
+        shape_elm: p:sp, p:pic, p:graphicFrame, p:grpSp or p:cxnSp element.
+        
+    Returns:
+        The element type string, or None if python-pptx would not recognize
+        the shape either.
+    """
+    tag = shape_elm.tag
+    if tag == _TAG_SP:
+        if _xpath_cust_geom(shape_elm):
+            return "SHAPE"
+        if _xpath_txbox(shape_elm) in ("1", "true"):
+            return "TEXT"
+        if _xpath_prst_geom(shape_elm):
+            return "SHAPE"
+        return None
+    if tag == _TAG_PIC:
+        return "UNKNOWN" if _xpath_video(shape_elm) else "PICTURE"
+    if tag == _TAG_GRAPHIC_FRAME:
+        return _GRAPHIC_DATA_TYPES.get(_xpath_graphic_uri(shape_elm), "UNKNOWN")
+    if tag == _TAG_GROUP:
+        return "SHAPE"
+    return "UNKNOWN"  # Connectors
 
 logger = logging.getLogger(__name__)
 
+# --- PowerPoint Application Cache ---
+# COM proxies belong to the apartment (thread) that created them, so each pool
+# thread caches its own. PowerPoint is a single-instance server, so they all
+# talk to one resident process that is started once rather than per file.
+_ppt_local = threading.local()
+_ppt_exit_hook_lock = threading.Lock()
+_ppt_exit_hook_registered = False
+
+
+def get_ppt_app():
+    """
+    Get this thread's PowerPoint application, starting PowerPoint only if needed.
+    
+    Must be called on a thread where COM is initialized. The first call on a
+    thread takes an extra COM reference so the apartment, and therefore the
+    cached proxy, outlives each worker's own CoUninitialize.
+    
+    Returns:
+        PowerPoint application COM object.
+    """
+    global _ppt_exit_hook_registered
+    
+    ppt_app = getattr(_ppt_local, 'app', None)
+    if ppt_app is not None:
+        try:
+            ppt_app.Version  # PowerPoint may have been closed by the user
+            return ppt_app
+        except pywintypes.com_error:
+            logger.debug("Cached PowerPoint application is gone; starting a new one.")
+            _ppt_local.app = None
+    
+    if not getattr(_ppt_local, 'com_pinned', False):
+        pythoncom.CoInitialize()
+        _ppt_local.com_pinned = True
+    
+    try:
+        # Early binding: generated typed wrappers skip the GetIDsOfNames
+        # lookup that late-bound IDispatch does on every call
+        ppt_app = win32com.client.gencache.EnsureDispatch("PowerPoint.Application")
+    except Exception as e:
+        # e.g. the gen_py cache isn't writable; late binding still works
+        logger.debug(f"Early-bound PowerPoint dispatch unavailable, using late binding: {e}")
+        ppt_app = win32com.client.Dispatch("PowerPoint.Application")
+    _ppt_local.app = ppt_app
+    
+    with _ppt_exit_hook_lock:
+        if not _ppt_exit_hook_registered:
+            atexit.register(_quit_ppt_app)
+            _ppt_exit_hook_registered = True
+    return ppt_app
+
+
+def _quit_ppt_app():
+    """Quit the shared PowerPoint instance at exit unless the user is using it."""
+    try:
+        pythoncom.CoInitialize()
+        ppt_app = win32com.client.GetActiveObject("PowerPoint.Application")
+        if ppt_app.Presentations.Count == 0:
+            ppt_app.Quit()
+            logger.debug("Quit shared PowerPoint application.")
+    except Exception as e:
+        logger.debug(f"PowerPoint not quit at exit: {e}")
+
 
 class SlideConverterSignals(QObject):
     """Defines signals emitted by the SlideConverter worker."""
@@ -86,22 +241,21 @@ class SlideConverter(QRunnable):
         # Determine paths for converted data
         self.project_root = file_path.parent.parent
         self.converted_data_dir = self.project_root / "converted_data" / str(self.file_id)
-
-    def map_shape_type(self, pptx_shape_type) -> str:
+        # Per-slide paths are composed from these prefixes as plain strings
+        self._out_dir_prefix = str(self.converted_data_dir) + os.sep
+        self._rel_prefix = self.converted_data_dir.relative_to(self.project_root).as_posix() + "/"
+        # Images are rendered here first; see _process_presentation
+        self._stage_prefix = self._out_dir_prefix
+        self._thumb_size: Optional[Tuple[int, int]] = None
+        # Fingerprint of the source file as it was when this run started
+        self._source_fingerprint: Optional[str] = None
+        # Slide size in EMU; set only when python-pptx and COM agree on the slides
+        self._pptx_slide_size: Optional[Tuple[int, int]] = None
+
+    @staticmethod
+    def map_shape_type(pptx_shape_type) -> str:
         """Maps python-pptx MSO_SHAPE_TYPE to simple strings."""
-        if pptx_shape_type in (MSO_SHAPE_TYPE.PLACEHOLDER, MSO_SHAPE_TYPE.AUTO_SHAPE,
-                               MSO_SHAPE_TYPE.FREEFORM, MSO_SHAPE_TYPE.GROUP):
-            return "SHAPE"
-        elif pptx_shape_type == MSO_SHAPE_TYPE.PICTURE:
-            return "PICTURE"
-        elif pptx_shape_type == MSO_SHAPE_TYPE.CHART:
-            return "CHART"
-        elif pptx_shape_type == MSO_SHAPE_TYPE.TABLE:
-            return "TABLE"
-        elif pptx_shape_type == MSO_SHAPE_TYPE.TEXT_BOX:
-            return "TEXT"
-        else:
-            return "UNKNOWN"
+        return _SHAPE_TYPE_MAP.get(pptx_shape_type, "UNKNOWN")
 
     @Slot()
     def run(self):
@@ -110,11 +264,20 @@ class SlideConverter(QRunnable):
 
         # Initialize resources
         db_worker = None
-        ppt_app = None
-        presentation_com = None
         com_initialized = False
         
         try:
+            # Database worker shared by all tasks on this pool thread
+            db_worker = get_thread_db(self.db_path)
+
+            # Nothing to do if this exact file was already converted and
+            # its images are still on disk
+            self._source_fingerprint = self._compute_source_fingerprint()
+            if self._is_up_to_date(db_worker):
+                logger.info(f"[Converter FID:{self.file_id}] Source unchanged since last conversion, skipping.")
+                self.signals.finished.emit(self.file_id)
+                return
+
             # Initialize COM for this thread
             try:
                 pythoncom.CoInitialize()
@@ -122,13 +285,12 @@ class SlideConverter(QRunnable):
                 logger.debug(f"[Converter FID:{self.file_id}] COM Initialized.")
             except Exception as e:
                 raise COMInitializationError(f"Failed to initialize COM: {e}") from e
-
-            # Create database worker
-            db_worker = DatabaseWorker(self.db_path)
             
-            # Update conversion status to In Progress
+            # Update conversion status to In Progress; the old fingerprint no
+            # longer describes the stored output
             try:
                 db_worker.update_file_conversion_status(self.file_id, "In Progress")
+                db_worker.set_file_fingerprint(self.file_id, None)
             except DatabaseError as e:
                 logger.warning(f"[Converter FID:{self.file_id}] Failed to update initial status: {e}")
 
@@ -156,7 +318,7 @@ class SlideConverter(QRunnable):
             
         finally:
             # Cleanup resources
-            self._cleanup(db_worker, presentation_com, ppt_app, com_initialized)
+            self._cleanup(com_initialized)
             
         logger.info(f"[Converter FID:{self.file_id}] Worker finished.")
 
@@ -172,23 +334,28 @@ class SlideConverter(QRunnable):
         """
         ppt_app = None
         presentation_com = None
-        presentation_pptx = None
+        slides_pptx = []
+        stage_dir = None
         
         try:
             # Open presentation with COM
             logger.debug(f"[Converter FID:{self.file_id}] Opening presentation via COM...")
             try:
-                ppt_app = win32com.client.Dispatch("PowerPoint.Application")
+                ppt_app = get_ppt_app()
                 presentation_com = ppt_app.Presentations.Open(
                     str(self.file_path), ReadOnly=True, WithWindow=False
                 )
-                total_slides = len(presentation_com.Slides)
+                slides_com = presentation_com.Slides
+                total_slides = len(slides_com)
                 logger.info(f"[Converter FID:{self.file_id}] Opened via COM. Found {total_slides} slides.")
             except pywintypes.com_error as e:
                 raise PresentationAccessError(
                     f"Cannot open PowerPoint file: {self.file_path.name}"
                 ) from e
 
+            # Thumbnail size follows the slide aspect ratio
+            self._thumb_size = self._compute_thumbnail_size(presentation_com)
+
             # Update slide count in database
             try:
                 db_worker.update_file_slide_count(self.file_id, total_slides)
@@ -199,47 +366,86 @@ class SlideConverter(QRunnable):
             logger.debug(f"[Converter FID:{self.file_id}] Opening presentation via python-pptx...")
             try:
                 presentation_pptx = Presentation(self.file_path)
-                if total_slides != len(presentation_pptx.slides):
+                # Materialize once; indexing .slides re-walks the part list
+                slides_pptx = list(presentation_pptx.slides)
+                if total_slides != len(slides_pptx):
                     logger.warning(
                         f"[Converter FID:{self.file_id}] Slide count mismatch! "
-                        f"COM: {total_slides}, python-pptx: {len(presentation_pptx.slides)}"
+                        f"COM: {total_slides}, python-pptx: {len(slides_pptx)}"
+                    )
+                else:
+                    self._pptx_slide_size = (
+                        presentation_pptx.slide_width, presentation_pptx.slide_height
                     )
             except Exception as e:
                 logger.error(f"[Converter FID:{self.file_id}] python-pptx error: {e}")
-                presentation_pptx = None  # Continue without shape extraction
+                slides_pptx = []  # Continue without shape extraction
 
             # Handle empty presentations
             if total_slides == 0:
                 logger.warning(f"[Converter FID:{self.file_id}] Presentation has no slides.")
-                db_worker.update_file_conversion_status(self.file_id, "Completed")
+                db_worker.set_file_fingerprint(self.file_id, self._source_fingerprint)
+                db_worker.delete_slides_after(self.file_id, 0, status="Completed")
                 self.signals.finished.emit(self.file_id)
                 return
 
-            # Process each slide
-            slides_processed = 0
+            # Render into a local temp dir and move files into the project
+            # once their slide is stored; the project folder may live on a
+            # slow or network drive
+            try:
+                stage_dir = tempfile.mkdtemp(prefix=f"slideman_{self.file_id}_")
+                self._stage_prefix = stage_dir + os.sep
+            except OSError as e:
+                logger.warning(f"[Converter FID:{self.file_id}] No local staging dir, writing in place: {e}")
+
+            # Process each slide as a pipeline: COM exports stay on this thread
+            # (the apartment that owns the COM objects) while a writer thread
+            # extracts shapes and stores finished slides in the database
             errors_encountered = []
+            written_slides = []
+            write_queue = queue.Queue(maxsize=PIPELINE_DEPTH)
+            writer = threading.Thread(
+                target=self._write_slides,
+                args=(db_worker, write_queue, written_slides, errors_encountered),
+                name=f"SlideWriter-{self.file_id}",
+                daemon=True,
+            )
+            writer.start()
             
-            for i in range(total_slides):
-                if self.is_cancelled:
-                    logger.info(f"[Converter FID:{self.file_id}] Conversion cancelled.")
-                    raise ValidationError("Conversion cancelled by user")
-
-                slide_index = i + 1
-                try:
-                    self._process_slide(
-                        db_worker, presentation_com, presentation_pptx, 
-                        slide_index, total_slides
-                    )
-                    slides_processed += 1
+            # Progress crosses into the GUI thread; throttle it so large
+            # decks don't flood the event loop
+            progress_timer = QElapsedTimer()
+            progress_timer.start()
+            
+            try:
+                for i in range(total_slides):
+                    if self.is_cancelled:
+                        logger.info(f"[Converter FID:{self.file_id}] Conversion cancelled.")
+                        raise ValidationError("Conversion cancelled by user")
+
+                    slide_index = i + 1
+                    try:
+                        write_queue.put(self._export_slide(
+                            slides_com, slides_pptx, slide_index, total_slides
+                        ))
+                        
+                    except Exception as e:
+                        error_msg = f"Failed to process slide {slide_index}: {str(e)}"
+                        logger.error(f"[Converter FID:{self.file_id}] {error_msg}")
+                        errors_encountered.append(error_msg)
+                        # Continue processing other slides
                     
-                except Exception as e:
-                    error_msg = f"Failed to process slide {slide_index}: {str(e)}"
-                    logger.error(f"[Converter FID:{self.file_id}] {error_msg}")
-                    errors_encountered.append(error_msg)
-                    # Continue processing other slides
-                
-                # Emit progress
-                self.signals.progress.emit(self.file_id, slide_index, total_slides)
+                    # Emit progress (always for the last slide)
+                    if (slide_index == total_slides
+                            or progress_timer.elapsed() >= PROGRESS_INTERVAL_MS):
+                        self.signals.progress.emit(self.file_id, slide_index, total_slides)
+                        progress_timer.restart()
+            finally:
+                # Let the writer drain what was exported, then stop
+                write_queue.put(None)
+                writer.join()
+            
+            slides_processed = len(written_slides)
 
             # Determine final status
             if errors_encountered:
@@ -251,149 +457,407 @@ class SlideConverter(QRunnable):
                         f"[Converter FID:{self.file_id}] Processed {slides_processed}/{total_slides} slides. "
                         f"Errors: {len(errors_encountered)}"
                     )
-                    db_worker.update_file_conversion_status(self.file_id, "Completed")
+                    db_worker.delete_slides_after(self.file_id, total_slides, status="Completed")
                     self.signals.finished.emit(self.file_id)
             else:
                 # Complete success
                 logger.info(f"[Converter FID:{self.file_id}] Successfully processed all {total_slides} slides.")
-                db_worker.update_file_conversion_status(self.file_id, "Completed")
+                db_worker.set_file_fingerprint(self.file_id, self._source_fingerprint)
+                # Slides past the new end are left over from an earlier,
+                # longer version of the deck
+                db_worker.delete_slides_after(self.file_id, total_slides, status="Completed")
                 self.signals.finished.emit(self.file_id)
                 
         finally:
-            # Cleanup COM objects
+            if stage_dir:
+                self._stage_prefix = self._out_dir_prefix
+                shutil.rmtree(stage_dir, ignore_errors=True)
+
+            # Cleanup COM objects; PowerPoint itself stays running for the
+            # next file and is quit once at exit
             if presentation_com:
                 try:
                     presentation_com.Close()
                 except Exception as e:
                     logger.error(f"[Converter FID:{self.file_id}] Error closing presentation: {e}")
-            if ppt_app:
-                try:
-                    ppt_app.Quit()
-                except Exception as e:
-                    logger.error(f"[Converter FID:{self.file_id}] Error quitting PowerPoint: {e}")
 
-    def _process_slide(self, db_worker: DatabaseWorker, presentation_com, 
-                      presentation_pptx, slide_index: int, total_slides: int):
+    def _compute_source_fingerprint(self) -> Optional[str]:
         """
-        Process a single slide.
+        Fingerprint the source file by size and modification time.
+        
+        Returns:
+            "size:mtime_ns", or None if the file can't be stat'ed.
+        """
+        try:
+            st = os.stat(self.file_path)
+        except OSError:
+            return None
+        return f"{st.st_size}:{st.st_mtime_ns}"
+
+    def _is_up_to_date(self, db_worker: DatabaseWorker) -> bool:
+        """
+        Check whether a previous complete conversion of this exact source can be kept.
         
         Args:
             db_worker: Database worker instance.
-            presentation_com: COM presentation object.
-            presentation_pptx: python-pptx presentation object.
+            
+        Returns:
+            True if the stored fingerprint matches the source and every slide
+            image and thumbnail recorded for the file still exists.
+        """
+        if self._source_fingerprint is None:
+            return False
+        try:
+            if db_worker.get_file_fingerprint(self.file_id) != self._source_fingerprint:
+                return False
+            slide_paths = db_worker.get_slide_paths_for_file(self.file_id)
+        except DatabaseError as e:
+            logger.warning(f"[Converter FID:{self.file_id}] Could not check previous conversion: {e}")
+            return False
+
+        root_prefix = str(self.project_root) + os.sep
+        return all(
+            not rel_path or os.path.exists(root_prefix + rel_path)
+            for paths in slide_paths
+            for rel_path in paths
+        )
+
+    def _export_slide(self, slides_com, slides_pptx,
+                      slide_index: int, total_slides: int) -> tuple:
+        """
+        Export a single slide's images via COM (pipeline stage 1).
+        
+        Args:
+            slides_com: COM Slides collection of the presentation.
+            slides_pptx: List of python-pptx slides (may be empty).
             slide_index: 1-based slide index.
             total_slides: Total number of slides.
             
+        Returns:
+            Work item for _write_slides: (slide_index, slide_pptx, image_rel_path,
+            img_full_path, thumb_rel_path, thumb_filename).
+            
         Raises:
-            SlideExportError: If slide processing fails.
+            SlideExportError: If the slide image cannot be exported.
         """
         logger.debug(f"[Converter FID:{self.file_id}] Processing slide {slide_index}/{total_slides}")
         
         try:
             # Get slide objects
-            slide_com = presentation_com.Slides(slide_index)
+            slide_com = slides_com(slide_index)
             slide_pptx = None
-            if presentation_pptx and (slide_index - 1) < len(presentation_pptx.slides):
-                slide_pptx = presentation_pptx.slides[slide_index - 1]
-
-            # Export full-resolution image
-            img_filename = f"image_{slide_index}.png"
-            img_full_path = self.converted_data_dir / img_filename
-            
-            try:
-                slide_com.Export(str(img_full_path), "PNG")
-                image_rel_path = img_full_path.relative_to(self.project_root).as_posix()
-            except Exception as e:
-                raise SlideExportError(f"Failed to export slide image: {e}") from e
+            if slide_index <= len(slides_pptx):
+                slide_pptx = slides_pptx[slide_index - 1]
+
+            # Export full-resolution image, unless the slide is just one
+            # full-bleed picture that can be copied out of the package
+            img_filename = self._write_picture_blob(slide_pptx, slide_index) if slide_pptx else None
+            if img_filename is None:
+                img_filename = f"image_{slide_index}.png"
+                try:
+                    slide_com.Export(self._stage_prefix + img_filename, "PNG")
+                except Exception as e:
+                    raise SlideExportError(f"Failed to export slide image: {e}") from e
+            img_full_path = self._stage_prefix + img_filename
+            image_rel_path = self._rel_prefix + img_filename
 
-            # Create thumbnail
-            thumb_filename = f"thumb_{slide_index}.png"
-            thumb_full_path = self.converted_data_dir / thumb_filename
-            thumb_rel_path = self._create_thumbnail(img_full_path, thumb_full_path)
+            # Render thumbnail directly at thumbnail size; if that fails the
+            # writer scales it from the full image instead
+            thumb_filename = f"thumb_{slide_index}.jpg"
+            thumb_rel_path = self._export_thumbnail(slide_com, thumb_filename)
 
-            # Add slide to database
-            slide_id = db_worker.add_slide_with_paths(
-                self.file_id, slide_index, thumb_rel_path, image_rel_path
-            )
-
-            # Extract and store elements if available
-            if slide_pptx:
-                self._extract_elements(db_worker, slide_id, slide_pptx)
+            return (slide_index, slide_pptx, image_rel_path, img_full_path,
+                    thumb_rel_path, thumb_filename)
                 
         except Exception as e:
             raise SlideExportError(f"Slide {slide_index} processing failed: {e}") from e
 
-    def _create_thumbnail(self, source_path: Path, thumb_path: Path) -> Optional[str]:
+    def _write_slides(self, db_worker: DatabaseWorker, write_queue: queue.Queue,
+                      written_slides: List[int], errors: List[str]):
+        """
+        Finish exported slides and store them in the database (pipeline stage 2).
+        
+        Runs on its own thread until it receives None from the queue. The
+        DatabaseWorker hands this thread its own connection, closed on exit.
+        
+        Args:
+            db_worker: Database worker instance.
+            write_queue: Queue of work items from _export_slide.
+            written_slides: Receives the 1-based index of each stored slide.
+            errors: Receives an error message for each slide that failed.
+        """
+        try:
+            while True:
+                item = write_queue.get()
+                if item is None:
+                    break
+                
+                (slide_index, slide_pptx, image_rel_path, img_full_path,
+                 thumb_rel_path, thumb_filename) = item
+                try:
+                    if thumb_rel_path is None:
+                        thumb_rel_path = self._create_thumbnail(img_full_path, thumb_filename)
+
+                    # Extract element geometry if available
+                    elements = self._extract_elements(slide_pptx) if slide_pptx else []
+
+                    # Add slide and its elements to database in one transaction
+                    db_worker.add_slide_with_elements(
+                        self.file_id, slide_index, thumb_rel_path, image_rel_path, elements
+                    )
+                    self._publish_files(image_rel_path, thumb_rel_path)
+                    written_slides.append(slide_index)
+                    
+                except Exception as e:
+                    error_msg = f"Failed to store slide {slide_index}: {str(e)}"
+                    logger.error(f"[Converter FID:{self.file_id}] {error_msg}")
+                    errors.append(error_msg)
+        finally:
+            db_worker.close()
+
+    def _publish_files(self, *rel_paths: Optional[str]):
+        """
+        Move staged slide images into the converted data dir.
+        
+        Args:
+            rel_paths: Relative paths as stored in the database; None is skipped.
+            
+        Raises:
+            OSError: If a file cannot be moved.
+        """
+        if self._stage_prefix == self._out_dir_prefix:
+            return
+        for rel_path in rel_paths:
+            if rel_path:
+                filename = rel_path[len(self._rel_prefix):]
+                shutil.move(self._stage_prefix + filename, self._out_dir_prefix + filename)
+
+    def _compute_thumbnail_size(self, presentation_com) -> Optional[Tuple[int, int]]:
+        """
+        Compute the thumbnail pixel size from the presentation's slide aspect ratio.
+        
+        Args:
+            presentation_com: COM presentation object.
+            
+        Returns:
+            (width, height) in pixels, or None if the page setup can't be read.
+        """
+        try:
+            page_setup = presentation_com.PageSetup
+            slide_width, slide_height = page_setup.SlideWidth, page_setup.SlideHeight
+            if slide_width <= 0 or slide_height <= 0:
+                return None
+            return round(THUMBNAIL_HEIGHT * slide_width / slide_height), THUMBNAIL_HEIGHT
+        except pywintypes.com_error as e:
+            logger.warning(f"[Converter FID:{self.file_id}] Could not read slide size: {e}")
+            return None
+
+    def _write_picture_blob(self, slide_pptx, slide_index: int) -> Optional[str]:
+        """
+        Write the slide image straight from the package for picture-only slides.
+        
+        Applies when the slide's only shape is an uncropped, unrotated and
+        unflipped picture covering the whole slide, drawn without image
+        effects and with the slide's aspect ratio, so the embedded image is
+        what the slide shows.
+        
+        Args:
+            slide_pptx: python-pptx slide object.
+            slide_index: 1-based slide index.
+            
+        Returns:
+            Image file name within the converted data dir, or None if the
+            slide has to be rendered via COM.
+        """
+        if not self._pptx_slide_size:
+            return None
+        try:
+            shapes = slide_pptx.shapes
+            if len(shapes) != 1:
+                return None
+            shape = shapes[0]
+            if shape.shape_type != MSO_SHAPE_TYPE.PICTURE:
+                return None
+            slide_width, slide_height = self._pptx_slide_size
+            if (shape.left > 0 or shape.top > 0
+                    or shape.left + shape.width < slide_width
+                    or shape.top + shape.height < slide_height):
+                return None
+            if shape.crop_left or shape.crop_top or shape.crop_right or shape.crop_bottom:
+                return None
+            if not self._is_plain_picture(shape._element):
+                return None
+            image = shape.image  # Raises for linked pictures
+            if image.ext not in PASSTHROUGH_IMAGE_EXTS:
+                return None
+            # A picture stretched to another aspect ratio renders distorted
+            slide_aspect = slide_width / slide_height
+            pixel_width, pixel_height = image.size
+            for aspect in (shape.width / shape.height, pixel_width / pixel_height):
+                if abs(aspect / slide_aspect - 1) > PASSTHROUGH_ASPECT_TOLERANCE:
+                    return None
+            img_filename = f"image_{slide_index}.{image.ext}"
+            with open(self._stage_prefix + img_filename, "wb") as f:
+                f.write(image.blob)
+        except Exception as e:
+            logger.debug(f"[Converter FID:{self.file_id}] Picture shortcut not used for slide {slide_index}: {e}")
+            return None
+
+        logger.debug(f"[Converter FID:{self.file_id}] Copied embedded picture for slide {slide_index}")
+        return img_filename
+
+    @staticmethod
+    def _is_plain_picture(pic) -> bool:
+        """
+        Check that a picture is drawn as stored: no rotation, flips, tiling or image effects.
+        
+        Args:
+            pic: The picture's p:pic element.
+            
+        Returns:
+            True if the picture's pixels appear on the slide unchanged.
+        """
+        for xfrm in pic.xpath("./p:spPr/a:xfrm"):
+            if xfrm.get("rot", "0") != "0":
+                return False
+            if xfrm.get("flipH") in ("1", "true") or xfrm.get("flipV") in ("1", "true"):
+                return False
+        if pic.xpath("./p:blipFill/a:tile"):
+            return False
+        # Recolor, alpha, duotone and the like are children of a:blip; the
+        # artistic effects live in its extension list
+        if pic.xpath("./p:blipFill/a:blip/*[not(self::a:extLst)]"):
+            return False
+        return all(
+            uri == _USE_LOCAL_DPI_EXT_URI
+            for uri in pic.xpath("./p:blipFill/a:blip/a:extLst/a:ext/@uri")
+        )
+
+    def _export_thumbnail(self, slide_com, thumb_filename: str) -> Optional[str]:
+        """
+        Export the thumbnail directly at its final size via COM.
+        
+        Avoids re-reading and decoding the full-resolution image from disk.
+        
+        Args:
+            slide_com: COM slide object.
+            thumb_filename: Thumbnail file name within the converted data dir.
+            
+        Returns:
+            Relative path to thumbnail or None if failed.
+        """
+        if not self._thumb_size:
+            return None
+        try:
+            width, height = self._thumb_size
+            slide_com.Export(self._stage_prefix + thumb_filename, "JPG", width, height)
+            return self._rel_prefix + thumb_filename
+        except pywintypes.com_error as e:
+            logger.warning(f"[Converter FID:{self.file_id}] Direct thumbnail export failed: {e}")
+            return None
+
+    def _create_thumbnail(self, source_path: str, thumb_filename: str) -> Optional[str]:
         """
         Create a thumbnail from the source image.
         
         Args:
             source_path: Path to source image.
-            thumb_path: Path for thumbnail output.
+            thumb_filename: Thumbnail file name within the converted data dir.
             
         Returns:
             Relative path to thumbnail or None if failed.
         """
+        thumb_path = self._stage_prefix + thumb_filename
         try:
-            pixmap = QPixmap(str(source_path))
-            if pixmap.isNull():
+            if HAS_PIL:
+                # Pillow's resize is vectorized (more so with pillow-simd) and
+                # draft() lets the JPEG decoder downscale while decoding
+                with Image.open(source_path) as image:
+                    image.draft("RGB", (image.width * THUMBNAIL_HEIGHT // image.height, THUMBNAIL_HEIGHT))
+                    image.thumbnail((image.width, THUMBNAIL_HEIGHT), Image.Resampling.LANCZOS)
+                    image.convert("RGB").save(thumb_path, "JPEG", quality=THUMBNAIL_QUALITY)
+                return self._rel_prefix + thumb_filename
+
+            # QImage rather than QPixmap: plain pixels, no platform pixmap
+            # conversion, and safe to use off the GUI thread
+            image = QImage(source_path)
+            if image.isNull():
                 logger.error(f"[Converter FID:{self.file_id}] Failed to load image: {source_path}")
                 return None
 
             # Scale to desired height, keeping aspect ratio
-            thumb_pixmap = pixmap.scaledToHeight(
+            thumb_image = image.scaledToHeight(
                 THUMBNAIL_HEIGHT, Qt.TransformationMode.SmoothTransformation
             )
             
-            if not thumb_pixmap.save(str(thumb_path), "PNG"):
+            if not thumb_image.save(thumb_path, "JPEG", THUMBNAIL_QUALITY):
                 logger.error(f"[Converter FID:{self.file_id}] Failed to save thumbnail: {thumb_path}")
                 return None
                 
-            return thumb_path.relative_to(self.project_root).as_posix()
+            return self._rel_prefix + thumb_filename
             
         except Exception as e:
             logger.error(f"[Converter FID:{self.file_id}] Thumbnail creation failed: {e}")
             return None
 
-    def _extract_elements(self, db_worker: DatabaseWorker, slide_id: int, slide_pptx):
+    def _extract_elements(self, slide_pptx) -> List[Tuple[str, float, float, float, float]]:
         """
-        Extract elements from a slide using python-pptx.
+        Extract elements from a slide's top-level shapes.
+        
+        Geometry and type are read straight from the shape tree XML. Only
+        placeholders, which may inherit their position from the layout, are
+        resolved through python-pptx shape objects.
         
         Args:
-            db_worker: Database worker instance.
-            slide_id: Database ID of the slide.
             slide_pptx: python-pptx slide object.
+            
+        Returns:
+            List of (element_type, bbox_x, bbox_y, bbox_w, bbox_h) tuples in EMU.
         """
-        element_count = 0
+        elements = []
+        # Bind hot lookups to locals
+        append = elements.append
+        map_shape_type = self.map_shape_type
+        shapes = slide_pptx.shapes
         
-        for shape in slide_pptx.shapes:
+        shape_elms = slide_pptx.element.cSld.spTree.iterchildren(
+            _TAG_SP, _TAG_PIC, _TAG_GRAPHIC_FRAME, _TAG_GROUP, _TAG_CONNECTOR
+        )
+        for shape_elm in shape_elms:
             try:
-                # Check if shape has required attributes
-                if not all(hasattr(shape, attr) for attr in ['shape_type', 'left', 'top', 'width', 'height']):
+                if _xpath_placeholder(shape_elm):
+                    shape = SlideShapeFactory(shape_elm, shapes)
+                    left, top, width, height = shape.left, shape.top, shape.width, shape.height
+                    if left is None or top is None or width is None or height is None:
+                        continue
+                    append((
+                        map_shape_type(shape.shape_type),
+                        float(left), float(top), float(width), float(height)
+                    ))
                     continue
-                    
-                if any(getattr(shape, attr) is None for attr in ['left', 'top', 'width', 'height']):
+
+                element_type = _classify_shape_element(shape_elm)
+                xfrm = _xpath_xfrm(shape_elm)
+                if element_type is None or not xfrm:
+                    continue
+                off = xfrm[0].find(_TAG_OFF)
+                ext = xfrm[0].find(_TAG_EXT)
+                if off is None or ext is None:
                     continue
 
-                # Extract shape data
-                element_type = self.map_shape_type(shape.shape_type)
-                
-                # Extract text content if available
-                content = ""
-                if hasattr(shape, 'has_text_frame') and shape.has_text_frame:
-                    content = shape.text.strip()
-
-                # Add element to database
-                element_id = db_worker.add_element(slide_id, element_type, content)
-                if element_id:
-                    element_count += 1
+                append((
+                    element_type,
+                    float(off.get("x")), float(off.get("y")),
+                    float(ext.get("cx")), float(ext.get("cy"))
+                ))
                     
             except Exception as e:
                 logger.warning(
                     f"[Converter FID:{self.file_id}] Failed to extract element: {e}"
                 )
                 
-        logger.debug(f"[Converter FID:{self.file_id}] Extracted {element_count} elements from slide {slide_id}")
+        logger.debug(f"[Converter FID:{self.file_id}] Extracted {len(elements)} elements")
+        return elements
 
     def _update_status_safe(self, db_worker: Optional[DatabaseWorker], status: str):
         """Safely update file status, handling errors."""
@@ -403,17 +867,12 @@ class SlideConverter(QRunnable):
             except Exception as e:
                 logger.error(f"[Converter FID:{self.file_id}] Failed to update status to {status}: {e}")
 
-    def _cleanup(self, db_worker: Optional[DatabaseWorker], 
-                presentation_com, ppt_app, com_initialized: bool):
-        """Clean up all resources."""
-        # Close database connection
-        if db_worker:
-            try:
-                db_worker.close()
-                logger.debug(f"[Converter FID:{self.file_id}] Closed database connection")
-            except Exception as e:
-                logger.error(f"[Converter FID:{self.file_id}] Error closing database: {e}")
-
+    def _cleanup(self, com_initialized: bool):
+        """
+        Clean up all resources.
+        
+        The database worker is shared by tasks on this thread and stays open.
+        """
         # Cleanup COM
         if com_initialized:
             try:
@@ -14,6 +14,7 @@ from PySide6.QtCore import QObject, Slot, Qt
 from ..app_state import app_state
 # Need Database service type hint
 from .database import Database
+from .exceptions import DatabaseError, ResourceNotFoundError
 
 logger = logging.getLogger(__name__)
 
@@ -125,26 +126,12 @@ class ThumbnailCache(QObject):
         # Derive project path if not set in AppState
         if not current_project_path_str:
             try:
-                # Use the database service's method to get connection properly
-                conn = db_service._get_connection() if hasattr(db_service, '_get_connection') else db_service._conn
-                if not conn:
-                    logger.warning(f"No database connection available for SlideID {slide_id}, using placeholder thumbnail.")
-                    return self._get_placeholder()
-                    
-                cur = conn.cursor()
-                cur.execute(
-                    "SELECT p.folder_path FROM projects p "
-                    "JOIN files f ON f.project_id = p.id "
-                    "JOIN slides s ON s.file_id = f.id WHERE s.id = ?;",
-                    (slide_id,)
-                )
-                row = cur.fetchone()
-                if row and row[0]:
-                    current_project_path_str = row[0]
-                else:
-                    logger.warning(f"Cannot derive project path for SlideID {slide_id}, using placeholder thumbnail.")
-                    return self._get_placeholder()
-            except Exception as e:
+                # Single primary-key read on slide_origins
+                current_project_path_str = db_service.get_project_folder_path_for_slide(slide_id)
+            except ResourceNotFoundError:
+                logger.warning(f"Cannot derive project path for SlideID {slide_id}, using placeholder thumbnail.")
+                return self._get_placeholder()
+            except DatabaseError as e:
                 logger.warning(
                     f"Failed to derive project path for SlideID {slide_id}: {e}, using placeholder.",
                     exc_info=True
@@ -448,20 +448,18 @@ class ProjectsPage(QWidget):
         # --- Perform Database Operations ---
         self.logger.info(f"Adding project '{project_name}' to database.")
         try:
-            project_id = self.db.add_project(project_name, str(project_folder_path))
-            if project_id is None:
-                # Use specific project name in error
-                raise RuntimeError(f"Failed to add project '{project_name}' to database (returned None).")
-
-            files_added_to_db = 0
-            for rel_path_str, checksum in copied_files_info.items():
-                filename = Path(rel_path_str).name
-                file_id = self.db.add_file(project_id, filename, rel_path_str, checksum)
-                if file_id is None:
-                    self.logger.error(f"Failed to add file record to DB for: {rel_path_str} in project ID {project_id}")
-                else:
-                    files_added_to_db += 1
-                    newly_added_file_ids.append(file_id) # Store successfully added ID
+            # One transaction for the project and all its file records
+            with self.db.write_batch():
+                project_id = self.db.add_project(project_name, str(project_folder_path))
+                if project_id is None:
+                    # Use specific project name in error
+                    raise RuntimeError(f"Failed to add project '{project_name}' to database (returned None).")
+
+                newly_added_file_ids = self.db.add_files_bulk([
+                    (project_id, Path(rel_path_str).name, rel_path_str, checksum)
+                    for rel_path_str, checksum in copied_files_info.items()
+                ])
+                files_added_to_db = len(newly_added_file_ids)
 
             self.logger.info(f"Successfully added project '{project_name}' (ID: {project_id}) with {files_added_to_db} file records.")
             db_success = True # Mark success
@@ -1246,29 +1244,12 @@ class ProjectsPage(QWidget):
             files = self.db.get_files_for_project(project.id)
             file_count = len(files)
             
-            # Count slides across all files
-            slide_count = 0
-            completed_files = 0
-            for file in files:
-                if file.conversion_status == "Completed":
-                    slides = self.db.get_slides_for_file(file.id)
-                    slide_count += len(slides)
-                    completed_files += 1
-            
-            # Count unique keywords for this project
-            keyword_count = 0
-            try:
-                # Get all keywords used in this project
-                all_keywords = set()
-                for file in files:
-                    if file.conversion_status == "Completed":
-                        slides = self.db.get_slides_for_file(file.id)
-                        for slide in slides:
-                            slide_keywords = self.db.get_keywords_for_slide(slide.id)
-                            all_keywords.update(kw.name for kw in slide_keywords)
-                keyword_count = len(all_keywords)
-            except Exception as e:
-                self.logger.warning(f"Could not count keywords for project {project.id}: {e}")
+            # Slide and keyword totals come from one aggregate query each
+            # instead of walking every file and slide; only converted files'
+            # slides are counted
+            completed_files = sum(1 for file in files if file.conversion_status == "Completed")
+            slide_count = self.db.get_completed_slide_count_for_project(project.id)
+            keyword_count = self.db.get_keyword_count_for_project(project.id)
             
             # Determine status
             if file_count == 0:
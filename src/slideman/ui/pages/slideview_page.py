@@ -539,31 +539,12 @@ class SlideViewPage(QWidget):
         # 3. Update file filter dropdown
         self._update_file_filter(files)
         
-        # 4. Load slides from all files
-        all_slides = []
-        
-        for file_obj in files:
-            # Get slides for each file
-            file_id = file_obj.id
-            self.logger.debug(f"Getting slides for file ID: {file_id}")
-            try:
-                slides_for_file = self.db.get_slides_for_file(file_id)
-                
-                if slides_for_file:
-                    self.logger.debug(f"Found {len(slides_for_file)} slides for file {file_id}")
-                    # For debugging, show first slide's path
-                    if slides_for_file:
-                        first_slide = slides_for_file[0]
-                        self.logger.debug(f"Slide {first_slide.id}: thumb_path={first_slide.thumb_rel_path}")
-                    
-                    # Add these slides to the combined list
-                    all_slides.extend(slides_for_file)
-                else:
-                    self.logger.warning(f"No slides found for file ID: {file_id}")
-            except DatabaseError as e:
-                self.logger.error(f"Database error loading slides for file ID {file_id}: {e}", exc_info=True)
-                # Continue loading other files
-                continue
+        # 4. Load slides from all files in one query, in file order
+        try:
+            all_slides = self.db.get_slide_models_for_project(project.id)
+        except DatabaseError as e:
+            self.logger.error(f"Database error loading slides for project ID {project.id}: {e}", exc_info=True)
+            all_slides = []
         
         # Store all slides for later filtering
         self._all_slides = all_slides
@@ -697,8 +678,7 @@ class SlideViewPage(QWidget):
             first_keyword = True
             
             for keyword_id in keyword_ids:
-                slides_for_keyword = self.db.get_slides_for_keyword(keyword_id)
-                slide_ids_for_keyword = {slide.id for slide in slides_for_keyword}
+                slide_ids_for_keyword = set(self.db.get_slide_ids_for_keyword(keyword_id))
                 
                 if first_keyword:
                     matching_slide_ids = slide_ids_for_keyword
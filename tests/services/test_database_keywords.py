@@ -0,0 +1,122 @@
+# tests/services/test_database_keywords.py
+
+from pathlib import Path
+
+import pytest
+
+from slideman.services.database import Database
+from slideman.services.exceptions import ResourceNotFoundError, ValidationError
+
+
+@pytest.fixture
+def file_db(tmp_path: Path) -> Database:
+    """A connected Database on a temporary file, closed after the test."""
+    db = Database(tmp_path / "keywords_test.db")
+    assert db.connect(), "Failed to connect to temporary database"
+    yield db
+    db.close()
+
+
+@pytest.fixture
+def slides(file_db: Database, tmp_path: Path):
+    """Two slides of one file."""
+    project_id = file_db.add_project("P", str(tmp_path / "p"))
+    file_id = file_db.add_file(project_id, "deck.pptx", "deck.pptx", "c")
+    return file_db.add_slide(file_id, 1, "t", "i"), file_db.add_slide(file_id, 2, "t", "i")
+
+
+def keyword_texts(db: Database, slide_id: int, kind: str = None):
+    return [k.keyword for k in db.get_keywords_for_slide(slide_id, kind)]
+
+
+class TestReplaceSlideKeywords:
+
+    def test_sets_adds_and_removes(self, file_db: Database, slides):
+        slide_id, _ = slides
+        assert file_db.replace_slide_keywords(slide_id, "topic", ["Budget", "Chart"])
+        assert keyword_texts(file_db, slide_id) == ["Budget", "Chart"]
+
+        file_db.replace_slide_keywords(slide_id, "topic", ["Chart", "Forecast"])
+        assert keyword_texts(file_db, slide_id) == ["Chart", "Forecast"]
+
+    def test_keeps_link_ids_of_unchanged_keywords(self, file_db: Database, slides):
+        slide_id, _ = slides
+        file_db.replace_slide_keywords(slide_id, "topic", ["Budget", "Chart"])
+        ids = {k.keyword: k.id for k in file_db.get_keywords_for_slide(slide_id)}
+
+        file_db.replace_slide_keywords(slide_id, "topic", ["Chart", "Budget", "Chart"])
+        assert {k.keyword: k.id for k in file_db.get_keywords_for_slide(slide_id)} == ids
+
+    def test_only_touches_the_given_kind_and_slide(self, file_db: Database, slides):
+        slide_id, other_slide_id = slides
+        file_db.replace_slide_keywords(slide_id, "topic", ["Budget"])
+        file_db.replace_slide_keywords(slide_id, "name", ["Alice"])
+        file_db.replace_slide_keywords(other_slide_id, "topic", ["Budget"])
+
+        file_db.replace_slide_keywords(slide_id, "topic", [])
+
+        assert keyword_texts(file_db, slide_id) == ["Alice"]
+        assert keyword_texts(file_db, other_slide_id) == ["Budget"]
+
+    def test_ignores_blank_texts(self, file_db: Database, slides):
+        slide_id, _ = slides
+        file_db.replace_slide_keywords(slide_id, "topic", ["", "  ", " Budget "])
+        assert keyword_texts(file_db, slide_id) == ["Budget"]
+
+    def test_invalid_kind_raises(self, file_db: Database, slides):
+        slide_id, _ = slides
+        with pytest.raises(ValidationError):
+            file_db.replace_slide_keywords(slide_id, "colour", ["Red"])
+
+
+class TestMergeKeywords:
+
+    def test_moves_links_and_deletes_source(self, file_db: Database, slides):
+        slide_id, other_slide_id = slides
+        source = file_db.add_keyword_if_not_exists("budgt", "topic")
+        target = file_db.add_keyword_if_not_exists("budget", "topic")
+        file_db.link_slide_keyword(slide_id, source)
+        file_db.link_slide_keyword(other_slide_id, source)
+        file_db.link_slide_keyword(other_slide_id, target)
+
+        assert file_db.merge_keywords(source, target)
+
+        assert sorted(file_db.get_slide_ids_for_keyword(target)) == sorted(slides)
+        assert file_db.get_slide_ids_for_keyword(source) == []
+        assert [k.keyword for k in file_db.search_keywords("budg")] == ["budget"]
+
+    def test_cross_kind_merge_is_rejected(self, file_db: Database, slides):
+        slide_id, _ = slides
+        source = file_db.add_keyword_if_not_exists("Alice", "name")
+        target = file_db.add_keyword_if_not_exists("Alice", "topic")
+        file_db.link_slide_keyword(slide_id, source)
+
+        with pytest.raises(ValidationError, match="'name' keyword into a 'topic'"):
+            file_db.merge_keywords(source, target)
+
+        # Nothing moved
+        assert file_db.get_slide_ids_for_keyword(source) == [slide_id]
+        assert file_db.get_slide_ids_for_keyword(target) == []
+
+    def test_cross_kind_pair_in_bulk_merge_is_rejected(self, file_db: Database):
+        topic = file_db.add_keyword_if_not_exists("a", "topic")
+        other_topic = file_db.add_keyword_if_not_exists("b", "topic")
+        name = file_db.add_keyword_if_not_exists("c", "name")
+
+        with pytest.raises(ValidationError):
+            file_db.merge_keywords_bulk([(topic, other_topic), (name, other_topic)])
+
+        # The valid pair before it is rolled back too
+        assert [k.keyword for k in file_db.get_all_keywords_by_kind("topic")] == ["a", "b"]
+
+    def test_self_merge_is_rejected(self, file_db: Database):
+        keyword_id = file_db.add_keyword_if_not_exists("budget", "topic")
+        with pytest.raises(ValidationError):
+            file_db.merge_keywords(keyword_id, keyword_id)
+
+    def test_missing_keyword_raises(self, file_db: Database):
+        keyword_id = file_db.add_keyword_if_not_exists("budget", "topic")
+        with pytest.raises(ResourceNotFoundError):
+            file_db.merge_keywords(keyword_id, keyword_id + 100)
+        with pytest.raises(ResourceNotFoundError):
+            file_db.merge_keywords(keyword_id + 100, keyword_id)
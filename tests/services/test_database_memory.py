@@ -0,0 +1,61 @@
+# tests/services/test_database_memory.py
+
+import threading
+from pathlib import Path
+
+import pytest
+
+from slideman.services.database import Database
+
+
+@pytest.fixture
+def memory_db() -> Database:
+    """A connected in-memory Database, closed after the test."""
+    db = Database(Path(":memory:"))
+    assert db.connect(), "Failed to connect to in-memory database"
+    yield db
+    db.close()
+
+
+def test_memory_db_concurrent_writers_batches_and_readers(memory_db: Database):
+    """Concurrent use of an in-memory database neither fails nor loses writes."""
+    project_id = memory_db.add_project("P", "/tmp/slideman_memory_test")
+    errors = []
+
+    def writer(n: int):
+        try:
+            for i in range(50):
+                file_id = memory_db.add_file(project_id, f"w{n}_{i}", f"w{n}_{i}.pptx", "c")
+                memory_db.add_slide(file_id, 1, "t", "i")
+        except Exception as e:
+            errors.append(e)
+
+    def batcher(n: int):
+        try:
+            for i in range(25):
+                with memory_db.write_batch():
+                    file_id = memory_db.add_file(project_id, f"b{n}_{i}", f"b{n}_{i}.pptx", "c")
+                    memory_db.add_slide(file_id, 1, "t", "i")
+                    memory_db.add_slide(file_id, 2, "t", "i")
+        except Exception as e:
+            errors.append(e)
+
+    def reader():
+        try:
+            for _ in range(100):
+                memory_db.get_slides_for_project(project_id)
+                memory_db.search_keywords("x")
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=writer, args=(n,)) for n in range(4)]
+    threads += [threading.Thread(target=batcher, args=(n,)) for n in range(2)]
+    threads += [threading.Thread(target=reader) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=60)
+
+    assert not any(thread.is_alive() for thread in threads)
+    assert errors == []
+    assert memory_db.get_slide_count_for_project(project_id) == 4 * 50 + 2 * 25 * 2
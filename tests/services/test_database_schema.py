@@ -0,0 +1,230 @@
+# tests/services/test_database_schema.py
+
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from slideman.services.database import Database, DB_SCHEMA_VERSION
+
+# Schema as shipped at version 3, including its external-content slides_fts
+V3_SCHEMA = """
+CREATE TABLE projects (
+    id            INTEGER PRIMARY KEY AUTOINCREMENT,
+    name          TEXT    NOT NULL,
+    folder_path   TEXT    NOT NULL UNIQUE,
+    created_at    TEXT    DEFAULT (datetime('now', 'localtime'))
+);
+CREATE TABLE files (
+    id            INTEGER PRIMARY KEY AUTOINCREMENT,
+    project_id    INTEGER NOT NULL REFERENCES projects(id) ON DELETE CASCADE,
+    filename      TEXT    NOT NULL,
+    rel_path      TEXT    NOT NULL,
+    slide_count   INTEGER,
+    checksum      TEXT,
+    conversion_status TEXT DEFAULT 'Pending' CHECK(conversion_status IN ('Pending', 'In Progress', 'Completed', 'Failed')),
+    created_at    TEXT    DEFAULT (datetime('now', 'localtime')),
+    UNIQUE(project_id, rel_path)
+);
+CREATE TABLE slides (
+    id            INTEGER PRIMARY KEY AUTOINCREMENT,
+    file_id       INTEGER NOT NULL REFERENCES files(id) ON DELETE CASCADE,
+    slide_index   INTEGER NOT NULL,
+    title         TEXT,
+    thumb_rel_path TEXT,
+    image_rel_path TEXT,
+    UNIQUE(file_id, slide_index)
+);
+CREATE TABLE elements (
+    id            INTEGER PRIMARY KEY AUTOINCREMENT,
+    slide_id      INTEGER NOT NULL REFERENCES slides(id) ON DELETE CASCADE,
+    element_type  TEXT    NOT NULL,
+    bbox_x        REAL    NOT NULL,
+    bbox_y        REAL    NOT NULL,
+    bbox_w        REAL    NOT NULL,
+    bbox_h        REAL    NOT NULL
+);
+CREATE TABLE keywords (
+    id      INTEGER PRIMARY KEY AUTOINCREMENT,
+    keyword TEXT    NOT NULL,
+    kind    TEXT    NOT NULL CHECK(kind IN ('topic', 'title', 'name')),
+    UNIQUE(keyword, kind)
+);
+CREATE TABLE slide_keywords (
+    slide_id   INTEGER NOT NULL REFERENCES slides(id) ON DELETE CASCADE,
+    keyword_id INTEGER NOT NULL REFERENCES keywords(id) ON DELETE CASCADE,
+    PRIMARY KEY (slide_id, keyword_id)
+);
+CREATE TABLE element_keywords (
+    element_id INTEGER NOT NULL REFERENCES elements(id) ON DELETE CASCADE,
+    keyword_id INTEGER NOT NULL REFERENCES keywords(id) ON DELETE CASCADE,
+    PRIMARY KEY (element_id, keyword_id)
+);
+CREATE INDEX idx_files_project_id ON files(project_id);
+CREATE INDEX idx_slides_file_id ON slides(file_id);
+CREATE INDEX idx_elements_slide_id ON elements(slide_id);
+CREATE INDEX idx_slide_keywords_keyword_id ON slide_keywords(keyword_id);
+CREATE INDEX idx_element_keywords_keyword_id ON element_keywords(keyword_id);
+CREATE INDEX idx_keywords_kind ON keywords(kind);
+CREATE VIRTUAL TABLE slides_fts USING fts5(
+    slide_id UNINDEXED,
+    title,
+    notes,
+    content='slides',
+    content_rowid='id'
+);
+CREATE TRIGGER slides_fts_insert AFTER INSERT ON slides BEGIN
+    INSERT INTO slides_fts(slide_id, title, notes) VALUES (new.id, '', '');
+END;
+CREATE TRIGGER slides_fts_delete AFTER DELETE ON slides BEGIN
+    DELETE FROM slides_fts WHERE slide_id = old.id;
+END;
+"""
+
+V3_DATA = """
+INSERT INTO projects (id, name, folder_path) VALUES (1, 'Old', '/data/old');
+INSERT INTO files (id, project_id, filename, rel_path, conversion_status)
+    VALUES (1, 1, 'deck.pptx', 'deck.pptx', 'Completed');
+INSERT INTO slides (id, file_id, slide_index, title) VALUES (1, 1, 1, 'Intro'), (2, 1, 2, 'Summary');
+INSERT INTO elements (id, slide_id, element_type, bbox_x, bbox_y, bbox_w, bbox_h)
+    VALUES (1, 2, 'SHAPE', 0, 0, 1, 1);
+INSERT INTO keywords (id, keyword, kind) VALUES (1, 'budget', 'topic'), (2, 'chart', 'name');
+INSERT INTO slide_keywords (slide_id, keyword_id) VALUES (1, 1);
+INSERT INTO element_keywords (element_id, keyword_id) VALUES (1, 2);
+"""
+
+# What keyword_projects should hold, derived from the link tables
+EXPECTED_KEYWORD_PROJECTS = """
+SELECT f.project_id, sk.keyword_id
+FROM slide_keywords sk
+JOIN slides s ON sk.slide_id = s.id
+JOIN files f ON s.file_id = f.id
+UNION
+SELECT f.project_id, ek.keyword_id
+FROM element_keywords ek
+JOIN elements e ON ek.element_id = e.id
+JOIN slides s ON e.slide_id = s.id
+JOIN files f ON s.file_id = f.id
+"""
+
+# What slide_origins should hold, derived from the base tables
+EXPECTED_SLIDE_ORIGINS = """
+SELECT s.id, p.folder_path, f.rel_path, s.slide_index
+FROM slides s
+JOIN files f ON s.file_id = f.id
+JOIN projects p ON f.project_id = p.id
+"""
+
+
+def assert_derived_tables_consistent(db_path: Path):
+    """keyword_projects and slide_origins match the rows they are derived from."""
+    conn = sqlite3.connect(db_path)
+    try:
+        assert set(conn.execute("SELECT project_id, keyword_id FROM keyword_projects")) == \
+            set(conn.execute(EXPECTED_KEYWORD_PROJECTS))
+        assert set(conn.execute(
+            "SELECT slide_id, folder_path, rel_path, slide_index FROM slide_origins"
+        )) == set(conn.execute(EXPECTED_SLIDE_ORIGINS))
+    finally:
+        conn.close()
+
+
+@pytest.fixture
+def db_path(tmp_path: Path) -> Path:
+    return tmp_path / "schema_test.db"
+
+
+@pytest.fixture
+def file_db(db_path: Path) -> Database:
+    """A connected Database on a temporary file, closed after the test."""
+    db = Database(db_path)
+    assert db.connect(), "Failed to connect to temporary database"
+    yield db
+    db.close()
+
+
+def test_migrate_v3_database(db_path: Path):
+    """A version 3 database migrates to the current schema with its data intact."""
+    conn = sqlite3.connect(db_path)
+    conn.executescript(V3_SCHEMA + V3_DATA + "PRAGMA user_version = 3;")
+    conn.close()
+
+    db = Database(db_path)
+    assert db.connect()
+    try:
+        conn = sqlite3.connect(db_path)
+        try:
+            assert conn.execute("PRAGMA user_version").fetchone()[0] == DB_SCHEMA_VERSION
+            file_columns = {row[1] for row in conn.execute("PRAGMA table_info(files)")}
+            assert "source_fingerprint" in file_columns
+            indexes = {row[0] for row in conn.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'index'"
+            )}
+            assert {"idx_slides_file_cover", "idx_files_project_filename",
+                    "idx_keywords_kind_nocase", "idx_slide_keywords_keyword_slide",
+                    "idx_element_keywords_keyword_element"} <= indexes
+            assert not {"idx_files_project_id", "idx_keywords_kind",
+                        "idx_slide_keywords_keyword_id",
+                        "idx_element_keywords_keyword_id"} & indexes
+        finally:
+            conn.close()
+
+        # The derived tables are backfilled from the existing rows
+        assert_derived_tables_consistent(db_path)
+        assert db.get_slide_origin(2) == (str(Path("/data/old") / "deck.pptx"), 2)
+        assert [k.keyword for k in db.search_keywords("udg")] == ["budget"]
+
+        # The old slides_fts is replaced, so deleting slides works again
+        db.delete_project(1)
+        assert_derived_tables_consistent(db_path)
+    finally:
+        db.close()
+
+
+def test_derived_tables_follow_inserts_deletes_and_merges(file_db: Database, db_path: Path,
+                                                          tmp_path: Path):
+    """slide_origins and keyword_projects stay in step with every kind of write."""
+    project_a = file_db.add_project("A", str(tmp_path / "a"))
+    project_b = file_db.add_project("B", str(tmp_path / "b"))
+    file_a = file_db.add_file(project_a, "a.pptx", "a.pptx", "c")
+    file_b = file_db.add_file(project_b, "b.pptx", "b.pptx", "c")
+    slide_a = file_db.add_slide(file_a, 1, "t", "i")
+    slide_a2 = file_db.add_slide(file_a, 2, "t", "i")
+    slide_b = file_db.add_slide(file_b, 1, "t", "i")
+    element_b = file_db.add_element(slide_b, "SHAPE", 0, 0, 1, 1)
+    shared = file_db.add_keyword_if_not_exists("shared", "topic")
+    only_a = file_db.add_keyword_if_not_exists("only a", "topic")
+    only_b = file_db.add_keyword_if_not_exists("only b", "topic")
+
+    # Inserts
+    file_db.link_slide_keyword(slide_a, shared)
+    file_db.link_slide_keyword(slide_a2, only_a)
+    file_db.link_element_keyword(element_b, shared)
+    file_db.link_element_keyword(element_b, only_b)
+    assert_derived_tables_consistent(db_path)
+
+    # Deletes
+    file_db.unlink_slide_keyword(slide_a2, only_a)
+    assert_derived_tables_consistent(db_path)
+    file_db.link_slide_keyword(slide_a2, only_a)
+    file_db._execute_write("DELETE FROM slides WHERE id = ?", (slide_a2,))
+    assert_derived_tables_consistent(db_path)
+
+    # Merges
+    file_db.merge_keywords(only_b, only_a)
+    assert_derived_tables_consistent(db_path)
+    file_db.merge_keywords(only_a, shared)
+    assert_derived_tables_consistent(db_path)
+
+    # Project deletes
+    file_db.delete_project(project_a)
+    assert_derived_tables_consistent(db_path)
+    assert file_db.get_slide_origin(slide_b) == (str(tmp_path / "b" / "b.pptx"), 1)
+    file_db.delete_project(project_b)
+    assert_derived_tables_consistent(db_path)
+    conn = sqlite3.connect(db_path)
+    try:
+        assert conn.execute("SELECT COUNT(*) FROM keyword_projects").fetchone()[0] == 0
+        assert conn.execute("SELECT COUNT(*) FROM slide_origins").fetchone()[0] == 0
+    finally:
+        conn.close()
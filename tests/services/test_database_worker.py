@@ -0,0 +1,58 @@
+# tests/services/test_database_worker.py
+
+from pathlib import Path
+
+import pytest
+
+from slideman.services.database import Database
+from slideman.services.database_worker import DatabaseWorker
+
+
+@pytest.fixture
+def file_db(tmp_path: Path) -> Database:
+    """A connected Database on a temporary file, closed after the test."""
+    db = Database(tmp_path / "worker_test.db")
+    assert db.connect(), "Failed to connect to temporary database"
+    yield db
+    db.close()
+
+
+@pytest.fixture
+def worker(file_db: Database) -> DatabaseWorker:
+    """A DatabaseWorker on the same database file, closed after the test."""
+    db_worker = DatabaseWorker(file_db.db_path)
+    yield db_worker
+    db_worker.close()
+
+
+def test_reconverting_shorter_deck_drops_stale_slides(file_db: Database, worker: DatabaseWorker,
+                                                      tmp_path: Path):
+    """Slides past the new end of a re-converted deck are removed."""
+    project_id = file_db.add_project("P", str(tmp_path / "p"))
+    file_id = file_db.add_file(project_id, "deck.pptx", "deck.pptx", "c")
+    for index in range(1, 6):
+        worker.add_slide_with_elements(file_id, index, f"t{index}", f"i{index}", [])
+
+    # The deck now has three slides
+    kept = [worker.add_slide_with_elements(file_id, index, f"t{index}", f"i{index}", [])
+            for index in range(1, 4)]
+    assert worker.delete_slides_after(file_id, 3, status="Completed") == 2
+
+    assert sorted(slide.id for slide in file_db.get_slides_for_file(file_id)) == sorted(kept)
+    files = file_db.get_files_for_project(project_id)
+    assert [f.conversion_status for f in files] == ["Completed"]
+
+
+def test_delete_slides_after_zero_clears_file(file_db: Database, worker: DatabaseWorker,
+                                              tmp_path: Path):
+    """An empty deck leaves no slides behind and keeps other files intact."""
+    project_id = file_db.add_project("P", str(tmp_path / "p"))
+    file_id = file_db.add_file(project_id, "a.pptx", "a.pptx", "c")
+    other_id = file_db.add_file(project_id, "b.pptx", "b.pptx", "c")
+    worker.add_slide_with_elements(file_id, 1, "t", "i", [])
+    worker.add_slide_with_elements(other_id, 1, "t", "i", [])
+
+    assert worker.delete_slides_after(file_id, 0) == 1
+
+    assert file_db.get_slides_for_file(file_id) == []
+    assert len(file_db.get_slides_for_file(other_id)) == 1
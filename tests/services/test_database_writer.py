@@ -0,0 +1,90 @@
+# tests/services/test_database_writer.py
+
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from slideman.services.database import Database
+
+
+@pytest.fixture
+def file_db(tmp_path: Path) -> Database:
+    """A connected Database on a temporary file, closed after the test."""
+    db = Database(tmp_path / "writer_test.db")
+    assert db.connect(), "Failed to connect to temporary database"
+    yield db
+    db.close()
+
+
+def test_bad_parameter_raises_and_writer_keeps_running(file_db: Database, tmp_path: Path):
+    """A parameter sqlite3 can't bind fails its own call, not the writer thread."""
+    project_id = file_db.add_project("Before", str(tmp_path / "before"))
+
+    with pytest.raises(OverflowError):
+        file_db.rename_project(2 ** 70, "x")
+
+    # Later writes still go through
+    assert file_db.rename_project(project_id, "After")
+    assert file_db.get_project(project_id).name == "After"
+    assert file_db.add_project("Later", str(tmp_path / "later")) is not None
+
+
+def test_bad_parameter_in_concurrent_batch_fails_only_its_job(file_db: Database, tmp_path: Path):
+    """Jobs grouped with a failing one still commit; none are left waiting."""
+    results = []
+    errors = []
+
+    def add(i: int):
+        try:
+            results.append(file_db.add_project(f"P{i}", str(tmp_path / f"p{i}")))
+        except Exception as e:
+            errors.append(e)
+
+    def overflow():
+        try:
+            file_db.rename_project(2 ** 70, "x")
+        except OverflowError as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=add, args=(i,)) for i in range(20)]
+    threads += [threading.Thread(target=overflow) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=10)
+
+    assert not any(thread.is_alive() for thread in threads), "A writer caller never returned"
+    assert len(results) == 20
+    assert len(errors) == 5 and all(isinstance(e, OverflowError) for e in errors)
+    assert len(file_db.get_all_projects()) == 20
+
+
+def test_write_waits_for_long_write_batch(file_db: Database, tmp_path: Path):
+    """A write from another thread waits for a batch outlasting busy_timeout."""
+    with file_db.get_connection() as conn:
+        busy_timeout_ms = conn.execute("PRAGMA busy_timeout").fetchone()[0]
+    batch_started = threading.Event()
+    errors = []
+
+    def long_batch():
+        try:
+            with file_db.write_batch():
+                file_db.add_project("Batch", str(tmp_path / "batch"))
+                batch_started.set()
+                time.sleep(busy_timeout_ms / 1000 + 1)
+        except Exception as e:
+            errors.append(e)
+            batch_started.set()
+
+    batch_thread = threading.Thread(target=long_batch)
+    batch_thread.start()
+    assert batch_started.wait(timeout=10)
+
+    project_id = file_db.add_project("Waiting", str(tmp_path / "waiting"))
+    batch_thread.join(timeout=60)
+
+    assert errors == []
+    assert file_db.get_project(project_id).name == "Waiting"
+    assert len(file_db.get_all_projects()) == 2
@@ -0,0 +1,92 @@
+# tests/services/test_file_copy_worker.py
+
+import os
+from pathlib import Path
+
+import pytest
+
+from slideman.services import file_io
+from slideman.services.background_tasks import FileCopyWorker, WorkerSignals
+
+
+@pytest.fixture
+def sources(tmp_path: Path):
+    """Two source files on the same volume as the project folder."""
+    source_dir = tmp_path / "sources"
+    source_dir.mkdir()
+    paths = []
+    for name, size in (("a.pptx", 1000), ("b.pptx", 3000)):
+        path = source_dir / name
+        path.write_bytes(b"x" * size)
+        paths.append(path)
+    return paths
+
+
+@pytest.fixture
+def space_checks(monkeypatch):
+    """Records the byte counts passed to check_disk_space, always reporting enough space."""
+    required = []
+
+    def check_disk_space(target_path, required_bytes):
+        required.append(required_bytes)
+        return True, 10 ** 12
+
+    monkeypatch.setattr(file_io, "check_disk_space", check_disk_space)
+    return required
+
+
+def run_worker(sources, project_folder: Path):
+    signals = WorkerSignals()
+    finished, errors = [], []
+    signals.finished.connect(finished.append)
+    signals.error.connect(errors.append)
+    FileCopyWorker(sources, project_folder, signals).run()
+    return finished, errors
+
+
+def test_same_volume_files_are_linked_and_not_counted(sources, space_checks, tmp_path: Path):
+    project_folder = tmp_path / "project"
+
+    finished, errors = run_worker(sources, project_folder)
+
+    assert errors == []
+    assert set(finished[0]) == {"a.pptx", "b.pptx"}
+    assert space_checks == [0]
+    assert os.stat(project_folder / "a.pptx").st_ino == os.stat(sources[0]).st_ino
+    assert sorted(p.name for p in project_folder.iterdir()) == ["a.pptx", "b.pptx"]
+
+
+def test_unavailable_hardlinks_count_every_file(sources, space_checks, monkeypatch, tmp_path: Path):
+    """When a test link fails, all files are copied and need space up front."""
+    def no_link(src, dst):
+        raise PermissionError("hardlinks not permitted")
+
+    monkeypatch.setattr(os, "link", no_link)
+    project_folder = tmp_path / "project"
+
+    finished, errors = run_worker(sources, project_folder)
+
+    assert errors == []
+    assert set(finished[0]) == {"a.pptx", "b.pptx"}
+    assert space_checks == [int(4000 * 1.1)]
+    assert (project_folder / "b.pptx").read_bytes() == sources[1].read_bytes()
+    assert os.stat(project_folder / "b.pptx").st_ino != os.stat(sources[1]).st_ino
+
+
+def test_failed_link_rechecks_space_before_copying(sources, monkeypatch, tmp_path: Path):
+    """A file whose own link fails after a good probe isn't copied into a full disk."""
+    real_link = os.link
+
+    def link_probe_only(src, dst):
+        if ".slideman_link_probe_" not in str(dst):
+            raise PermissionError("hardlinks not permitted")
+        real_link(src, dst)
+
+    monkeypatch.setattr(os, "link", link_probe_only)
+    monkeypatch.setattr(file_io, "check_disk_space",
+                        lambda target_path, required_bytes: (required_bytes == 0, 0))
+
+    finished, errors = run_worker(sources, tmp_path / "project")
+
+    assert finished == []
+    assert "Insufficient disk space" in errors[0]